@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+##
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+"""
+Times parsing of the `$Nodes` and `$Elements` sections of an ASCII Gmsh
+file by `fipy.meshes.gmshMesh.MSHFile` against the line-by-line parsing it
+replaced, and reports the peak resident memory of each. The time to
+`read()` the whole mesh, including building its faces, is also reported.
+Each parse runs in a forked child, so that the memory of one does not mask
+the other.
+
+    $ python examples/benchmarking/gmshParse.py --numberOfElements=1000000
+"""
+
+import os
+import tempfile
+import time
+import traceback
+
+from fipy.meshes.gmshMesh import MSHFile
+from fipy.tools import numerix
+from fipy.tools.parser import parse
+
+numberOfElements = parse('--numberOfElements', action='store',
+                         type='int', default=250000)
+N = int(numerix.sqrt(numberOfElements / 2))
+
+def writeMSH(path, N):
+    """Write an `N` x `N` square of triangles, bounded by lines"""
+    f = open(path, "w")
+    f.write("$MeshFormat\n2.2 0 8\n$EndMeshFormat\n")
+
+    x, y = numerix.mgrid[0:N + 1, 0:N + 1]
+    x = x.ravel() / float(N)
+    y = y.ravel() / float(N)
+    nodeIDs = numerix.arange(len(x)) + 1
+    f.write("$Nodes\n%d\n" % len(x))
+    numerix.savetxt(f, numerix.array((nodeIDs, x, y, 0 * x)).swapaxes(0, 1),
+                    fmt="%d %.17g %.17g %g")
+    f.write("$EndNodes\n")
+
+    corner = (numerix.arange(N)[..., numerix.newaxis] * (N + 1)
+              + numerix.arange(N)[numerix.newaxis, ...]).ravel() + 1
+    triangles = numerix.concatenate(((corner, corner + 1, corner + N + 2),
+                                     (corner, corner + N + 2, corner + N + 1)), axis=1)
+    bottom = numerix.arange(N) * (N + 1) + 1
+    lines = numerix.array((bottom, bottom + N + 1))
+
+    f.write("$Elements\n%d\n" % (lines.shape[1] + triangles.shape[1]))
+    lineIDs = numerix.arange(lines.shape[1]) + 1
+    numerix.savetxt(f, numerix.concatenate(((lineIDs, 1 + 0 * lineIDs, 2 + 0 * lineIDs,
+                                             1 + 0 * lineIDs, 1 + 0 * lineIDs), lines)).swapaxes(0, 1),
+                    fmt="%d")
+    triangleIDs = numerix.arange(triangles.shape[1]) + lineIDs[-1] + 1
+    numerix.savetxt(f, numerix.concatenate(((triangleIDs, 2 + 0 * triangleIDs, 2 + 0 * triangleIDs,
+                                             2 + 0 * triangleIDs, 2 + 0 * triangleIDs), triangles)).swapaxes(0, 1),
+                    fmt="%d")
+    f.write("$EndElements\n")
+    f.close()
+
+    return triangles.shape[1]
+
+def lineByLine(path):
+    """Parse the way `MSHFile` used to: a `split()` and `int()` per value"""
+    f = open(path, "r")
+    line = f.readline()
+    while "$Nodes" not in line:
+        line = f.readline()
+    f.readline()
+    coords = {}
+    line = f.readline()
+    while "$EndNodes" not in line:
+        values = line.split()
+        coords[int(values[0])] = [float(v) for v in values[1:]]
+        line = f.readline()
+
+    line = f.readline()
+    while "$Elements" not in line:
+        line = f.readline()
+    f.readline()
+    cells = []
+    line = f.readline()
+    while "$EndElements" not in line:
+        values = [int(v) for v in line.split()]
+        numTags = values[2]
+        if values[1] == 2:
+            cells.append([coords[n] for n in values[3 + numTags:]])
+        line = f.readline()
+    f.close()
+
+    return len(cells)
+
+def vectorized(path):
+    f = MSHFile(path, dimensions=2, mode='r')
+    # normally set up by `MSHFile.read()`
+    f.coordDimensions = 2
+    f.numVertsPerFace = {1: 2}
+    f.numFacesPerCell = {2: 3}
+    cellsData, ghostsData, facesData = f._parseElementFile()
+    vertexCoords, vertexMap = f._vertexCoordsAndMap(cellsData.nodes)
+    f.close()
+
+    return len(cellsData.idmap)
+
+def read(path):
+    """Parse and then build the faces and cells, as `Gmsh2D` does"""
+    f = MSHFile(path, dimensions=2, mode='r')
+    vertexCoords, facesToV, cellsToF = f.read()[:3]
+    f.close()
+
+    return cellsToF.shape[-1]
+
+def inChild(fn, *args):
+    """Return the time taken by `fn` and the peak resident memory in bytes
+    of a child process that runs it, or `None` if `fn` failed"""
+    t0 = time.time()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            fn(*args)
+        except:
+            traceback.print_exc()
+            os._exit(1)
+        os._exit(0)
+    pid, status, usage = os.wait4(pid, 0)
+    elapsed = time.time() - t0
+
+    if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+        return None
+
+    # ru_maxrss is in kilobytes on Linux and bytes on Mac OS X
+    scale = 1 if os.uname()[0] == "Darwin" else 1024
+    return elapsed, usage.ru_maxrss * scale
+
+fd, path = tempfile.mkstemp(suffix=".msh")
+os.close(fd)
+try:
+    numberOfCells = writeMSH(path, N)
+
+    print "cells: %d, file: %d B" % (numberOfCells, os.path.getsize(path))
+    print
+
+    print "parser\ttime / s\tpeak memory / B"
+    for fn in (lineByLine, vectorized, read):
+        result = inChild(fn, path)
+        if result is None:
+            print "%s\tfailed" % fn.__name__
+        else:
+            print "%s\t%g\t%g" % ((fn.__name__,) + result)
+finally:
+    os.remove(path)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+##
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+"""
+Times `fipy.tools.vector.putAdd`, which dominates the explicit assembly of
+convection terms when inlining is not available, against the
+element-by-element loop it replaced, and then times the explicit
+assembly of `ExplicitUpwindConvectionTerm` and `VanLeerConvectionTerm`.
+
+    $ python examples/benchmarking/putAdd.py --numberOfElements=1000000
+"""
+
+import time
+
+from fipy import CellVariable, Grid2D, TransientTerm, DummySolver
+from fipy import ExplicitUpwindConvectionTerm, VanLeerConvectionTerm
+from fipy.tools import numerix, vector
+from fipy.tools.parser import parse
+
+numberOfElements = parse('--numberOfElements', action='store',
+                         type='int', default=250000)
+N = int(numerix.sqrt(numberOfElements))
+
+repeats = parse('--numberOfRepeats', action='store',
+                type='int', default=3)
+
+def loopPutAdd(vector, ids, additionVector):
+    for id, value in zip(ids.flat, additionVector.flat):
+        vector.flat[id] += value
+
+def best(fn, *args):
+    times = []
+    for i in range(repeats):
+        t0 = time.time()
+        fn(*args)
+        times.append(time.time() - t0)
+    return min(times)
+
+mesh = Grid2D(nx=N, ny=N)
+
+id1, id2 = mesh._adjacentCellIDs
+values = numerix.random.random(len(id1))
+b = numerix.zeros((mesh.numberOfCells,), 'd')
+
+print "cells: %d, faces: %d" % (mesh.numberOfCells, mesh.numberOfFaces)
+print
+
+loop = best(loopPutAdd, b, id1, values)
+vectorized = best(vector._putAdd, b, id1, values)
+
+print "putAdd\tloop / s\tvectorized / s\tspeedup"
+print "\t%g\t%g\t%g" % (loop, vectorized, loop / vectorized)
+print
+
+print "term\texplicit assembly / s"
+
+for Term in (ExplicitUpwindConvectionTerm, VanLeerConvectionTerm):
+    var = CellVariable(mesh=mesh, value=numerix.random.random(mesh.numberOfCells))
+    eq = TransientTerm() + Term(coeff=(1., 0.5))
+
+    print "%s\t%g" % (Term.__name__,
+                      best(eq.solve, var, DummySolver(), (), 1e-3))
@@ -40,33 +40,32 @@ def _getVersion():
 
     return version
 
-__version__ = _getVersion()
-
-from fipy.boundaryConditions import *
-from fipy.meshes import *
-from fipy.solvers import *
-from fipy.steppers import *
-from fipy.terms import *
-from fipy.tools import *
-from fipy.variables import *
-from fipy.viewers import *
-
-__all__ = []
-__all__.extend(boundaryConditions.__all__)
-__all__.extend(meshes.__all__)
-__all__.extend(solvers.__all__)
-__all__.extend(steppers.__all__)
-__all__.extend(terms.__all__)
-__all__.extend(tools.__all__)
-__all__.extend(variables.__all__)
-__all__.extend(viewers.__all__)
-
-# fipy needs to export raw_input whether or not parallel
-
 import sys
+import types
+
+# Subpackages whose public names make up the `fipy` namespace, listed
+# from cheapest to most expensive to import: they are only imported when
+# one of their names is first looked up, so that ``import fipy`` neither
+# probes for solver packages nor loads any viewer.
+_subpackages = ('tools', 'meshes', 'variables', 'terms',
+                'boundaryConditions', 'steppers', 'viewers', 'solvers')
+
 if sys.version_info >= (3, 0):
-    input = input
-    input_original = input
+    import builtins as _builtins
+    _inputName = 'input'
+else:
+    import __builtin__ as _builtins
+    _inputName = 'raw_input'
+
+_inputNames = (_inputName, _inputName + '_original')
+
+def _inputs():
+    """fipy needs to export raw_input whether or not parallel
+    """
+    from fipy.tools import parallelComm
+
+    original = getattr(_builtins, _inputName)
+    inputs = {_inputName: original, _inputName + '_original': original}
 
     if parallelComm.Nproc > 1:
         def mpi_input(prompt=""):
@@ -78,26 +77,44 @@ if sys.version_info >= (3, 0):
                 return sys.stdin.readline()
             else:
                 return ""
-        input = mpi_input
+        inputs[_inputName] = mpi_input
 
-    __all__.extend(['input', 'input_original'])
-else:
-    raw_input = raw_input
-    raw_input_original = raw_input
+    return inputs
 
-    if parallelComm.Nproc > 1:
-        def mpi_raw_input(prompt=""):
-            parallelComm.Barrier()
-            sys.stdout.flush()
-            if parallelComm.procID == 0:
-                sys.stdout.write(prompt)
-                sys.stdout.flush()
-                return sys.stdin.readline()
+class _LazyModule(types.ModuleType):
+    """
+    The `fipy` package, importing its subpackages on first use.
+    """
+    def __getattr__(self, name):
+        if name.startswith('__') and name not in ('__version__', '__all__'):
+            raise AttributeError(name)
+
+        if name == '__version__':
+            value = _getVersion()
+        elif name == '__all__':
+            value = []
+            for subpackage in _subpackages:
+                value.extend(self._import(subpackage).__all__)
+            value.extend(_inputNames)
+        elif name in _inputNames:
+            self.__dict__.update(_inputs())
+            return self.__dict__[name]
+        elif name in _subpackages:
+            value = self._import(name)
+        else:
+            for subpackage in _subpackages:
+                module = self._import(subpackage)
+                if name in module.__all__:
+                    value = getattr(module, name)
+                    break
             else:
-                return ""
-        raw_input = mpi_raw_input
+                raise AttributeError("'module' object has no attribute '%s'" % name)
 
-    __all__.extend(['raw_input', 'raw_input_original'])
+        setattr(self, name, value)
+        return value
+
+    def _import(self, subpackage):
+        return __import__('fipy.' + subpackage, fromlist=['__all__'])
 
 _saved_stdout = sys.stdout
 
@@ -166,3 +183,10 @@ def test(*args):
         import shutil
         shutil.rmtree(tmpDir)
         raise exitErr
+
+# Python 2 empties the namespace of a module when it is garbage
+# collected, so the replacement holds on to the original module
+_module = _LazyModule(__name__, __doc__)
+_module.__dict__.update(globals())
+_module._original = sys.modules[__name__]
+sys.modules[__name__] = _module
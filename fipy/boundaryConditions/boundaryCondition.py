@@ -35,6 +35,7 @@
 __docformat__ = 'restructuredtext'
 
 from fipy.tools import numerix
+from fipy.tools import vector
 from fipy.variables.variable import Variable
 from fipy.tools.dimensions.physicalField import PhysicalField
 
@@ -85,6 +86,16 @@ class BoundaryCondition(object):
         """
         raise NotImplementedError
 
+    def _getBatchContribution(self, coeff):
+        """Return this boundary condition's contribution for a
+        `_BoundaryConditionBatch`.
+
+        A `tuple` of (`diagonal`, `b`) is added to the diagonal of **L** and
+        to **b** at `adjacentCellIDs`; either may be `None`. Return `None`
+        instead if the condition can only be applied by `_buildMatrix()`.
+        """
+        return None
+
     def _getDerivative(self, order):
         """Return a tuple of the boundary conditions to apply
         to the term and to the derivative of the term
@@ -119,6 +130,96 @@ class BoundaryCondition(object):
         """
         pass
 
+class _BoundaryConditionBatch(object):
+    """
+    Applies several boundary conditions to a `Term` at once.
+
+    Rather than building a `SparseMatrix` for each condition and adding them
+    to the `Term` one at a time, the contributions of all the conditions are
+    concatenated and added with a single `addAt()`.
+
+        >>> from fipy import *
+        >>> from fipy.boundaryConditions.boundaryCondition import _BoundaryConditionBatch
+        >>> m = Grid2D(nx=3, ny=2)
+        >>> bcs = (FixedValue(faces=m.facesLeft, value=2.),
+        ...        FixedValue(faces=m.facesTop, value=m.x.arithmeticFaceValue),
+        ...        FixedFlux(faces=m.facesRight, value=3.),
+        ...        NthOrderBoundaryCondition(faces=m.facesBottom, value=0., order=2))
+        >>> c = FaceVariable(mesh=m, value=m._faceAreas * 2.)
+        >>> coeff = {'cell 1 diag': c, 'cell 1 offdiag': -c}
+        >>> SparseMatrix = DefaultSolver()._matrixClass
+        >>> L = SparseMatrix(mesh=m)
+        >>> b = numerix.zeros(m.numberOfCells, 'd')
+        >>> for bc in bcs:
+        ...     LL, bb = bc._buildMatrix(SparseMatrix, m.numberOfCells, 4, coeff)
+        ...     L += LL
+        ...     b += bb
+        >>> batch = _BoundaryConditionBatch(bcs)
+        >>> for bc in bcs:
+        ...     bc._resetBoundaryConditionApplied()
+        >>> LL, bb = batch._buildMatrix(SparseMatrix, m.numberOfCells, 4, coeff)
+        >>> print numerix.allclose(LL.numpyArray, L.numpyArray)
+        True
+        >>> print numerix.allclose(bb, b)
+        True
+
+    A `FixedFlux` is still only applied once per sweep
+
+        >>> LL, bb = batch._buildMatrix(SparseMatrix, m.numberOfCells, 4, coeff)
+        >>> print bb
+        [ 4.  0.  0.  5.  3.  5.]
+
+    The concatenated cell IDs are computed once for a given batch
+
+        >>> batch._diagonalIDs.keys()
+        [(0, 1)]
+    """
+    def __init__(self, boundaryConditions):
+        self.boundaryConditions = tuple(boundaryConditions)
+        self._diagonalIDs = {}
+
+    def _buildMatrix(self, SparseMatrix, Ncells, MaxFaces, coeff):
+        diagonals = []
+        bIDs = []
+        bValues = []
+        others = []
+        bb = numerix.zeros((Ncells,),'d')
+
+        for i, bc in enumerate(self.boundaryConditions):
+            contribution = bc._getBatchContribution(coeff)
+            if contribution is None:
+                LL, bbOther = bc._buildMatrix(SparseMatrix, Ncells, MaxFaces, coeff)
+                if LL != 0:
+                    others.append(LL)
+                bb += bbOther
+            else:
+                diagonal, b = contribution
+                if diagonal is not None:
+                    diagonals.append((i, numerix.array(diagonal)))
+                if b is not None:
+                    bIDs.append(bc.adjacentCellIDs)
+                    bValues.append(numerix.array(b) * numerix.ones(len(bc.adjacentCellIDs)))
+
+        if len(bIDs) > 0:
+            vector.putAdd(bb, numerix.concatenate(bIDs), numerix.concatenate(bValues))
+
+        if len(diagonals) == 0 and len(others) == 0:
+            return (0, bb)
+
+        key = tuple([i for i, diagonal in diagonals])
+        if key not in self._diagonalIDs:
+            self._diagonalIDs[key] = numerix.concatenate([self.boundaryConditions[i].adjacentCellIDs for i in key]
+                                                         + [numerix.zeros((0,), 'l')])
+        ids = self._diagonalIDs[key]
+
+        LL = SparseMatrix(mesh=self.boundaryConditions[0].faces.mesh, sizeHint=len(ids), bandwidth=1)
+        if len(ids) > 0:
+            LL.addAt(numerix.concatenate([diagonal for i, diagonal in diagonals]), ids, ids)
+        for other in others:
+            LL += other
+
+        return (LL, bb)
+
 class __BoundaryCondition(BoundaryCondition):
     """
     Dummy subclass for tests
@@ -78,12 +78,20 @@ class FixedFlux(BoundaryCondition):
 
         bb = numerix.zeros((Ncells,),'d')
 
-        if not self.boundaryConditionApplied:
-            vector.putAdd(bb, self.adjacentCellIDs, -self.contribution)
-            self.boundaryConditionApplied = True
+        diagonal, b = self._getBatchContribution(coeff)
+        if b is not None:
+            vector.putAdd(bb, self.adjacentCellIDs, b)
 
         return (0, bb)
 
+    def _getBatchContribution(self, coeff):
+        if self.boundaryConditionApplied:
+            return (None, None)
+
+        self.boundaryConditionApplied = True
+
+        return (None, -self.contribution)
+
     def _getDerivative(self, order):
         if order == 1:
             return FixedValue(self.faces, self.value)
@@ -76,10 +76,18 @@ class FixedValue(BoundaryCondition):
           - `coeff`:        contribution to adjacent cell diagonal and
             :math:`\mathsf{b}`-vector by this exterior face
         """
-        faces = self.faces.value
+        diagonal, b = self._getBatchContribution(coeff)
 
         LL = SparseMatrix(mesh=self.faces.mesh, sizeHint=len(self.faces), bandwidth=1)
-        LL.addAt(coeff['cell 1 diag'][faces], self.adjacentCellIDs, self.adjacentCellIDs)
+        LL.addAt(diagonal, self.adjacentCellIDs, self.adjacentCellIDs)
+
+        bb = numerix.zeros((Ncells,),'d')
+        vector.putAdd(bb, self.adjacentCellIDs, b)
+
+        return (LL, bb)
+
+    def _getBatchContribution(self, coeff):
+        faces = self.faces.value
 
         ## The following has been commented out because
         ## FixedValue's _buildMatrix() method is called for
@@ -89,14 +97,10 @@ class FixedValue(BoundaryCondition):
         ##     self.minusCoeff = -coeff['cell 1 offdiag']
         ##     self.minusCoeff.dontCacheMe()
 
-        bb = numerix.zeros((Ncells,),'d')
-
         value = self.value
         if isinstance(value, Variable):
             value = value.value
         if value.shape == faces.shape:
             value = value[faces]
 
-        vector.putAdd(bb, self.adjacentCellIDs, -coeff['cell 1 offdiag'].value[faces] * value)
-
-        return (LL, bb)
+        return (coeff['cell 1 diag'][faces], -coeff['cell 1 offdiag'].value[faces] * value)
@@ -81,6 +81,9 @@ class NthOrderBoundaryCondition(BoundaryCondition):
         """
         return (0, 0)
 
+    def _getBatchContribution(self, coeff):
+        return (None, None)
+
     def _getDerivative(self, order):
         newOrder = self.order - order
         if newOrder not in self.derivative:
@@ -180,6 +180,10 @@ class _PysparseMatrix(_SparseMatrix):
     def _shape(self):
         return self.matrix.shape
 
+    @property
+    def _numberOfEntries(self):
+        return self.matrix.nnz
+
     @property
     def _range(self):
         return range(self._shape[1]), range(self._shape[0])
@@ -42,6 +42,46 @@ from fipy.tools import numerix
 
 from fipy.matrices.sparseMatrix import _SparseMatrix
 
+class _CSRPattern(object):
+    """Symbolic CSR structure of a set of COO `(id1, id2)` entries.
+
+    The `scatter` permutation maps each COO entry to its slot in the
+    (sorted, duplicate-free) CSR `data` array, so that a matrix with the
+    same sparsity pattern can be assembled by a single vectorized
+    accumulation instead of a fresh sort and merge.
+
+        >>> pattern = _CSRPattern(shape=(3, 3),
+        ...                       id1=numerix.array((1, 0, 1, 2, 0)),
+        ...                       id2=numerix.array((2, 0, 2, 1, 1)))
+        >>> print pattern.indptr
+        [0 2 3 4]
+        >>> print pattern.indices
+        [0 1 2 1]
+        >>> print pattern.scatter
+        [2 0 2 3 1]
+        >>> print pattern.csr_matrix((1., 2., 3., 4., 5.)).toarray()
+        [[ 2.  5.  0.]
+         [ 0.  0.  4.]
+         [ 0.  4.  0.]]
+    """
+
+    def __init__(self, shape, id1, id2):
+        self.shape = shape
+
+        keys = id1.astype('int64') * shape[1] + id2
+        keys, self.scatter = numerix.unique(keys, return_inverse=True)
+
+        self.indices = (keys % shape[1]).astype('int32')
+        self.indptr = numerix.zeros((shape[0] + 1,), 'int32')
+        numerix.cumsum(numerix.bincount(keys // shape[1], minlength=shape[0]),
+                       out=self.indptr[1:])
+
+    def csr_matrix(self, vector):
+        data = numerix.bincount(self.scatter, weights=vector,
+                                minlength=len(self.indices))
+        return sp.csr_matrix((data, self.indices, self.indptr),
+                             shape=self.shape, copy=False)
+
 class _ScipyMatrix(_SparseMatrix):
 
     """class wrapper for a scipy sparse matrix.
@@ -49,6 +89,13 @@ class _ScipyMatrix(_SparseMatrix):
     `_ScipyMatrix` is always NxN.
     Allows basic python operations __add__, __sub__ etc.
     Facilitate matrix populating in an easy way.
+
+    Contributions from `addAt()` (and from in-place addition of other
+    `_ScipyMatrix` objects) are collected in a COO buffer and only merged
+    into the wrapped `spmatrix` when `matrix` is next accessed. A `Term`
+    that assembles the same stencil again (e.g., on the next sweep) keeps
+    the sparsity pattern of the merge in its assembly plan, so that it
+    does not need to sort again.
     """
 
     def __init__(self, matrix):
@@ -59,6 +106,104 @@ class _ScipyMatrix(_SparseMatrix):
         """
         self.matrix = matrix
 
+    def _getMatrix(self):
+        if self._coo:
+            self._matrix = self._assemble()
+            self._coo = []
+        return self._matrix
+
+    def _setMatrix(self, matrix):
+        self._matrix = matrix
+        self._coo = []
+
+    def _delMatrix(self):
+        del self._matrix
+        self._coo = []
+
+    matrix = property(_getMatrix, _setMatrix, _delMatrix)
+
+    def _getPattern(self, id1, id2):
+        return _CSRPattern(shape=self._matrix.shape, id1=id1, id2=id2)
+
+    def _assemble(self, pattern=None):
+        """Merge the COO buffer into the wrapped `spmatrix`
+        """
+        vectors, id1s, id2s = zip(*self._coo)
+
+        if pattern is None:
+            pattern = self._getPattern(numerix.concatenate(id1s),
+                                       numerix.concatenate(id2s))
+
+        vector = numerix.concatenate(vectors)
+
+        matrix = pattern.csr_matrix(vector)
+        if self._matrix.nnz > 0:
+            matrix = matrix + self._matrix
+
+        return matrix
+
+    @staticmethod
+    def _matchesSignature(old, new):
+        oldShape, oldId1s, oldId2s = old
+        newShape, newId1s, newId2s = new
+        if oldShape != newShape or len(oldId1s) != len(newId1s):
+            return False
+        for a, b in zip(oldId1s + oldId2s, newId1s + newId2s):
+            if a is not b and not numerix.array_equal(a, b):
+                return False
+        return True
+
+    def _applyAssemblyPlan(self, plan=None):
+        """Merge the COO buffer, reusing the sparsity pattern of `plan`.
+
+        An assembly plan records the ids of the buffered contributions
+        and the `_CSRPattern` they produced. If every buffered id array is
+        either the same object as, or equal to, the one in `plan`, the
+        cached pattern is reused and only the values are gathered;
+        otherwise a new plan is returned.
+
+            >>> L = _ScipyMatrixFromShape(size=3)
+            >>> L.addAt((1., 2.), (0, 1), (0, 2))
+            >>> L.addAt((3.,), (0,), (0,))
+            >>> plan = L._applyAssemblyPlan()
+            >>> print L
+             4.000000      ---        ---    
+                ---        ---     2.000000  
+                ---        ---        ---    
+            >>> L = _ScipyMatrixFromShape(size=3)
+            >>> L.addAt((5., 6.), (0, 1), (0, 2))
+            >>> L.addAt((7.,), (0,), (0,))
+            >>> L._applyAssemblyPlan(plan) is plan
+            True
+            >>> print L
+            12.000000      ---        ---    
+                ---        ---     6.000000  
+                ---        ---        ---    
+
+        Contributions of the same size at different positions do not
+        reuse the plan
+
+            >>> L = _ScipyMatrixFromShape(size=3)
+            >>> L.addAt((5., 6.), (0, 2), (0, 2))
+            >>> L.addAt((7.,), (0,), (0,))
+            >>> L._applyAssemblyPlan(plan) is plan
+            False
+            >>> print L
+            12.000000      ---        ---    
+                ---        ---        ---    
+                ---        ---     6.000000  
+        """
+        if self._coo:
+            vectors, id1s, id2s = zip(*self._coo)
+            signature = (self._matrix.shape, id1s, id2s)
+            if plan is None or not self._matchesSignature(plan[0], signature):
+                plan = (signature, self._getPattern(numerix.concatenate(id1s),
+                                                    numerix.concatenate(id2s)))
+
+            self.matrix = self._assemble(pattern=plan[1])
+
+        return plan
+
     def getCoupledClass(self):
         return _CoupledScipyMeshMatrix
 
@@ -76,7 +221,11 @@ class _ScipyMatrix(_SparseMatrix):
         return self._iadd(other)
 
     def _iadd(self, other, sign=1):
-        if hasattr(other, "matrix"):
+        if isinstance(other, _ScipyMatrix):
+            self._coo.extend([(sign * coo[0],) + coo[1:] for coo in other._coo])
+            if other._matrix.nnz > 0:
+                self._matrix = self._matrix + (sign * other._matrix)
+        elif hasattr(other, "matrix"):
             self.matrix = self.matrix + (sign * other.matrix)
         elif type(other) in [float, int]:
             fillVec = numerix.repeat(other, self.matrix.nnz)
@@ -188,6 +337,11 @@ class _ScipyMatrix(_SparseMatrix):
     def _shape(self):
         return self.matrix.shape
 
+    @property
+    def _numberOfEntries(self):
+        # counts, but does not merge, entries still waiting in the COO buffer
+        return self._matrix.nnz + sum([len(vector) for vector, id1, id2 in self._coo])
+
     @property
     def _range(self):
         return range(self._shape[1]), range(self._shape[0])
@@ -252,9 +406,9 @@ class _ScipyMatrix(_SparseMatrix):
         """
         assert(len(id1) == len(id2) == len(vector))
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        self._coo.append((numerix.asarray(vector, 'd').ravel(),
+                          numerix.asarray(id1).ravel(),
+                          numerix.asarray(id2).ravel()))
 
     def addAtDiagonal(self, vector):
         if type(vector) in [type(1), type(1.)]:
@@ -153,6 +153,21 @@ class _SparseMatrix(object):
     def exportMmf(self, filename):
         pass
 
+    def _applyAssemblyPlan(self, plan=None):
+        """Finish assembly, reusing the structure recorded in `plan`.
+
+        Returns the plan to pass on the next assembly of the same
+        `Term`, or `None` if this matrix type does not support reuse.
+        """
+        return None
+
+    @property
+    def _numberOfEntries(self):
+        """Number of entries stored in the matrix, or `None` if this
+        matrix type cannot tell.
+        """
+        return None
+
 ##     def __array__(self):
 ##      shape = self._shape
 ##      indices = numerix.indices(shape)
@@ -306,6 +306,10 @@ class _TrilinosMatrix(_SparseMatrix):
         N = self.matrix.NumGlobalRows()
         return (N,N)
 
+    @property
+    def _numberOfEntries(self):
+        return self.matrix.NumMyNonzeros()
+
 
 
     def put(self, vector, id1, id2):
@@ -39,6 +39,7 @@ __all__ = ["AbstractMesh"]
 
 from fipy.tools import serialComm
 from fipy.tools import numerix
+from fipy.tools import profiling
 from fipy.tools.decorators import deprecate
 from fipy.tools.numerix import MA
 from fipy.tools.dimensions.physicalField import PhysicalField
@@ -49,6 +50,37 @@ from fipy.meshes.topologies.abstractTopology import _AbstractTopology
 class MeshAdditionError(Exception):
     pass
 
+def _cachedMeshProperty(fget):
+    """Like `property`, but the value is computed only once per mesh
+
+    The value is kept until `AbstractMesh._invalidateGeometryCache()` is
+    called by an operation that changes the geometry or topology. Arrays
+    are made read-only, so that callers cannot corrupt the cached copy.
+    """
+    name = fget.__name__
+
+    def get(self):
+        cache = self.__dict__.setdefault('_geometryCache', {})
+        counts = self.__dict__.setdefault('_geometryCacheStats', {})
+        hits, computations = counts.get(name, (0, 0))
+        if name in cache:
+            counts[name] = (hits + 1, computations)
+        else:
+            with profiling._phase("mesh", self.__class__.__name__, outermost=True):
+                cache[name] = _readOnly(fget(self))
+            counts[name] = (hits, computations + 1)
+        return cache[name]
+
+    return property(get, doc=fget.__doc__)
+
+def _readOnly(value):
+    if isinstance(value, tuple):
+        for v in value:
+            _readOnly(v)
+    elif isinstance(value, numerix.ndarray):
+        value.flags.writeable = False
+    return value
+
 class AbstractMesh(object):
     """
     A class encapsulating all commonalities among meshes in FiPy.
@@ -76,9 +108,55 @@ class AbstractMesh(object):
           - `scaleLength`: The desired scale length.
         """
         self._scale['length'] = scaleLength
+        self._invalidateGeometryCache()
 
     scale = property(lambda s: s._scale, _setScale)
 
+    """
+    Cache business
+    """
+    def _invalidateGeometryCache(self):
+        """
+        Discard the values of all `_cachedMeshProperty` attributes.
+
+        Only operations that change the mesh in place need to call this.
+        `_translate()` and `__mul__()` build new meshes.
+        """
+        self.__dict__.pop('_geometryCache', None)
+
+    @property
+    def _geometryCacheCounts(self):
+        """
+        The number of times each cached property was served from the cache
+        and the number of times it was computed.
+
+            >>> from fipy import *
+            >>> m = Grid2D(nx=3, ny=2)
+            >>> ids = m.interiorFaceIDs
+            >>> print m.interiorFaceIDs is ids
+            True
+            >>> print m._geometryCacheCounts['interiorFaceIDs']
+            (1, 1)
+            >>> print m._geometryCacheCounts['_interiorFaces']
+            (0, 1)
+
+        Changing the mesh in place discards the cached values
+
+            >>> m._invalidateGeometryCache()
+            >>> print m.interiorFaceIDs is ids
+            False
+            >>> print m._geometryCacheCounts['interiorFaceIDs']
+            (1, 2)
+
+        Cached arrays cannot be modified in place
+
+            >>> ids[0] = 1
+            Traceback (most recent call last):
+            ...
+            ValueError: assignment destination is read-only
+        """
+        return self.__dict__.setdefault('_geometryCacheStats', {})
+
     def _calcScaleArea(self):
         raise NotImplementedError
 
@@ -92,6 +170,32 @@ class AbstractMesh(object):
     def getNearestCell(self, point):
         return self._getCellsByID([self._getNearestCellID(point)])[0]
 
+    def probe(self, points, order=1):
+        """Return an object that samples `CellVariable` objects at `points`
+
+        Unlike `CellVariable.__call__`, which uses the cell with the nearest
+        center, the probe finds the cell that actually contains each point.
+        The cells and interpolation weights are computed once, so the probe
+        can be used to sample at every time step.
+
+        In parallel, each process only searches its own cells. Points whose
+        nearest cell belongs to another process are flagged as not `local`
+        in the probe and sample as NaN on this process.
+
+        :Parameters:
+          - `points`: A (D, M) sequence of coordinates.
+          - `order`: 0 for the value of the containing cell, 1 for a linear
+            reconstruction from it and its neighbors.
+
+            >>> from fipy import *
+            >>> m = Grid1D(nx=4)
+            >>> probe = m.probe(((0.5, 1.75, 3.2),))
+            >>> print probe(CellVariable(mesh=m, value=m.x**2))
+            [  0.25   3.    10.45]
+        """
+        from fipy.meshes.probe import _Probe
+        return _Probe(mesh=self, points=points, order=order)
+
     def _getCellFaceIDsInternal(self):
         return self._cellFaceIDs
 
@@ -290,6 +394,8 @@ class AbstractMesh(object):
             ## add those faces back to the main self.cellFaceIDs
             numerix.put(self.cellFaceIDs[i], faceCellIDs, cellFaceIDs[i])
 
+        self._invalidateGeometryCache()
+
         ## calculate new topology
         self._setTopology()
 
@@ -511,20 +617,15 @@ class AbstractMesh(object):
     Topology -- maybe should be elsewhere?
     """
 
-    @property
+    @_cachedMeshProperty
     def interiorFaceIDs(self):
-        if not hasattr(self, '_interiorFaceIDs'):
-            self._interiorFaceIDs = numerix.nonzero(self.interiorFaces)[0]
-        return self._interiorFaceIDs
+        return numerix.nonzero(self.interiorFaces)[0]
 
-    @property
+    @_cachedMeshProperty
     def interiorFaceCellIDs(self):
-        if not hasattr(self, '_interiorFaceCellIDs'):
-            ## Commented line is better, but doesn't work for zero length arrays
-            ##  self.interiorFaceCellIDs = self.getFaceCellIDs()[..., self.getInteriorFaceIDs()]
-            self._interiorFaceCellIDs = numerix.take(self.faceCellIDs,
-                                                     self.interiorFaceIDs, axis=1)
-        return self._interiorFaceCellIDs
+        ## Commented line is better, but doesn't work for zero length arrays
+        ##  self.interiorFaceCellIDs = self.getFaceCellIDs()[..., self.getInteriorFaceIDs()]
+        return numerix.take(self.faceCellIDs, self.interiorFaceIDs, axis=1)
 
     @property
     def _numberOfFacesPerCell(self):
@@ -854,6 +955,31 @@ class AbstractMesh(object):
     def _cellAreaProjections(self):
         return self._cellNormals * self._cellAreas
 
+    @_cachedMeshProperty
+    def _leastSquaresGradWeights(self):
+        r"""
+        Weights :math:`W_{jP}` of the differences to the neighbors `j` of
+        each cell `P` in its least-squares gradient, :math:`\nabla\phi_P =
+        \sum_j W_{jP} (\phi_j - \phi_P)`, with shape `(dim,
+        maxFacesPerCell, numberOfCells)`. They are the normal matrices of
+        the cell-to-cell vectors, inverted for all cells at once and
+        applied to those vectors.
+
+        >>> from fipy.meshes import Grid2D
+        >>> print Grid2D(nx=2, ny=1)._leastSquaresGradWeights[0]
+        [[ 0.   0. ]
+         [ 0.8  0.4]
+         [ 0.   0. ]
+         [-0.4 -0.8]]
+
+        Padded face slots of cells with fewer faces than
+        `maxFacesPerCell` take no part.
+        """
+        cellDistanceNormals = MA.filled(self._cellToCellDistances * self._cellNormals, 0)
+        mat = (cellDistanceNormals[:, numerix.newaxis] * cellDistanceNormals[numerix.newaxis]).sum(2)
+        inverse = numerix.linalg.inv(mat.transpose((2, 0, 1))).transpose((1, 2, 0))
+        return (inverse[:, :, numerix.newaxis] * cellDistanceNormals[numerix.newaxis]).sum(1)
+
     """
     Special methods
     """
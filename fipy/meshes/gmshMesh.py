@@ -561,136 +561,160 @@ class MSHFile(GmshFile):
         newF.close()
         return newPath
 
-    def _seekForHeader(self, title):
+    def _seekForHeader(self, title, chunkSize=2**22):
         """
         Iterate through a file until we end up at the section header
         for `title`. Function has obvious side-effects on `self.fileobj`.
         """
+        header = "$%s" % title
         while True:
-            line = self.fileobj.readline()
-            if len(line) == 0:
+            start = self.fileobj.tell()
+            chunk = self.fileobj.read(max(chunkSize, 2 * len(header)))
+            if len(chunk) == 0:
                 raise EOFError("No `%s' header found!" % title)
-                break
-            elif (("$%s" % title) not in line):
-                continue
-            else:
+            found = chunk.find(header)
+            if found >= 0:
+                self.fileobj.seek(start + found)
+                self.fileobj.readline()
                 break # found header
+            elif len(chunk) >= len(header):
+                # the header may straddle the end of the chunk
+                self.fileobj.seek(start + len(chunk) - len(header) + 1)
 
-    def _deriveCellsAndFaces(self, cellsToVertIDs, shapeTypes, numCells):
-        """
-        Uses element information obtained from `_parseElementFile` to deliver
-        `facesToVertices` and `cellsToFaces`.
+    def _readSection(self, title, dtype, chunkSize=2**22):
         """
+        Iterate over the data between $[title] and $End[title], after the
+        line holding the number of entries, in blocks of whole lines.
 
-        allShapes  = nx.unique(shapeTypes).tolist()
-        maxFaces   = max([self.numFacesPerCell[x] for x in allShapes])
+        Each block is returned as an array of the integer or floating point
+        values it holds, and the number of values on each of its lines.
+        Reading in blocks keeps the memory needed independent of the size
+        of the file.
+        """
+        self.fileobj.seek(0)
+        self._seekForHeader(title)
+        self.fileobj.readline() # skip number of entries
 
-        # `cellsToFaces` must be padded with -1; see mesh.py
-        currNumFaces = 0
-        cellsToFaces = nx.ones((numCells, maxFaces), 'l') * -1
-        facesDict    = {}
-        uniqueFaces  = []
-
-        # we now build `cellsToFaces` and `uniqueFaces`,
-        # the latter will result in `facesToVertices`.
-        for cellIdx in range(numCells):
-            shapeType = shapeTypes[cellIdx]
-            cell = cellsToVertIDs[cellIdx]
-
-            if shapeType in [5, 12, 17]: # hexahedron
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3], # ordering of vertices gleaned from
-                                                                 [4, 5, 6, 7], # a one-cube Grid3D example
-                                                                 [0, 1, 5, 4],
-                                                                 [3, 2, 6, 7],
-                                                                 [0, 3, 7, 4],
-                                                                 [1, 2, 6, 5]])
-            elif shapeType in [6, 13, 18]: # prism
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2],
-                                                                 [5, 4, 3],
-                                                                 [3, 4, 1, 0],
-                                                                 [4, 5, 2, 1],
-                                                                 [5, 3, 0, 2]])
-            elif shapeType in [7, 14, 19]: # pyramid
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3],
-                                                                 [0, 1, 4],
-                                                                 [1, 2, 4],
-                                                                 [2, 3, 4],
-                                                                 [3, 0, 4]])
+        end = "$End%s" % title
+        remainder = ""
+        while True:
+            data = self.fileobj.read(chunkSize)
+            text = remainder + data
+            finished = (len(data) == 0)
+            if end in text:
+                text = text[:text.index(end)]
+                finished = True
+
+            if finished:
+                remainder = ""
             else:
-                if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
-                    faceLength = 2 # triangle
-                elif shapeType in [3, 10, 16]:
-                    faceLength = 2 # quadrangle
-                elif shapeType in [4, 11, 29, 30, 31]:
-                    faceLength = 3 # tetrahedron
-
-                faces = self._extractRegularFaces(cell=cell,
-                                                  faceLength=faceLength,
-                                                  facesPerCell=self.numFacesPerCell[shapeType])
-
-            for faceIdx in range(len(faces)):
-                # NB: currFace is sorted for the key to spot duplicates
-                currFace = faces[faceIdx]
-                keyStr   = ' '.join([str(x) for x in sorted(currFace)])
-
-                if keyStr in facesDict:
-                    cellsToFaces[cellIdx][faceIdx] = facesDict[keyStr]
-                else: # new face
-                    facesDict[keyStr] = currNumFaces
-                    cellsToFaces[cellIdx][faceIdx] = currNumFaces
-                    uniqueFaces.append(currFace)
-                    currNumFaces += 1
-
-        # pad short faces with -1
-        maxFaceLen = max([len(f) for f in uniqueFaces])
-        uniqueFaces = [[-1] * (maxFaceLen - len(f)) + f for f in uniqueFaces]
-
-        facesToVertices = nx.array(uniqueFaces, dtype=nx.INT_DTYPE)
-
-        return facesToVertices.swapaxes(0,1)[::-1], cellsToFaces.swapaxes(0,1).copy('C'), facesDict
+                # hold back any incomplete final line
+                last = text.rfind("\n") + 1
+                text, remainder = text[:last], text[last:]
+
+            if len(text.strip()) > 0:
+                values = nx.fromstring(text, dtype=dtype, sep=" ")
+                counts = _tokensPerLine(text)
+                if values.shape[0] != counts.sum():
+                    raise GmshException("Unable to parse $%s section of %s" % (title, self.filename))
+                yield values, counts
+
+            if finished:
+                break
 
-    def _translateNodesToVertices(self, entitiesNodes, vertexMap):
-        """Translates entitiesNodes from Gmsh node IDs to `vertexCoords` indices.
+        self.fileobj.seek(0)
+
+    def _deriveCellsAndFaces(self, cellsToVertIDs, numNodes, shapeTypes):
         """
-        entitiesVertices = []
+        Uses element information obtained from `_parseElementFile` to deliver
+        `facesToVertices` and `cellsToFaces`.
 
-        for entity in entitiesNodes:
-            try:
-                vertIndices = vertexMap[nx.array(entity)]
-            except IndexError:
-                vertIndices = nx.ones((len(entity),), 'l') * -1
-            entitiesVertices.append(vertIndices)
+        `cellsToVertIDs` is an array of the vertices of each cell, padded
+        with -1, and `numNodes` is the number of vertices in each cell.
 
-        return entitiesVertices
+        Every face of every cell is gathered into one array, with the
+        vertices of each face sorted to spot duplicates. Faces are numbered
+        in the order they are first encountered. Also returns the sorted
+        vertices of each face, padded at the front with -1, so that Gmsh
+        faces can be matched against them.
+        """
+        numCells = len(shapeTypes)
+
+        # gather the faces of each type of cell in turn
+        shapes = []
+        for shapeType in nx.unique(shapeTypes):
+            cellIDs = nx.nonzero(shapeTypes == shapeType)[0]
+            n = numNodes[cellIDs[0]]
+            shapes.append((cellIDs, self._faceOrderings(shapeType=shapeType, numNodes=n)))
+
+        maxFaces   = max([len(orderings) for cellIDs, orderings in shapes])
+        maxFaceLen = max([len(o) for cellIDs, orderings in shapes for o in orderings])
+
+        # short faces are padded at the front with -1
+        cellFaces = -nx.ones((numCells, maxFaces, maxFaceLen), dtype=nx.INT_DTYPE)
+        isFace = nx.zeros((numCells, maxFaces), dtype=bool)
+        for cellIDs, orderings in shapes:
+            for faceIdx, ordering in enumerate(orderings):
+                cellFaces[cellIDs, faceIdx, maxFaceLen-len(ordering):] = cellsToVertIDs[cellIDs][..., ordering]
+                isFace[cellIDs, faceIdx] = True
+
+        # NB: faces are sorted for the key to spot duplicates
+        faces = cellFaces[isFace]
+        faceKeys = nx.sort(faces, axis=1)
+        firsts, faceIDs = _uniqueRows(faceKeys)
+
+        # `cellsToFaces` must be padded with -1; see mesh.py
+        cellsToFaces = -nx.ones((numCells, maxFaces), 'l')
+        cellsToFaces[isFace] = faceIDs
 
-    def _extractRegularFaces(self, cell, faceLength, facesPerCell):
-        """Return faces for a regular poly(gon|hedron)
+        facesToVertices = faces[firsts]
 
-        Given `cell`, defined by node IDs, returns an array of
-        `facesPerCell` faces of length `faceLength` in terms of nodes.
+        return facesToVertices.swapaxes(0,1)[::-1], cellsToFaces.swapaxes(0,1).copy('C'), faceKeys[firsts]
+
+    def _translateNodesToVertices(self, entitiesNodes, vertexMap):
+        """Translates entitiesNodes from Gmsh node IDs to `vertexCoords` indices.
+
+        `entitiesNodes` is an array of Gmsh node IDs, padded with -1. Nodes
+        that are not in `vertexMap` are translated to -1.
         """
-        faces = []
-        for i in range(facesPerCell):
-            aFace = []
-            for j in range(faceLength):
-                aVertex = (i + j) % len(cell) # we may wrap
-                aFace.append(int(cell[aVertex]))
-            faces.append(aFace)
-        return faces
-
-    def _extractOrderedFaces(self, cell, faceOrderings):
-        """Return faces for a 8-node hexahedron cell.
+        entitiesNodes = nx.asarray(entitiesNodes)
+        known = (entitiesNodes >= 0) & (entitiesNodes < len(vertexMap))
+        return nx.where(known, vertexMap[nx.where(known, entitiesNodes, 0)], -1)
+
+    def _faceOrderings(self, shapeType, numNodes):
+        """Return the faces of a cell of `shapeType`, with `numNodes` nodes,
+        as lists of the positions of their vertices in the cell
         """
-        def orderingToFace(vertList):
-            aFace = []
-            for i in vertList:
-                aFace.append(int(cell[i]))
-            return aFace
+        if shapeType in [5, 12, 17]: # hexahedron
+            return [[0, 1, 2, 3], # ordering of vertices gleaned from
+                    [4, 5, 6, 7], # a one-cube Grid3D example
+                    [0, 1, 5, 4],
+                    [3, 2, 6, 7],
+                    [0, 3, 7, 4],
+                    [1, 2, 6, 5]]
+        elif shapeType in [6, 13, 18]: # prism
+            return [[0, 1, 2],
+                    [5, 4, 3],
+                    [3, 4, 1, 0],
+                    [4, 5, 2, 1],
+                    [5, 3, 0, 2]]
+        elif shapeType in [7, 14, 19]: # pyramid
+            return [[0, 1, 2, 3],
+                    [0, 1, 4],
+                    [1, 2, 4],
+                    [2, 3, 4],
+                    [3, 0, 4]]
+        else:
+            if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
+                faceLength = 2 # triangle
+            elif shapeType in [3, 10, 16]:
+                faceLength = 2 # quadrangle
+            elif shapeType in [4, 11, 29, 30, 31]:
+                faceLength = 3 # tetrahedron
 
-        return [orderingToFace(o) for o in faceOrderings]
+            # faces of a regular poly(gon|hedron) wind around its vertices
+            return [[(i + j) % numNodes for j in range(faceLength)] # we may wrap
+                    for i in range(self.numFacesPerCell[shapeType])]
 
     def read(self):
         """
@@ -701,17 +725,13 @@ class MSHFile(GmshFile):
         3. Build faces
         4. Build cellsToFaces
 
-        Isolate relevant data into three files, store in
-        `self.nodesPath` for $Nodes,
-        `self.elemsPath` for $Elements.
-        `self.namesFile` for $PhysicalNames.
+        $Nodes and $Elements are read in place, in blocks;
+        $PhysicalNames is isolated into `self.namesPath`.
 
         Returns vertexCoords, facesToVertexID, cellsToFaceID,
                 cellGlobalIDMap, ghostCellGlobalIDMap.
         """
         self.version, self.fileType, self.dataSize = self._getMetaData()
-        self.nodesPath = self._isolateData("Nodes")
-        self.elemsPath = self._isolateData("Elements")
         try:
             self.namesPath = self._isolateData("PhysicalNames")
         except EOFError, e:
@@ -719,22 +739,14 @@ class MSHFile(GmshFile):
 
         try:
             if self.dimensions is None:
-                nodesFile = open(self.nodesPath, 'r')
-                nodesFile.readline() # skip number of nodes
-
                 # We assume we have a 2D file unless we find a node
                 # with a non-zero Z coordinate
                 self.dimensions = 2
-                for node in nodesFile:
-                    line   = node.split()
-
-                    newVert = [float(x) for x in line]
-
-                    if newVert[2] != 0.0:
+                for values, counts in self._readSection("Nodes", dtype=float):
+                    if (values.reshape((-1, 4))[..., 3] != 0.0).any():
                         self.dimensions = 3
                         break
-
-                nodesFile.close()
+                self.fileobj.seek(0)
 
             self.coordDimensions = self.coordDimensions or self.dimensions
 
@@ -787,15 +799,12 @@ class MSHFile(GmshFile):
              ghostsData,
              facesData) = self._parseElementFile()
 
-            cellsToGmshVerts = cellsData.nodes + ghostsData.nodes
-            numCellsTotal    = len(cellsData.nodes) + len(ghostsData.nodes)
-            allShapeTypes    = cellsData.shapes + ghostsData.shapes
-            allShapeTypes    = nx.array(allShapeTypes)
-            allShapeTypes    = nx.delete(allShapeTypes, nx.s_[numCellsTotal:])
-            self.physicalCellMap = nx.array(cellsData.physicalEntities
-                                            + ghostsData.physicalEntities)
-            self.geometricalCellMap = nx.array(cellsData.geometricalEntities
-                                               + ghostsData.geometricalEntities)
+            allCellsData     = _ElementData.concatenate(cellsData, ghostsData)
+            cellsToGmshVerts = allCellsData.nodes
+            numCellsTotal    = len(allCellsData.shapes)
+            allShapeTypes    = allCellsData.shapes
+            self.physicalCellMap = allCellsData.physicalEntities
+            self.geometricalCellMap = allCellsData.geometricalEntities
 
             if numCellsTotal < 1:
                 errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
@@ -813,50 +822,40 @@ class MSHFile(GmshFile):
             parprint("Building cells and faces.")
             (facesToV,
              cellsToF,
-             facesDict) = self._deriveCellsAndFaces(cellsToVertIDs,
-                                                    allShapeTypes,
-                                                    numCellsTotal)
+             faceKeys) = self._deriveCellsAndFaces(cellsToVertIDs,
+                                                   allCellsData.numNodes,
+                                                   allShapeTypes)
 
             # cell entities were easy to record on parsing
             # but we don't use Gmsh faces, so we need to correlate the nodes
             # that make up the Gmsh faces with the vertex IDs of the FiPy faces
             # so that we can check if any are named
-            faceEntitiesDict = dict()
 
             # translate Gmsh IDs to `vertexCoord` indices
             facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
                                                             vertIDtoIdx)
 
-            for face, physicalEntity, geometricalEntity in zip(facesToVertIDs,
-                                                               facesData.physicalEntities,
-                                                               facesData.geometricalEntities):
-                faceEntitiesDict[' '.join([str(x) for x in sorted(face)])] = (physicalEntity, geometricalEntity)
-
             self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
             self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            for face in facesDict.keys():
-                # not all faces are necessarily tagged
-                if face in faceEntitiesDict:
-                    self.physicalFaceMap[facesDict[face]] = faceEntitiesDict[face][0]
-                    self.geometricalFaceMap[facesDict[face]] = faceEntitiesDict[face][1]
+
+            # not all faces are necessarily tagged
+            faceIDs = _matchRows(faceKeys, nx.sort(facesToVertIDs, axis=1))
+            tagged = faceIDs >= 0
+            self.physicalFaceMap[faceIDs[tagged]] = facesData.physicalEntities[tagged]
+            self.geometricalFaceMap[faceIDs[tagged]] = facesData.geometricalEntities[tagged]
 
             self.physicalNames = self._parseNamesFile()
 
         finally:
-            os.unlink(self.nodesPath)
-            os.unlink(self.elemsPath)
             if self.namesPath is not None:
                 os.unlink(self.namesPath)
 
-        # convert lists of cell vertices to a properly oriented masked array
-        maxVerts = max([len(v) for v in cellsToVertIDs])
-        # ticket:539 - NumPy 1.7 casts to array before concatenation and empty array defaults to float
-        cellsToVertIDs = [nx.concatenate((v, nx.array([-1] * (maxVerts-len(v)), dtype=nx.INT_DTYPE))) for v in cellsToVertIDs]
-        cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs, value=-1).swapaxes(0,1)
+        # convert padded array of cell vertices to a properly oriented masked array
+        cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs.astype(nx.INT_DTYPE), value=-1).swapaxes(0,1)
 
         parprint("Done with cells and faces.")
         return (vertexCoords, facesToV, cellsToF,
-                cellsData.idmap, ghostsData.idmap,
+                cellsData.idmap.tolist(), ghostsData.idmap.tolist(),
                 cellsToVertIDs)
 
     def write(self, obj, time=0.0, timeindex=0):
@@ -994,36 +993,23 @@ class MSHFile(GmshFile):
         Unlike parent, doesn't use genfromtxt
         because we want to avoid loading the entire msh file into memory.
         """
-        allVerts     = [v for c in cellsToGmshVerts for v in c] # flatten
-        allVerts     = nx.unique(nx.array(allVerts, dtype=nx.INT_DTYPE)) # remove dups
-        allVerts     = nx.sort(allVerts)
+        allVerts     = nx.unique(cellsToGmshVerts[cellsToGmshVerts >= 0]) # remove dups and padding
         maxVertIdx   = allVerts[-1] + 1 # add one to offset zero
         vertGIDtoIdx = nx.ones(maxVertIdx, 'l') * -1 # gmsh ID -> vertexCoords idx
         vertexCoords = nx.empty((len(allVerts), self.coordDimensions))
-        nodeCount    = 0
 
         # establish map. This works because allVerts is a sorted set.
         vertGIDtoIdx[allVerts] = nx.arange(len(allVerts))
 
-        nodesFile = open(self.nodesPath, 'r')
-        nodesFile.readline() # skip number of nodes
-
-        # now we walk through node file with a sorted unique list of vertices
-        # in hand. When we encounter 0th element in `allVerts`, save it
-        # to `vertexCoords` then pop its ID off `allVerts`.
-        for node in nodesFile:
-            line   = node.split()
-            nodeID = int(line[0])
-
-            if nodeID == allVerts[nodeCount]:
-                newVert = [float(x) for x in line[1:self.coordDimensions+1]]
-                vertexCoords[nodeCount,:] = nx.array(newVert)
-                nodeCount += 1
-
-            if len(allVerts) == nodeCount:
-                break
-
-        nodesFile.close()
+        # now we walk through the nodes a block at a time, saving the
+        # coordinates of any that are in `allVerts`
+        for values, counts in self._readSection("Nodes", dtype=float):
+            nodes = values.reshape((-1, 4))
+            nodeIDs = nodes[..., 0].astype('l')
+            nodeIDs = nx.where(nodeIDs < maxVertIdx, nodeIDs, 0)
+            idx = vertGIDtoIdx[nodeIDs]
+            used = idx >= 0
+            vertexCoords[idx[used]] = nodes[used, 1:self.coordDimensions+1]
 
         # transpose for FiPy
         transCoords = vertexCoords.swapaxes(0,1)
@@ -1037,96 +1023,96 @@ class MSHFile(GmshFile):
         All nastiness concerning ghost cell
         calculation is consolidated here: if we were ever to need to CALCULATE
         GHOST CELLS OURSELVES, the only code we'd have to change is in here.
-        """
-
-        def _parseTags(offset, currLineInts):
-            if offset == -1:
-                # if first valid shape
-                offset = currLineInts[0]
-
-            numTags = currLineInts[2]
-            tags    = currLineInts[3:(3+numTags)]
-
-            # the partition tags for don't seem to always be present
-            # and don't always make much sense when they are
-
-            if len(tags) >= 2:
-                physicalEntity = tags.pop(0)
-                geometricalEntity = tags.pop(0)
-            else:
-                physicalEntity = geometricalEntity = -1
-
-            return offset, tags, physicalEntity, geometricalEntity
-
 
+        Each line of $Elements is `id type numTags tags... nodes...`. The
+        section is read a block of lines at a time and each field is
+        gathered for all of the elements in the block at once.
+        """
         cellsData = _ElementData()
         ghostsData = _ElementData()
         facesData = _ElementData()
 
-        cellOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        faceOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
+        cellOffset = None # this will be subtracted from gmsh ID to obtain global ID
+        faceOffset = None # this will be subtracted from gmsh ID to obtain global ID
         pid = self.communicator.procID + 1
 
-        elemsFile = open(self.elemsPath, 'r')
+        cellTypes = nx.array(self.numFacesPerCell.keys())
+        faceTypes = nx.array(self.numVertsPerFace.keys())
 
-        elemsFile.readline() # skip number of elements
-        for el in elemsFile:
-            currLineInts = [int(x) for x in el.split()]
-            elemType     = currLineInts[1]
+        for values, counts in self._readSection("Elements", dtype=nx.INT_DTYPE):
+            counts = counts[counts > 0]
+            starts = nx.cumsum(counts) - counts
+            elemTypes = values[starts + 1]
+            numTags = values[starts + 2]
 
-            if elemType in self.numFacesPerCell.keys():
-                # element is a cell
+            # the first two tags are the physical and geometrical entities
+            hasEntities = numTags >= 2
+            entitiesAt = nx.minimum(starts + 3, len(values) - 2)
+            physicalEntities = nx.where(hasEntities, values[entitiesAt], -1)
+            geometricalEntities = nx.where(hasEntities, values[entitiesAt + 1], -1)
 
-                (cellOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=cellOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= cellOffset
-
-                if len(tags) > 0:
-                    # next item is a count
-                    if tags[0] != len(tags) - 1:
-                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (tags[0], len(tags) - 1),
-                                      SyntaxWarning, stacklevel=2)
-                    tags = tags[1:]
+            # the partition tags don't seem to always be present
+            # and don't always make much sense when they are
+            partitionsAt = starts + 3 + 2 * hasEntities
+            numPartitionTags = numTags - 2 * hasEntities
+
+            numNodes = counts - 3 - numTags
+
+            isCell = nx.in1d(elemTypes, cellTypes)
+            if isCell.any():
+                if cellOffset is None:
+                    # if first valid shape
+                    cellOffset = values[starts[isCell][0]]
+
+                # next item is a count
+                hasPartitions = isCell & (numPartitionTags > 0)
+                partitionCounts = nx.where(hasPartitions, values[nx.minimum(partitionsAt, len(values) - 1)], 0)
+                disagree = hasPartitions & (partitionCounts != numPartitionTags - 1)
+                if disagree.any():
+                    first = nx.nonzero(disagree)[0][0]
+                    warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (partitionCounts[first], numPartitionTags[first] - 1),
+                                  SyntaxWarning, stacklevel=2)
 
                 if self.communicator.Nproc > 1:
-                    for tag in tags:
-                        if -tag == pid:
-                            # if we're collecting ghost cells and this is our ghost cell
-                            ghostsData.add(currLine=currLineInts, elType=elemType,
-                                           physicalEntity=physicalEntity,
-                                           geometricalEntity=geometricalEntity)
-                        elif tag == pid:
-                            # el is in this processor's partition or we collect all cells
-                            cellsData.add(currLine=currLineInts, elType=elemType,
-                                          physicalEntity=physicalEntity,
-                                          geometricalEntity=geometricalEntity)
+                    numPartitions = nx.where(hasPartitions, numPartitionTags - 1, 0)
+                    partitions, owners = _gatherRagged(values, partitionsAt + 1, numPartitions)
+                    # if we're collecting ghost cells and this is our ghost cell
+                    isGhost = nx.bincount(owners[partitions == -pid], minlength=len(starts)) > 0
+                    # el is in this processor's partition
+                    isLocal = nx.bincount(owners[partitions == pid], minlength=len(starts)) > 0
                 else:
                     # we collect all cells
-                    cellsData.add(currLine=currLineInts, elType=elemType,
-                                  physicalEntity=physicalEntity,
-                                  geometricalEntity=geometricalEntity)
-            elif elemType in self.numVertsPerFace.keys():
-                # element is a face
-
-                (faceOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=faceOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= faceOffset
-
-                facesData.add(currLine=currLineInts, elType=elemType,
-                              physicalEntity=physicalEntity,
-                              geometricalEntity=geometricalEntity)
-
-        elemsFile.close()
+                    isGhost = nx.zeros(isCell.shape, dtype=bool)
+                    isLocal = isCell
+
+                for data, selected in ((cellsData, isCell & isLocal),
+                                       (ghostsData, isCell & isGhost)):
+                    if selected.any():
+                        data.add(nodes=_gatherPadded(values,
+                                                     (starts + 3 + numTags)[selected],
+                                                     numNodes[selected]),
+                                 numNodes=numNodes[selected],
+                                 shapes=elemTypes[selected],
+                                 idmap=values[starts[selected]] - cellOffset,
+                                 physicalEntities=physicalEntities[selected],
+                                 geometricalEntities=geometricalEntities[selected])
+
+            isFace = nx.in1d(elemTypes, faceTypes)
+            if isFace.any():
+                if faceOffset is None:
+                    faceOffset = values[starts[isFace][0]]
+
+                facesData.add(nodes=_gatherPadded(values,
+                                                  (starts + 3 + numTags)[isFace],
+                                                  numNodes[isFace]),
+                              numNodes=numNodes[isFace],
+                              shapes=elemTypes[isFace],
+                              idmap=values[starts[isFace]] - faceOffset,
+                              physicalEntities=physicalEntities[isFace],
+                              geometricalEntities=geometricalEntities[isFace])
 
         return cellsData, ghostsData, facesData
 
-
     def _parseNamesFile(self):
         physicalNames = {
             0: dict(),
@@ -1258,30 +1244,155 @@ class MSHFile(GmshFile):
         """
         pass
 
+def _tokensPerLine(text):
+    """Count the whitespace-separated values on each line of `text`
+
+        >>> print _tokensPerLine("1 2  3\\n\\n 4 5\\n6\\n")
+        [3 0 2 1]
+    """
+    chars = nx.frombuffer(text, dtype=nx.uint8)
+    space = ((chars == ord(" ")) | (chars == ord("\t"))
+             | (chars == ord("\r")) | (chars == ord("\n")))
+    # a value starts wherever a non-space follows a space
+    starts = ~space
+    starts[1:] &= space[:-1]
+    newlines = nx.nonzero(chars == ord("\n"))[0]
+    numLines = len(newlines) + (len(chars) > 0 and chars[-1] != ord("\n"))
+    lines = nx.searchsorted(newlines, nx.nonzero(starts)[0])
+    return nx.bincount(lines, minlength=numLines)
+
+def _gatherRagged(values, starts, lengths):
+    """Gather `lengths[i]` consecutive `values` from each of `starts[i]`
+
+    Returns the gathered values and the index `i` each came from.
+
+        >>> print _gatherRagged(nx.arange(10), nx.array((1, 5, 8)), nx.array((2, 0, 2)))
+        (array([1, 2, 8, 9]), array([0, 0, 2, 2]))
+    """
+    owners = nx.repeat(nx.arange(len(starts)), lengths)
+    firsts = nx.cumsum(lengths) - lengths
+    positions = nx.arange(lengths.sum()) - nx.repeat(firsts, lengths)
+    return values[nx.repeat(starts, lengths) + positions], owners
+
+def _gatherPadded(values, starts, lengths, pad=-1):
+    """Gather `lengths[i]` consecutive `values` from each of `starts[i]`
+    into row `i` of an array, padded with `pad`
+
+        >>> print _gatherPadded(nx.arange(10), nx.array((1, 5, 8)), nx.array((2, 1, 2)))
+        [[ 1  2]
+         [ 5 -1]
+         [ 8  9]]
+    """
+    gathered, owners = _gatherRagged(values, starts, lengths)
+    padded = nx.empty((len(starts), max(lengths.max(), 0)), dtype=values.dtype)
+    padded.fill(pad)
+    firsts = nx.cumsum(lengths) - lengths
+    padded[owners, nx.arange(len(gathered)) - nx.repeat(firsts, lengths)] = gathered
+    return padded
+
+def _uniqueRows(rows):
+    """Find the distinct rows of a 2D array
+
+    Returns the index of the first occurrence of each distinct row, in the
+    order they occur, and the number of the distinct row each row matches.
+
+        >>> firsts, inverse = _uniqueRows(nx.array(((3, 1), (0, 2), (3, 1), (0, 1), (0, 2))))
+        >>> print firsts
+        [0 1 3]
+        >>> print inverse
+        [0 1 0 2 1]
+    """
+    # lexsort is stable, so the first of each run of equal rows
+    # is the first occurrence of that row
+    order = nx.lexsort(rows.swapaxes(0,1)[::-1])
+    sortedRows = rows[order]
+    new = nx.ones(order.shape, dtype=bool)
+    new[1:] = (sortedRows[1:] != sortedRows[:-1]).any(axis=1)
+    group = nx.cumsum(new) - 1
+
+    firsts = order[new]
+    byOccurrence = nx.argsort(firsts)
+    number = nx.empty(byOccurrence.shape, dtype=nx.INT_DTYPE)
+    number[byOccurrence] = nx.arange(len(byOccurrence))
+
+    inverse = nx.empty(order.shape, dtype=nx.INT_DTYPE)
+    inverse[order] = number[group]
+
+    return firsts[byOccurrence], inverse
+
+def _matchRows(keys, rows):
+    """Find which of the distinct rows of `keys` each of `rows` equals
+
+    Rows of different widths are compared after padding
+    the narrower at the front with -1. Rows that match no key are -1.
+
+        >>> print _matchRows(nx.array(((-1, 1, 2), (2, 3, 4))), nx.array(((0, 1), (1, 2))))
+        [-1  0]
+    """
+    width = max(keys.shape[1], rows.shape[1])
+    def pad(a):
+        return nx.concatenate((-nx.ones((a.shape[0], width - a.shape[1]), dtype=a.dtype), a), axis=1)
+
+    firsts, inverse = _uniqueRows(nx.concatenate((pad(keys), pad(rows))))
+    matches = inverse[len(keys):]
+    return nx.where(matches < len(keys), matches, -1)
+
 class _ElementData(object):
     """
     Bookkeeping for cells. Declared as own class for generality.
 
-    "nodes": A Python list of the vertices that make up this element
-    "shapes": A shapeTypes Python list
-    "idmap": A Python list which maps vertexCoords idx -> global ID
-    "physicalEntities": A Python list of the Gmsh physical entities each element is in
-    "geometricalEntities": A Python list of the Gmsh geometrical entities each element is in
+    "nodes": An array of the Gmsh nodes that make up each element, padded with -1
+    "numNodes": An array of the number of nodes in each element
+    "shapes": An array of the shape type of each element
+    "idmap": An array which maps vertexCoords idx -> global ID
+    "physicalEntities": An array of the Gmsh physical entity each element is in
+    "geometricalEntities": An array of the Gmsh geometrical entity each element is in
+
+    Elements are added a block at a time, and the blocks are joined when
+    a field is first asked for.
     """
+    _fields = ("nodes", "numNodes", "shapes", "idmap", "physicalEntities", "geometricalEntities")
+
     def __init__(self):
-        self.nodes = []
-        self.shapes = []
-        self.idmap = [] # vertexCoords idx -> gmsh ID (global ID)
-        self.physicalEntities = []
-        self.geometricalEntities = []
-
-    def add(self, currLine, elType, physicalEntity, geometricalEntity):
-        numTags = currLine[2]
-        self.nodes.append(currLine[(numTags+3):])
-        self.shapes.append(elType)
-        self.idmap.append(currLine[0])
-        self.physicalEntities.append(physicalEntity)
-        self.geometricalEntities.append(geometricalEntity)
+        self._blocks = []
+        self._joined = None
+
+    def add(self, **block):
+        self._blocks.append(block)
+        self._joined = None
+
+    @classmethod
+    def concatenate(cls, *datas):
+        data = cls()
+        for d in datas:
+            data._blocks.extend(d._blocks)
+        return data
+
+    def _join(self):
+        if self._joined is None:
+            joined = {}
+            for field in self._fields:
+                blocks = [block[field] for block in self._blocks]
+                if field == "nodes":
+                    width = max([0] + [b.shape[1] for b in blocks])
+                    blocks = [nx.concatenate((b, -nx.ones((b.shape[0], width - b.shape[1]), dtype=b.dtype)), axis=1)
+                              for b in blocks]
+                    empty = nx.zeros((0, width), dtype=nx.INT_DTYPE)
+                else:
+                    empty = nx.zeros((0,), dtype=nx.INT_DTYPE)
+                if len(blocks) > 0:
+                    joined[field] = nx.concatenate(blocks)
+                else:
+                    joined[field] = empty
+            self._joined = joined
+        return self._joined
+
+    nodes = property(lambda self: self._join()["nodes"])
+    numNodes = property(lambda self: self._join()["numNodes"])
+    shapes = property(lambda self: self._join()["shapes"])
+    idmap = property(lambda self: self._join()["idmap"])
+    physicalEntities = property(lambda self: self._join()["physicalEntities"])
+    geometricalEntities = property(lambda self: self._join()["geometricalEntities"])
 
 class _GmshTopology(_MeshTopology):
 
@@ -39,7 +39,8 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.meshes.abstractMesh import AbstractMesh
+from fipy.meshes.abstractMesh import AbstractMesh, _cachedMeshProperty
+from fipy.tools.raggedArray import _RaggedArray
 from fipy.meshes.representations.meshRepresentation import _MeshRepresentation
 from fipy.meshes.topologies.meshTopology import _MeshTopology
 
@@ -194,20 +195,8 @@ class Mesh(AbstractMesh):
         return numerix.sqrtDot(cross, cross) / 2.
 
     def _calcFaceCenters(self):
-        maskedFaceVertexIDs = MA.filled(self.faceVertexIDs, 0)
-
-        faceVertexCoords = numerix.take(self.vertexCoords, maskedFaceVertexIDs, axis=1)
-
-        if MA.getmask(self.faceVertexIDs) is False:
-            faceVertexCoordsMask = numerix.zeros(numerix.shape(faceVertexCoords), 'l')
-        else:
-            faceVertexCoordsMask = \
-              numerix.repeat(MA.getmaskarray(self.faceVertexIDs)[numerix.newaxis,...],
-                             self.dim, axis=0)
-
-        faceVertexCoords = MA.array(data=faceVertexCoords, mask=faceVertexCoordsMask)
-
-        return MA.filled(MA.average(faceVertexCoords, axis=1))
+        faceVertexIDs = self._raggedFaceVertexIDs
+        return faceVertexIDs.mean(numerix.take(self.vertexCoords, faceVertexIDs.indices, axis=1))
 
     @property
     def _rightHandOrientation(self):
@@ -240,9 +229,9 @@ class Mesh(AbstractMesh):
         return faceNormals * orientation
 
     def _calcFaceCellToCellNormals(self):
-        faceCellCentersUp = numerix.take(self._cellCenters, self.faceCellIDs[1], axis=1)
-        faceCellCentersDown = numerix.take(self._cellCenters, self.faceCellIDs[0], axis=1)
-        faceCellCentersUp = numerix.where(MA.getmaskarray(faceCellCentersUp),
+        faceCellCentersUp = numerix.take(self._cellCenters, MA.filled(self.faceCellIDs[1], 0), axis=1)
+        faceCellCentersDown = numerix.take(self._cellCenters, MA.filled(self.faceCellIDs[0]), axis=1)
+        faceCellCentersUp = numerix.where(MA.getmaskarray(self.faceCellIDs[1]),
                                           self._faceCenters,
                                           faceCellCentersUp)
 
@@ -257,13 +246,15 @@ class Mesh(AbstractMesh):
         return self.faceNormals
 
     def _calcCellVolumes(self):
+        cellFaceIDs = self._raggedCellFaceIDs
+        orientations = (numerix.take(MA.filled(self.faceCellIDs[0]), cellFaceIDs.indices)
+                        == cellFaceIDs.rows) * 2 - 1
         tmp = self._faceCenters[0] * self._faceAreas * self.faceNormals[0]
-        tmp = numerix.take(tmp, self.cellFaceIDs) * self._cellToFaceOrientations
-        return MA.filled(MA.sum(tmp, 0))
+        return cellFaceIDs.sum(numerix.take(tmp, cellFaceIDs.indices) * orientations)
 
     def _calcCellCenters(self):
-        tmp = numerix.take(self._faceCenters, self.cellFaceIDs, axis=1)
-        return MA.filled(MA.average(tmp, 1))
+        cellFaceIDs = self._raggedCellFaceIDs
+        return cellFaceIDs.mean(numerix.take(self._faceCenters, cellFaceIDs.indices, axis=1))
 
     def _calcFaceToCellDistAndVec(self):
         tmp = MA.repeat(self._faceCenters[...,numerix.NewAxis,:], 2, 1)
@@ -275,11 +266,12 @@ class Mesh(AbstractMesh):
         return faceToCellDistances, cellToFaceDistanceVectors
 
     def _calcCellDistAndVec(self):
-        tmp = numerix.take(self._cellCenters, self.faceCellIDs, axis=1)
-        tmp = tmp[...,1,:] - tmp[...,0,:]
-        tmp = MA.filled(MA.where(MA.getmaskarray(tmp), self._cellToFaceDistanceVectors[:,0], tmp))
+        tmp = (numerix.take(self._cellCenters, MA.filled(self.faceCellIDs[1], 0), axis=1)
+               - numerix.take(self._cellCenters, MA.filled(self.faceCellIDs[0]), axis=1))
+        tmp = numerix.where(MA.getmaskarray(self.faceCellIDs[1]),
+                            MA.filled(self._cellToFaceDistanceVectors[:,0]), tmp)
         cellDistanceVectors = tmp
-        cellDistances = MA.filled(MA.sqrt(MA.sum(tmp * tmp, 0)))
+        cellDistances = numerix.sqrt(numerix.sum(tmp * tmp, 0))
         return cellDistances, cellDistanceVectors
 
     def _calcFaceTangents(self):
@@ -362,6 +354,7 @@ class Mesh(AbstractMesh):
         self._scaledFaceAreas = self._scale['area'] * self._faceAreas
         self._scaledCellVolumes = self._scale['volume'] * self._cellVolumes
         self._scaledCellCenters = self._scale['length'] * self._cellCenters
+        self._invalidateGeometryCache()
         self._scaledFaceToCellDistances = self._scale['length'] * self._faceToCellDistances
         self._scaledCellDistances = self._scale['length'] * self._cellDistances
         self._setFaceDependentScaledValues()
@@ -460,29 +453,21 @@ class Mesh(AbstractMesh):
     """calc Topology methods"""
 
     def _calcFaceCellIDs(self):
-        array = MA.array(MA.indices(self.cellFaceIDs.shape, 'l')[1],
-                         mask=MA.getmask(self.cellFaceIDs))
-        faceCellIDs = MA.zeros((2, self.numberOfFaces), 'l')
-
-        ## Nasty bug: MA.put(arr, ids, values) fills its ids and
-        ## values arguments when masked!  This was not the behavior
-        ## that was assumed when used below.  It was only working
-        ## because the old fill value was 0 and the first element of
-        ## the array needed to be 0 since the cell's face was
-        ## 0. numerix.put() has been changed to deal with this
-        ## properly.
-
-##         MA.put(firstRow, cellFaceIDsFlat[::-1], array[::-1])
-##         MA.put(secondRow, cellFaceIDsFlat, array)
-        firstRow = faceCellIDs[0]
-        secondRow = faceCellIDs[1]
-
-        numerix.put(firstRow, self.cellFaceIDs[::-1,::-1], array[::-1,::-1])
-        numerix.put(secondRow, self.cellFaceIDs, array)
-
-        mask = ((False,) * self.numberOfFaces, (firstRow == secondRow))
-        return MA.sort(MA.array(faceCellIDs, mask = mask),
-                                   axis=0)
+        cellFaceIDs = self._raggedCellFaceIDs
+        faceIDs = cellFaceIDs.indices
+        cellIDs = cellFaceIDs.rows
+
+        ## the entries are in order of increasing cell ID and `put` keeps
+        ## the last value given for each face, so the first row gets the
+        ## lowest cell ID and the second row the highest
+        faceCellIDs = numerix.zeros((2, self.numberOfFaces), 'l')
+        numerix.put(faceCellIDs[0], faceIDs[::-1], cellIDs[::-1])
+        numerix.put(faceCellIDs[1], faceIDs, cellIDs)
+
+        ## faces of only one cell have no second cell
+        mask = numerix.array((numerix.zeros((self.numberOfFaces,), 'bool'),
+                              faceCellIDs[0] == faceCellIDs[1]))
+        return MA.array(faceCellIDs, mask=mask)
 
     """get Topology methods"""
 
@@ -490,27 +475,41 @@ class Mesh(AbstractMesh):
     def _maxFacesPerCell(self):
         return self.cellFaceIDs.shape[0]
 
-    @property
-    def _cellVertexIDs(self):
-        ## Get all the vertices from all the faces for each cell
-        cellFaceVertices = numerix.take(self.faceVertexIDs, self.cellFaceIDs, axis=1)
-
-        ## get a sorted list of vertices for each cell
-        cellVertexIDs = numerix.reshape(cellFaceVertices, (-1, self.numberOfCells))
-        cellVertexIDs = MA.sort(cellVertexIDs, axis=0, fill_value=-1)
+    @_cachedMeshProperty
+    def _raggedFaceVertexIDs(self):
+        """`faceVertexIDs` without the padding
+        """
+        return _RaggedArray.fromPadded(self.faceVertexIDs)
 
-        cellVertexIDs = MA.sort(MA.concatenate((cellVertexIDs[-1, numerix.newaxis],
-                                                MA.masked_where(cellVertexIDs[:-1]
-                                                                == cellVertexIDs[1:],
-                                                                cellVertexIDs[:-1]))),
-                                axis=0, fill_value=-1)
+    @_cachedMeshProperty
+    def _raggedCellFaceIDs(self):
+        """`cellFaceIDs` without the padding
+        """
+        return _RaggedArray.fromPadded(self.cellFaceIDs)
 
-        ## resize the array to remove extra masked values
+    @property
+    def _cellVertexIDs(self):
+        ## Get all the vertices from all the faces for each cell, with
+        ## padding pointing at an extra face whose vertices are all -1
+        faceVertexIDs = numerix.concatenate((MA.filled(self.faceVertexIDs, -1),
+                                             -numerix.ones((self.faceVertexIDs.shape[0], 1), 'l')),
+                                            axis=1)
+        cellFaceIDs = MA.filled(self.cellFaceIDs, self.numberOfFaces)
+        cellVertexIDs = numerix.take(faceVertexIDs, cellFaceIDs, axis=1)
+        cellVertexIDs = numerix.reshape(cellVertexIDs, (-1, self.numberOfCells))
+
+        ## get a sorted list of vertices for each cell, with repeats
+        ## replaced by padding
+        cellVertexIDs.sort(axis=0)
+        cellVertexIDs[1:][cellVertexIDs[1:] == cellVertexIDs[:-1]] = -1
+        cellVertexIDs.sort(axis=0)
+
+        ## resize the array to remove extra padding
         if cellVertexIDs.shape[-1] == 0:
             length = 0
         else:
-            length = min(numerix.sum(MA.getmaskarray(cellVertexIDs), axis=0))
-        return cellVertexIDs[length:][::-1]
+            length = min(numerix.sum(cellVertexIDs == -1, axis=0))
+        return MA.masked_values(cellVertexIDs[length:][::-1], -1)
 
     """
     Below is an ordered version of _getCellVertexIDs()
@@ -578,8 +577,21 @@ class Mesh(AbstractMesh):
            >>> print m0._getNearestCellID(m1.cellCenters.globalValue)
            [4 5 7 8]
 
+        The search tree is built once and kept until the geometry is rescaled
+
+           >>> tree = m0._cellCenterTree # doctest: +SCIPY
+           >>> print m0._getNearestCellID(((0.,), (12.,)))
+           [6]
+           >>> print m0._cellCenterTree is tree # doctest: +SCIPY
+           True
+
         """
-        return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+        return numerix.nearest(data=self.cellCenters.globalValue, points=points,
+                               tree=self._cellCenterTree)
+
+    @_cachedMeshProperty
+    def _cellCenterTree(self):
+        return numerix._nearestTree(self.cellCenters.globalValue)
 
     def _test(self):
         """
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+##
+ # -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "probe.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+
+def _locateCells(mesh, points, start=None, tolerance=1e-10, maxSteps=100):
+    """Find the cells of `mesh` that contain `points`
+
+    Each search starts from the cell whose center is nearest the point and
+    walks, through `_cellToCellIDs`, across whichever face of the current
+    cell the point is furthest outside of, until it reaches a cell that
+    contains the point or the boundary of the mesh.
+
+    Returns the IDs of the containing cells, a mask of the points that
+    were found and a mask of the points whose nearest cell is on this
+    process. Points that are outside the mesh (or that could not be
+    reached in `maxSteps`) are assigned the cell with the nearest center.
+    The nearest centers are found with the mesh's own `_getNearestCellID`,
+    so the search tree of an unstructured mesh is only built once. In
+    parallel, only the local partition is searched; points whose nearest
+    cell belongs to another process are not searched at all, and the cell
+    IDs returned for them are meaningless.
+
+        >>> from fipy import *
+        >>> m = Grid2D(dx=(1., 1.), dy=(1., 1.)) + ((0.,), (0.,))
+        >>> ids, inside, local = _locateCells(m, ((0.2, 1.9, 1.2, 3.), (0.3, 0.1, 1.7, 1.)))
+        >>> print ids
+        [0 1 3 1]
+        >>> print inside
+        [ True  True  True False]
+        >>> print local
+        [ True  True  True  True]
+
+    On a skewed mesh, the cell with the nearest center is not always the
+    one that contains the point
+
+        >>> numerix.random.seed(13)
+        >>> m = SkewedGrid2D(nx=10, ny=10, rand=0.4)
+        >>> points = 0.5 + numerix.random.random((2, 1000)) * 9
+        >>> ids, inside, local = _locateCells(m, points)
+        >>> print inside.all()
+        True
+        >>> faces = m.cellFaceIDs[..., ids]
+        >>> x0, y0 = m.faceCenters.value[..., faces]
+        >>> nx, ny = m.faceNormals[..., faces] * m._cellToFaceOrientations[..., ids]
+        >>> print ((points[0] - x0) * nx + (points[1] - y0) * ny <= 1e-10).all()
+        True
+        >>> print (ids != numerix.nearest(m.cellCenters.value, points)).any()
+        True
+    """
+    points = numerix.array(points, dtype=float)
+    if len(points.shape) == 1:
+        points = points[..., numerix.newaxis]
+    M = points.shape[-1]
+
+    if start is None:
+        start = numerix.array(mesh._getNearestCellID(points), dtype=numerix.INT_DTYPE)
+        if mesh.communicator.Nproc > 1:
+            # convert the global IDs to local ones, where there are any
+            globalIDs = numerix.asarray(mesh._globalOverlappingCellIDs)
+            order = numerix.argsort(globalIDs)
+            sortedIDs = globalIDs[order]
+            found = numerix.searchsorted(sortedIDs, start).clip(0, len(sortedIDs) - 1)
+            local = sortedIDs[found] == start
+            start = numerix.where(local, order[found], 0)
+        else:
+            local = numerix.ones((M,), dtype=bool)
+    else:
+        local = numerix.ones((M,), dtype=bool)
+
+    cellFaceIDs = MA.filled(mesh.cellFaceIDs, 0)
+    faceMask = MA.getmaskarray(mesh.cellFaceIDs)
+    orientations = MA.filled(mesh._cellToFaceOrientations, 0)
+    cellToCellIDs = MA.filled(mesh._cellToCellIDs, -1)
+    faceCenters = numerix.array(mesh.faceCenters.value)
+    faceNormals = numerix.array(mesh.faceNormals)
+
+    # distances are judged relative to the size of each cell
+    lengths = numerix.array(mesh.cellVolumes)**(1. / mesh.dim)
+
+    cellIDs = numerix.array(start, dtype=numerix.INT_DTYPE)
+    inside = numerix.zeros((M,), dtype=bool)
+
+    active = numerix.nonzero(local)[0]
+    for step in range(maxSteps):
+        if len(active) == 0:
+            break
+
+        cells = cellIDs[active]
+        faces = cellFaceIDs[..., cells]
+
+        # signed distance of each point outside each face of its cell
+        outwardNormals = faceNormals[..., faces] * orientations[..., cells]
+        offsets = points[..., numerix.newaxis, active] - faceCenters[..., faces]
+        outside = numerix.sum(offsets * outwardNormals, axis=0) / lengths[cells]
+        outside = numerix.where(faceMask[..., cells], -numerix.inf, outside)
+
+        worst = numerix.argmax(outside, axis=0)
+        found = outside[worst, numerix.arange(len(active))] <= tolerance
+        inside[active[found]] = True
+
+        neighbors = cellToCellIDs[worst, cells]
+        walking = ~found & (neighbors >= 0)
+        cellIDs[active[walking]] = neighbors[walking]
+        active = active[walking]
+
+    # points that were never found revert to the nearest cell
+    cellIDs = numerix.where(inside, cellIDs, start)
+
+    return cellIDs, inside, local
+
+def _linearWeights(mesh, points, cellIDs):
+    r"""Weights that linearly interpolate cell values to `points`
+
+    The value at a point in cell :math:`P` is reconstructed as
+    :math:`\phi_P + (\vec{x} - \vec{x}_P) \cdot (\nabla\phi)_P`, with the
+    gradient found by least squares from the face neighbors :math:`N` of
+    :math:`P`. This is linear in the cell values, so it is returned as the
+    IDs of :math:`P` and its neighbors and the weight of each of them.
+    Where the neighbors do not determine a gradient, :math:`\phi_P` alone is
+    used.
+
+    Linear fields are reproduced exactly
+
+        >>> from fipy import *
+        >>> m = Tri2D(nx=3, ny=3)
+        >>> points = ((0.3, 1.5, 2.9), (0.1, 1.2, 2.2))
+        >>> ids, inside, local = _locateCells(m, points)
+        >>> ids, weights = _linearWeights(m, points, ids)
+        >>> x, y = m.cellCenters.value
+        >>> print numerix.allclose(numerix.sum((2 * x - y)[ids] * weights, axis=0),
+        ...                        [0.5, 1.8, 3.6])
+        True
+    """
+    points = numerix.array(points, dtype=float)
+    if len(points.shape) == 1:
+        points = points[..., numerix.newaxis]
+
+    cellCenters = numerix.array(mesh.cellCenters.value)
+    cellToCellIDs = MA.filled(mesh._cellToCellIDs, -1)[..., cellIDs]
+    hasNeighbor = cellToCellIDs >= 0
+    neighborIDs = numerix.where(hasNeighbor, cellToCellIDs, cellIDs)
+
+    # (D, K, M) displacements from each cell center to its neighbors
+    A = cellCenters[..., neighborIDs] - cellCenters[..., numerix.newaxis, cellIDs]
+    A = A * hasNeighbor
+
+    # (M, D, D) normal equations of the least squares gradient
+    ATA = numerix.einsum('ikm,jkm->mij', A, A)
+    det = numerix.linalg.det(ATA)
+    scale = numerix.einsum('ikm,ikm->m', A, A)**mesh.dim
+    singular = abs(det) <= 1e-10 * scale
+    ATA[singular] = numerix.identity(mesh.dim)
+    A = A * ~singular
+
+    r = points - cellCenters[..., cellIDs]
+    y = numerix.linalg.solve(ATA, r.swapaxes(0, 1)[..., numerix.newaxis])[..., 0]
+
+    # (K, M) weights of the neighbors
+    neighborWeights = numerix.einsum('ikm,mi->km', A, y)
+    cellWeights = 1. - numerix.sum(neighborWeights, axis=0)
+
+    ids = numerix.concatenate((cellIDs[numerix.newaxis], neighborIDs))
+    weights = numerix.concatenate((cellWeights[numerix.newaxis], neighborWeights))
+
+    return ids, weights
+
+class _Probe(object):
+    """Samples `CellVariable` objects at fixed points of a mesh
+
+    Created by `mesh.probe(points)`. The cells containing the points and
+    the interpolation weights are found once, so sampling again, e.g.,
+    after each time step, costs only a gather and a sum.
+
+        >>> from fipy import *
+        >>> m = Grid2D(dx=(1., 1., 1.), dy=(1., 1.))
+        >>> x, y = m.cellCenters
+        >>> v = CellVariable(mesh=m, value=x + 2 * y)
+        >>> probe = m.probe(((0.5, 1.25, 2.9), (0.5, 1.5, 1.)))
+        >>> print probe.cellIDs
+        [0 4 2]
+        >>> print probe(v)
+        [ 1.5   4.25  4.9 ]
+        >>> print m.probe(((0.5, 1.25, 2.9), (0.5, 1.5, 1.)), order=0)(v)
+        [ 1.5  4.5  3.5]
+        >>> v.setValue(x * y)
+        >>> print probe(v)
+        [ 0.25   1.875  2.7  ]
+
+    Vector variables are sampled one component at a time
+
+        >>> print probe(m.cellCenters)
+        [[ 0.5   1.25  2.9 ]
+         [ 0.5   1.5   1.  ]]
+
+    Points outside of the mesh are flagged and take the value of the
+    nearest cell
+
+        >>> probe = m.probe(((0.5, 5.), (0.5, 0.5)))
+        >>> print probe.inside
+        [ True False]
+        >>> print probe(v)
+        [ 0.25  1.25]
+
+    In parallel, points whose nearest cell belongs to another process are
+    flagged as not `local` and sample as NaN.
+
+        >>> print probe.local # doctest: +SERIAL
+        [ True  True]
+    """
+    def __init__(self, mesh, points, order=1):
+        self.mesh = mesh
+        self.points = numerix.array(points, dtype=float)
+
+        self.cellIDs, self.inside, self.local = _locateCells(mesh, self.points)
+
+        if order == 0:
+            self._ids = self.cellIDs[numerix.newaxis]
+            self._weights = numerix.ones(self._ids.shape)
+        elif order == 1:
+            self._ids, self._weights = _linearWeights(mesh, self.points, self.cellIDs)
+            # no extrapolation outside of the mesh
+            self._ids[1:, ~self.inside] = self.cellIDs[~self.inside]
+            self._weights[:, ~self.inside] = 0.
+            self._weights[0, ~self.inside] = 1.
+        else:
+            raise ValueError, 'order should be either 0 or 1'
+
+        # no sample where the point belongs to another process
+        self._weights[:, ~self.local] = numerix.nan
+
+    def __call__(self, var):
+        value = numerix.asarray(var.value)
+        return numerix.sum(value[..., self._ids] * self._weights, axis=-2)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -44,6 +44,7 @@ from fipy.tools import inline
 from fipy.tools import parallelComm
 
 from fipy.meshes.uniformGrid import UniformGrid
+from fipy.meshes.abstractMesh import _cachedMeshProperty
 from fipy.meshes.builders import _UniformGrid2DBuilder
 from fipy.meshes.builders import _Grid2DBuilder
 from fipy.meshes.representations.gridRepresentation import _Grid2DRepresentation
@@ -105,7 +106,7 @@ class UniformGrid2D(UniformGrid):
     Topology set and calc
     """
 
-    @property
+    @_cachedMeshProperty
     def _exteriorFaces(self):
         """
         Return only the faces that have one neighboring cell.
@@ -120,7 +121,7 @@ class UniformGrid2D(UniformGrid):
         exteriorFaces[exteriorIDs] = True
         return exteriorFaces
 
-    @property
+    @_cachedMeshProperty
     def _interiorFaces(self):
         """
         Return only the faces that have two neighboring cells.
@@ -141,7 +142,7 @@ class UniformGrid2D(UniformGrid):
         interiorFaces[interiorIDs] = True
         return interiorFaces
 
-    @property
+    @_cachedMeshProperty
     def _cellToFaceOrientations(self):
         cellFaceOrientations = numerix.ones((4, self.numberOfCells), 'l')
         if self.numberOfCells > 0:
@@ -151,7 +152,7 @@ class UniformGrid2D(UniformGrid):
         return cellFaceOrientations
 
     if inline.doInline:
-        @property
+        @_cachedMeshProperty
         def _adjacentCellIDs(self):
             faceCellIDs0 =  numerix.zeros(self.numberOfFaces, 'l')
             faceCellIDs1 =  numerix.zeros(self.numberOfFaces, 'l')
@@ -193,7 +194,7 @@ class UniformGrid2D(UniformGrid):
             return (faceCellIDs0, faceCellIDs1)
 
     else:
-        @property
+        @_cachedMeshProperty
         def _adjacentCellIDs(self):
             Hids = numerix.zeros((self.numberOfHorizontalRows, self.nx, 2), 'l')
             indices = numerix.indices((self.numberOfHorizontalRows, self.nx))
@@ -221,7 +222,7 @@ class UniformGrid2D(UniformGrid):
 
             return (faceCellIDs[:,0], faceCellIDs[:,1])
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellIDs(self):
         ids = MA.zeros((4, self.nx, self.ny), 'l')
         indices = numerix.indices((self.nx, self.ny))
@@ -239,7 +240,7 @@ class UniformGrid2D(UniformGrid):
 
         return MA.reshape(ids.swapaxes(1,2), (4, self.numberOfCells))
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellIDsFilled(self):
         N = self.numberOfCells
         M = self._maxFacesPerCell
@@ -256,7 +257,7 @@ class UniformGrid2D(UniformGrid):
         return self._areaProjections
 
     if inline.doInline:
-        @property
+        @_cachedMeshProperty
         def _areaProjections(self):
             areaProjections = numerix.zeros((2, self.numberOfFaces), 'd')
 
@@ -283,22 +284,22 @@ class UniformGrid2D(UniformGrid):
             return areaProjections
 
     else:
-        @property
+        @_cachedMeshProperty
         def _areaProjections(self):
             return self.faceNormals * self._faceAreas
 
-    @property
+    @_cachedMeshProperty
     def _faceAspectRatios(self):
         return self._faceAreas / self._cellDistances
 
-    @property
+    @_cachedMeshProperty
     def _faceAreas(self):
         faceAreas = numerix.zeros(self.numberOfFaces, 'd')
         faceAreas[:self.numberOfHorizontalFaces] = self.dx
         faceAreas[self.numberOfHorizontalFaces:] = self.dy
         return faceAreas
 
-    @property
+    @_cachedMeshProperty
     def faceNormals(self):
         normals = numerix.zeros((2, self.numberOfFaces), 'd')
 
@@ -311,11 +312,11 @@ class UniformGrid2D(UniformGrid):
 
         return normals
 
-    @property
+    @_cachedMeshProperty
     def _cellVolumes(self):
         return numerix.ones(self.numberOfCells, 'd') * self.dx * self.dy
 
-    @property
+    @_cachedMeshProperty
     def _cellCenters(self):
         centers = numerix.zeros((2, self.nx, self.ny), 'd')
         indices = numerix.indices((self.nx, self.ny))
@@ -325,7 +326,7 @@ class UniformGrid2D(UniformGrid):
                                order="FORTRAN") + self.origin
         return ccs
 
-    @property
+    @_cachedMeshProperty
     def _cellDistances(self):
         Hdis = numerix.repeat((self.dy,), self.numberOfHorizontalFaces)
         Hdis = numerix.reshape(Hdis, (self.nx, self.numberOfHorizontalRows))
@@ -342,7 +343,7 @@ class UniformGrid2D(UniformGrid):
         return numerix.concatenate((numerix.reshape(numerix.swapaxes(Hdis,0,1), (self.numberOfHorizontalFaces,)),
                                     numerix.reshape(numerix.swapaxes(Vdis,0,1), (self.numberOfFaces - self.numberOfHorizontalFaces,))))
 
-    @property
+    @_cachedMeshProperty
     def _faceToCellDistanceRatio(self):
         """how far face is from first to second cell
         
@@ -377,7 +378,7 @@ class UniformGrid2D(UniformGrid):
     _faceToCellDistances = property(_getFaceToCellDistances,
                                     _setFaceToCellDistances)
 
-    @property
+    @_cachedMeshProperty
     def _faceTangents1(self):
         tangents = numerix.zeros((2,self.numberOfFaces), 'd')
 
@@ -389,11 +390,11 @@ class UniformGrid2D(UniformGrid):
 
         return tangents
 
-    @property
+    @_cachedMeshProperty
     def _faceTangents2(self):
         return numerix.zeros((2, self.numberOfFaces), 'd')
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellDistances(self):
         distances = numerix.zeros((4, self.nx, self.ny), 'd')
         distances[0] = self.dy
@@ -411,7 +412,7 @@ class UniformGrid2D(UniformGrid):
         return distances.reshape((4, self.numberOfCells), order="FORTRAN")
 
 
-    @property
+    @_cachedMeshProperty
     def _cellNormals(self):
         normals = numerix.zeros((2, 4, self.numberOfCells), 'd')
         normals[:, 0] = [[ 0], [-1]]
@@ -421,7 +422,7 @@ class UniformGrid2D(UniformGrid):
 
         return normals
 
-    @property
+    @_cachedMeshProperty
     def _cellAreas(self):
         areas = numerix.ones((4, self.numberOfCells), 'd')
         areas[0] = self.dx
@@ -430,11 +431,11 @@ class UniformGrid2D(UniformGrid):
         areas[3] = self.dy
         return areas
 
-    @property
+    @_cachedMeshProperty
     def _cellAreaProjections(self):
         return self._cellAreas * self._cellNormals
 
-    @property
+    @_cachedMeshProperty
     def _faceCenters(self):
         Hcen = numerix.zeros((2, self.nx, self.numberOfHorizontalRows), 'd')
         indices = numerix.indices((self.nx, self.numberOfHorizontalRows))
@@ -474,7 +475,7 @@ class UniformGrid2D(UniformGrid):
         del args['origin']
         return NonUniformGrid2D(**args) + origin
 
-    @property
+    @_cachedMeshProperty
     def _cellFaceIDs(self):
         return _Grid2DBuilder.createCells(self.nx, self.ny,
                                           self.numberOfFaces,
@@ -485,7 +486,7 @@ class UniformGrid2D(UniformGrid):
     def _maxFacesPerCell(self):
         return 4
 
-    @property
+    @_cachedMeshProperty
     def vertexCoords(self):
         return _Grid2DBuilder.createVertices(self.nx, self.ny,
                                              self.dx, self.dy,
@@ -494,7 +495,7 @@ class UniformGrid2D(UniformGrid):
                  + self.origin
 
     if inline.doInline:
-        @property
+        @_cachedMeshProperty
         def faceCellIDs(self):
             faceCellIDs = numerix.zeros((2, self.numberOfFaces), 'l')
             mask = numerix.zeros((2, self.numberOfFaces), 'l')
@@ -537,7 +538,7 @@ class UniformGrid2D(UniformGrid):
 
             return MA.masked_where(mask, faceCellIDs)
     else:
-        @property
+        @_cachedMeshProperty
         def faceCellIDs(self):
             Hids = numerix.zeros((2, self.nx, self.numberOfHorizontalRows), 'l')
             indices = numerix.indices((self.nx, self.numberOfHorizontalRows))
@@ -564,7 +565,7 @@ class UniformGrid2D(UniformGrid):
     def _cellVertexIDs(self):
         return self._orderedCellVertexIDs
 
-    @property
+    @_cachedMeshProperty
     def faceVertexIDs(self):
         Hids = numerix.zeros((2, self.nx, self.numberOfHorizontalRows), 'l')
         indices = numerix.indices((self.nx, self.numberOfHorizontalRows))
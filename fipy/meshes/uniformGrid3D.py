@@ -38,6 +38,7 @@ from fipy.tools.numerix import MA
 from fipy.tools import parallelComm
 
 from fipy.meshes.uniformGrid import UniformGrid
+from fipy.meshes.abstractMesh import _cachedMeshProperty
 from fipy.meshes.builders import _UniformGrid3DBuilder
 from fipy.meshes.builders import _Grid3DBuilder
 from fipy.meshes.representations.gridRepresentation import _Grid3DRepresentation
@@ -115,7 +116,7 @@ class UniformGrid3D(UniformGrid):
     Topology set and calc
     """
 
-    @property
+    @_cachedMeshProperty
     def _exteriorFaces(self):
         """
         Return only the faces that have one neighboring cell.
@@ -136,7 +137,7 @@ class UniformGrid3D(UniformGrid):
         exteriorFaces[exteriorIDs] = True
         return exteriorFaces
 
-    @property
+    @_cachedMeshProperty
     def _interiorFaces(self):
         """
         Return only the faces that have two neighboring cells
@@ -154,18 +155,18 @@ class UniformGrid3D(UniformGrid):
         interiorFaces[interiorIDs] = True
         return interiorFaces
 
-    @property
+    @_cachedMeshProperty
     def _cellToFaceOrientations(self):
         tmp = numerix.take(self.faceCellIDs[0], self.cellFaceIDs)
         return (tmp == MA.indices(tmp.shape)[-1]) * 2 - 1
 
-    @property
+    @_cachedMeshProperty
     def _adjacentCellIDs(self):
         faceCellIDs = self.faceCellIDs
         return (MA.where(MA.getmaskarray(faceCellIDs[0]), faceCellIDs[1], faceCellIDs[0]).filled(),
                 MA.where(MA.getmaskarray(faceCellIDs[1]), faceCellIDs[0], faceCellIDs[1]).filled())
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellIDs(self):
         ids = MA.zeros((6, self.nx, self.ny, self.nz), 'l')
         indices = numerix.indices((self.nx, self.ny, self.nz))
@@ -191,7 +192,7 @@ class UniformGrid3D(UniformGrid):
 
         return MA.reshape(ids.swapaxes(1,3), (6, self.numberOfCells))
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellIDsFilled(self):
         N = self.numberOfCells
         M = self._maxFacesPerCell
@@ -203,13 +204,13 @@ class UniformGrid3D(UniformGrid):
     Geometry set and calc
     """
 
-    @property
+    @_cachedMeshProperty
     def _faceAreas(self):
         return numerix.concatenate((numerix.repeat((self.dx * self.dy,), self.numberOfXYFaces),
                                     numerix.repeat((self.dx * self.dz,), self.numberOfXZFaces),
                                     numerix.repeat((self.dy * self.dz,), self.numberOfYZFaces)))
 
-    @property
+    @_cachedMeshProperty
     def faceNormals(self):
         XYnor = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'l')
         XYnor[0,      ...] =  1
@@ -227,11 +228,11 @@ class UniformGrid3D(UniformGrid):
                                     numerix.reshape(XZnor[::-1].swapaxes(1,3), (3, self.numberOfXZFaces)),
                                     numerix.reshape(YZnor[::-1].swapaxes(1,3), (3, self.numberOfYZFaces))), axis=1)
 
-    @property
+    @_cachedMeshProperty
     def _cellVolumes(self):
         return numerix.ones(self.numberOfCells, 'd') * self.dx * self.dy * self.dz
 
-    @property
+    @_cachedMeshProperty
     def _cellCenters(self):
         centers = numerix.zeros((3, self.nx, self.ny, self.nz), 'd')
         indices = numerix.indices((self.nx, self.ny, self.nz))
@@ -241,7 +242,7 @@ class UniformGrid3D(UniformGrid):
         ccs = numerix.reshape(centers.swapaxes(1,3), (3, self.numberOfCells)) + self.origin
         return ccs
 
-    @property
+    @_cachedMeshProperty
     def _cellDistances(self):
         XYdis = numerix.zeros((self.nz + 1, self.ny, self.nx),'d')
         XYdis[:] = self.dz
@@ -262,7 +263,7 @@ class UniformGrid3D(UniformGrid):
                                     numerix.ravel(XZdis),
                                     numerix.ravel(YZdis)))
 
-    @property
+    @_cachedMeshProperty
     def _faceToCellDistanceRatio(self):
         """how far face is from first to second cell
         
@@ -292,7 +293,7 @@ class UniformGrid3D(UniformGrid):
     def _orientedFaceNormals(self):
         return self.faceNormals
 
-    @property
+    @_cachedMeshProperty
     def _faceTangents1(self):
         XYtan = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'l')
         XYtan[2,      ...] =  1
@@ -307,7 +308,7 @@ class UniformGrid3D(UniformGrid):
                                     numerix.reshape(XZtan[::-1].swapaxes(1,3), (3, self.numberOfXZFaces)),
                                     numerix.reshape(YZtan[::-1].swapaxes(1,3), (3, self.numberOfYZFaces))), axis=1)
 
-    @property
+    @_cachedMeshProperty
     def _faceTangents2(self):
         XYtan = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'l')
         XYtan[1,      ...] =  1
@@ -322,7 +323,7 @@ class UniformGrid3D(UniformGrid):
                                     numerix.reshape(XZtan[::-1].swapaxes(1,3), (3, self.numberOfXZFaces)),
                                     numerix.reshape(YZtan[::-1].swapaxes(1,3), (3, self.numberOfYZFaces))), axis=1)
 
-    @property
+    @_cachedMeshProperty
     def _cellToCellDistances(self):
         distances = numerix.zeros((6, self.nx, self.ny, self.nz), 'd')
         distances[0] = self.dx
@@ -341,7 +342,7 @@ class UniformGrid3D(UniformGrid):
 
         return numerix.reshape(distances.swapaxes(1,3), (6, self.numberOfCells))
 
-    @property
+    @_cachedMeshProperty
     def _cellNormals(self):
         normals = numerix.zeros((3, 6, self.numberOfCells), 'd')
         normals[...,0,...] = [[-1], [ 0], [ 0]]
@@ -353,7 +354,7 @@ class UniformGrid3D(UniformGrid):
 
         return normals
 
-    @property
+    @_cachedMeshProperty
     def _cellAreas(self):
         areas = numerix.ones((6, self.numberOfCells), 'd')
         areas[0] = self.dy * self.dz
@@ -364,13 +365,13 @@ class UniformGrid3D(UniformGrid):
         areas[5] = self.dx * self.dy
         return areas
 
-    @property
+    @_cachedMeshProperty
     def _cellAreaProjections(self):
         return self._cellAreas * self._cellNormals
 
 ##         from numMesh/mesh
 
-    @property
+    @_cachedMeshProperty
     def _faceCenters(self):
 
         XYcen = numerix.zeros((3, self.nx, self.ny, self.nz + 1), 'd')
@@ -399,11 +400,11 @@ class UniformGrid3D(UniformGrid):
     def _orientedAreaProjections(self):
         return self._areaProjections
 
-    @property
+    @_cachedMeshProperty
     def _areaProjections(self):
         return self.faceNormals * self._faceAreas
 
-    @property
+    @_cachedMeshProperty
     def _faceAspectRatios(self):
         return self._faceAreas / self._cellDistances
 
@@ -429,7 +430,7 @@ class UniformGrid3D(UniformGrid):
         del args['origin']
         return NonUniformGrid3D(**args) + origin
 
-    @property
+    @_cachedMeshProperty
     def _cellFaceIDs(self):
         return MA.array(_Grid3DBuilder.createCells(self.nx,
                                                    self.ny,
@@ -459,7 +460,7 @@ class UniformGrid3D(UniformGrid):
 
 ##         from numMesh/mesh
 
-    @property
+    @_cachedMeshProperty
     def vertexCoords(self):
         return _Grid3DBuilder.createVertices(self.dx, self.dy, self.dz,
                                              self.nx, self.ny, self.nz,
@@ -468,7 +469,7 @@ class UniformGrid3D(UniformGrid):
                                              self.numberOfVerticalColumns) \
                 + self.origin
 
-    @property
+    @_cachedMeshProperty
     def faceCellIDs(self):
         XYids = MA.zeros((2, self.nx, self.ny, self.nz + 1), 'l')
         indices = numerix.indices((self.nx, self.ny, self.nz + 1))
@@ -504,7 +505,7 @@ class UniformGrid3D(UniformGrid):
     def _cellVertexIDs(self):
         return self._orderedCellVertexIDs
 
-    @property
+    @_cachedMeshProperty
     def faceVertexIDs(self):
        return _Grid3DBuilder.createFaces(self.nx, self.ny, self.nz)[1]
 
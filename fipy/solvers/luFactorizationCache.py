@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+##
+ # -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "luFactorizationCache.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from fipy.tools import numerix
+
+class _LUFactorizationCache(object):
+    """
+    Holds the last LU factorization made by a `LinearLUSolver`.
+
+    The factorization is reused whenever the matrix to be factored has the
+    same structure and the same values as the matrix that produced it.
+
+    With `reuseFactorization`, the factorization is also reused when only
+    the values have changed, until it has served `refactorEvery` solves.
+    Such a stale factorization is no longer exact, but it remains a good
+    preconditioner for the iterative refinement done by the
+    `LinearLUSolver` when the operator changes slowly.
+
+        >>> calls = []
+        >>> def factorize():
+        ...     calls.append(None)
+        ...     return len(calls)
+        >>> structure = (numerix.array((0, 1, 2)),)
+
+        >>> cache = _LUFactorizationCache()
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 2.)),))
+        (1, False)
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 2.)),))
+        (1, False)
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 3.)),))
+        (2, False)
+
+        >>> cache = _LUFactorizationCache(reuseFactorization=True, refactorEvery=2)
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 2.)),))
+        (3, False)
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 3.)),))
+        (3, True)
+        >>> print cache.factorize(factorize, structure, (numerix.array((1., 4.)),))
+        (4, False)
+        >>> print cache.factorize(factorize, (numerix.array((0, 2)),), (numerix.array((1.,)),))
+        (5, False)
+    """
+
+    def __init__(self, reuseFactorization=False, refactorEvery=None):
+        """
+        :Parameters:
+          - `reuseFactorization`: Whether to reuse a factorization for a
+            matrix with the same structure but different values.
+          - `refactorEvery`: The number of solves after which a reused
+            factorization is discarded. `None` keeps it indefinitely.
+        """
+        self.reuseFactorization = reuseFactorization
+        self.refactorEvery = refactorEvery
+        self.clear()
+
+    def clear(self):
+        self.LU = None
+        self.structure = None
+        self.values = None
+        self.uses = 0
+
+    @staticmethod
+    def _equal(arrays, others):
+        if arrays is None or len(arrays) != len(others):
+            return False
+
+        for a, b in zip(arrays, others):
+            if not numerix.array_equal(a, b):
+                return False
+
+        return True
+
+    def factorize(self, factorize, structure, values, comm=None):
+        """Return an LU factorization for the matrix described by
+        `structure` and `values`, and whether it is stale.
+
+        :Parameters:
+          - `factorize`: A function of no arguments returning a new
+            factorization of the matrix.
+          - `structure`: A `tuple` of arrays describing the sparsity
+            pattern of the matrix.
+          - `values`: A `tuple` of arrays holding the matrix entries.
+          - `comm`: The communicator used to agree on reuse in parallel.
+        """
+        sameStructure = self._equal(self.structure, structure)
+        same = sameStructure and self._equal(self.values, values)
+        stale = (sameStructure and not same and self.reuseFactorization
+                 and (self.refactorEvery is None or self.uses < self.refactorEvery))
+
+        if comm is not None:
+            same = comm.all(numerix.array(same))
+            stale = comm.all(numerix.array(stale))
+
+        if same or stale:
+            self.uses += 1
+        else:
+            self.LU = factorize()
+            self.structure = structure
+            self.values = values
+            self.uses = 1
+
+        return (self.LU, bool(stale))
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -39,6 +39,7 @@ import os
 from pysparse import superlu
 
 from fipy.solvers.pysparse.pysparseSolver import PysparseSolver
+from fipy.solvers.luFactorizationCache import _LUFactorizationCache
 from fipy.tools import numerix
 
 DEBUG = False
@@ -55,12 +56,16 @@ class LinearLUSolver(PysparseSolver):
     The `LinearLUSolver` is a wrapper class for the the PySparse_
     `superlu.factorize()` method.
 
+    The factorization is kept and reused as long as the matrix does not
+    change.
+
     .. _PySparse: http://pysparse.sourceforge.net
 
     """
 
     def __init__(self, tolerance=1e-10, iterations=10,
-                       maxIterations=10, precon=None):
+                       maxIterations=10, precon=None,
+                       reuseFactorization=False, refactorEvery=None):
         """
         Creates a `LinearLUSolver`.
 
@@ -69,6 +74,10 @@ class LinearLUSolver(PysparseSolver):
           - `iterations`: The number of LU decompositions to perform.
             For large systems a number of iterations is generally required.
           - `precon`: not used but maintains a common interface.
+          - `reuseFactorization`: Reuse the previous factorization when only
+            the values of the matrix have changed.
+          - `refactorEvery`: The number of solves a reused factorization
+            serves before the matrix is factored again.
 
         """
 
@@ -77,31 +86,53 @@ class LinearLUSolver(PysparseSolver):
         super(LinearLUSolver, self).__init__(tolerance = tolerance,
                                              iterations = iterations)
 
-    def _solve_(self, L, x, b):
-        diag = L.takeDiagonal()
-        maxdiag = max(numerix.absolute(diag))
+        self._factorizations = _LUFactorizationCache(reuseFactorization=reuseFactorization,
+                                                     refactorEvery=refactorEvery)
 
-        L = L * (1 / maxdiag)
-        b = b * (1 / maxdiag)
+    def _factorize(self, L):
+        val, irow, jcol = L.matrix.find()
 
-        LU = superlu.factorize(L.matrix.to_csr())
-
-        if DEBUG:
-            import sys
-            print >> sys.stderr, L.matrix
+        return self._factorizations.factorize(lambda: superlu.factorize(L.matrix.to_csr()),
+                                              structure=(irow, jcol),
+                                              values=(val,))
 
+    def _refine(self, L, x, b, LU):
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
+        converged = False
         for iteration in range(self.iterations):
             errorVector = L * x - b
 
             if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
+                converged = True
                 break
 
             xError = numerix.zeros(len(b),'d')
             LU.solve(errorVector, xError)
             x[:] = x - xError
 
+        return iteration, errorVector, converged
+
+    def _solve_(self, L, x, b):
+        diag = L.takeDiagonal()
+        maxdiag = max(numerix.absolute(diag))
+
+        L = L * (1 / maxdiag)
+        b = b * (1 / maxdiag)
+
+        LU, stale = self._factorize(L)
+
+        if DEBUG:
+            import sys
+            print >> sys.stderr, L.matrix
+
+        iteration, errorVector, converged = self._refine(L, x, b, LU)
+
+        if stale and not converged:
+            self._factorizations.clear()
+            LU, stale = self._factorize(L)
+            iteration, errorVector, converged = self._refine(L, x, b, LU)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration+1, self.iterations))
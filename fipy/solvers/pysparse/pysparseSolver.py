@@ -37,6 +37,7 @@ __docformat__ = 'restructuredtext'
 
 import os
 from fipy.solvers.pysparseMatrixSolver import _PysparseMatrixSolver
+from fipy.tools import profiling
 
 __all__ = ["PysparseSolver"]
 
@@ -77,6 +78,8 @@ class PysparseSolver(_PysparseMatrixSolver):
 
         self._raiseWarning(info, iter, relres)
 
+        profiling._report(iterations=iter, residual=relres)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iter, self.iterations))
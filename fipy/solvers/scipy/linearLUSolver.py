@@ -39,7 +39,9 @@ import os
 from scipy.sparse.linalg import splu
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.solvers.luFactorizationCache import _LUFactorizationCache
 from fipy.tools import numerix
+from fipy.tools import profiling
 
 __all__ = ["LinearLUSolver"]
 
@@ -48,35 +50,117 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorisation.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` moduleq.
-    """
-
-    def _solve_(self, L, x, b):
-        diag = L.takeDiagonal()
-        maxdiag = max(numerix.absolute(diag))
 
-        L = L * (1 / maxdiag)
-        b = b * (1 / maxdiag)
-
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            drop_tol=0.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+    The factorization is kept and reused as long as the matrix does not
+    change.
+
+        >>> from fipy import Grid1D, CellVariable, TransientTerm, DiffusionTerm
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m, value=0.)
+        >>> v.constrain(1., where=m.facesLeft)
+        >>> solver = LinearLUSolver()
+        >>> eq = TransientTerm() == DiffusionTerm()
+        >>> eq.solve(v, dt=1., solver=solver)
+        >>> LU = solver._factorizations.LU
+        >>> eq.solve(v, dt=1., solver=solver)
+        >>> print solver._factorizations.LU is LU
+        True
+        >>> eq.solve(v, dt=2., solver=solver)
+        >>> print solver._factorizations.LU is LU
+        False
+
+    With `reuseFactorization`, a factorization of a matrix with the same
+    structure is reused, even though it is no longer exact.
+
+        >>> solver = LinearLUSolver(reuseFactorization=True, refactorEvery=10)
+        >>> w = CellVariable(mesh=m, value=0.)
+        >>> w.constrain(1., where=m.facesLeft)
+        >>> eq.solve(w, dt=1., solver=solver)
+        >>> LU = solver._factorizations.LU
+        >>> eq.solve(w, dt=1.1, solver=solver)
+        >>> print solver._factorizations.LU is LU
+        True
+        >>> v.setValue(0.)
+        >>> w.setValue(0.)
+        >>> eq.solve(v, dt=1.1, solver=LinearLUSolver())
+        >>> eq.solve(w, dt=1.1, solver=solver)
+        >>> print numerix.allclose(v, w)
+        True
+    """
 
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=None,
+                 reuseFactorization=False, refactorEvery=None):
+        """
+        :Parameters:
+          - `tolerance`: The required error tolerance.
+          - `iterations`: The maximum number of iterative refinements to perform.
+          - `precon`: not used but maintains a common interface.
+          - `reuseFactorization`: Reuse the previous factorization when only
+            the values of the matrix have changed.
+          - `refactorEvery`: The number of solves a reused factorization
+            serves before the matrix is factored again.
+
+        """
+        _ScipySolver.__init__(self, tolerance=tolerance, iterations=iterations, precon=precon)
+        self._factorizations = _LUFactorizationCache(reuseFactorization=reuseFactorization,
+                                                     refactorEvery=refactorEvery)
+
+    def _factorize(self, L):
+        A = L.matrix.asformat("csc")
+
+        return self._factorizations.factorize(lambda: splu(A, diag_pivot_thresh=1.,
+                                                              drop_tol=0.,
+                                                              relax=1,
+                                                              panel_size=10,
+                                                              permc_spec=3),
+                                              structure=(A.shape, A.indptr, A.indices),
+                                              values=(A.data,))
+
+    def _refine(self, L, x, b, LU):
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
+        converged = False
         for iteration in range(min(self.iterations, 10)):
             errorVector = L * x - b
 
             if (numerix.sqrt(numerix.sum(errorVector**2)) / error0)  <= self.tolerance:
+                converged = True
                 break
 
             xError = LU.solve(errorVector)
             x[:] = x - xError
 
+        return iteration, errorVector, converged
+
+    def _solve_(self, L, x, b):
+        diag = L.takeDiagonal()
+        maxdiag = max(numerix.absolute(diag))
+
+        L = L * (1 / maxdiag)
+        b = b * (1 / maxdiag)
+
+        LU, stale = self._factorize(L)
+        iteration, errorVector, converged = self._refine(L, x, b, LU)
+
+        if stale and not converged:
+            self._factorizations.clear()
+            LU, stale = self._factorize(L)
+            iteration, errorVector, converged = self._refine(L, x, b, LU)
+
+        if profiling._isActive():
+            profiling._report(iterations=iteration + 1,
+                              residual=numerix.sqrt(numerix.sum(errorVector**2)))
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration+1, self.iterations))
             PRINT('residual:', numerix.sqrt(numerix.sum(errorVector**2)))
 
         return x
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
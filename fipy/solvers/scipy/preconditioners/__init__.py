@@ -0,0 +1,4 @@
+from fipy.solvers.scipy.preconditioners.jacobiPreconditioner import *
+
+__all__ = []
+__all__.extend(jacobiPreconditioner.__all__)
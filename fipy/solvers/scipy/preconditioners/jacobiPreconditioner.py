@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "jacobiPreconditioner.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #
+ # ###################################################################
+ ##
+
+
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator
+
+from fipy.tools import numerix
+
+__all__ = ["JacobiPreconditioner"]
+
+class JacobiPreconditioner(object):
+    """
+    Jacobi Preconditioner for the scipy Krylov solvers.
+
+        >>> from fipy import Grid2D, CellVariable, DiffusionTerm
+        >>> from fipy.solvers.scipy import LinearPCGSolver, LinearLUSolver
+        >>> m = Grid2D(nx=10, ny=10)
+        >>> v = CellVariable(mesh=m, value=0.)
+        >>> v.constrain(1., where=m.facesLeft)
+        >>> v.constrain(0., where=m.facesRight)
+        >>> solver = LinearPCGSolver(tolerance=1e-12, precon=JacobiPreconditioner())
+        >>> (DiffusionTerm(coeff=1. + m.x)).solve(v, solver=solver)
+        >>> w = CellVariable(mesh=m, value=0.)
+        >>> w.constrain(1., where=m.facesLeft)
+        >>> w.constrain(0., where=m.facesRight)
+        >>> (DiffusionTerm(coeff=1. + m.x)).solve(w, solver=LinearLUSolver())
+        >>> print numerix.allclose(v, w)
+        True
+
+    """
+
+    def _applyToMatrix(self, A):
+        diagonal = numerix.array(A.diagonal())
+        diagonal[diagonal == 0] = 1.
+        return LinearOperator(A.shape, matvec=lambda x: x / diagonal, dtype='d')
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -41,6 +41,8 @@ __all__ = []
 import os
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.tools import numerix
+from fipy.tools import profiling
 
 class _ScipyKrylovSolver(_ScipySolver):
     """
@@ -56,10 +58,22 @@ class _ScipyKrylovSolver(_ScipySolver):
         else:
             M = self.preconditioner._applyToMatrix(A)
 
+        if profiling._isActive():
+            iterations = [0]
+            def callback(xk):
+                iterations[0] += 1
+        else:
+            callback = None
+
         x, info = self.solveFnc(A, b, x,
                                 tol=self.tolerance,
                                 maxiter=self.iterations,
-                                M=M)
+                                M=M,
+                                callback=callback)
+
+        if callback is not None:
+            profiling._report(iterations=iterations[0],
+                              residual=numerix.L2norm(b - A * x) / numerix.L2norm(b))
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             if info < 0:
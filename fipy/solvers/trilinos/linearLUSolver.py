@@ -41,6 +41,7 @@ from PyTrilinos import Epetra
 from PyTrilinos import Amesos
 
 from fipy.solvers.trilinos.trilinosSolver import TrilinosSolver
+from fipy.solvers.luFactorizationCache import _LUFactorizationCache
 
 __all__ = ["LinearLUSolver"]
 
@@ -49,13 +50,21 @@ class LinearLUSolver(TrilinosSolver):
     """
     The `LinearLUSolver` is an interface to the Amesos KLU solver in Trilinos.
 
+    The factorization is kept and reused as long as the matrix does not
+    change.
+
     """
 
-    def __init__(self, tolerance=1e-10, iterations=10, precon=None, maxIterations=10):
+    def __init__(self, tolerance=1e-10, iterations=10, precon=None, maxIterations=10,
+                 reuseFactorization=False, refactorEvery=None):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
+          - `reuseFactorization`: Reuse the previous factorization when only
+            the values of the matrix have changed.
+          - `refactorEvery`: The number of solves a reused factorization
+            serves before the matrix is factored again.
 
         """
 
@@ -69,10 +78,31 @@ class LinearLUSolver(TrilinosSolver):
             warnings.warn("Trilinos KLU solver does not accept preconditioners.",
                            UserWarning, stacklevel=2)
         self.Factory = Amesos.Factory()
-
-
-    def _solve_(self, L, x, b):
-
+        self._factorizations = _LUFactorizationCache(reuseFactorization=reuseFactorization,
+                                                     refactorEvery=refactorEvery)
+
+    def _factorize(self, L):
+        def factorize():
+            xError = Epetra.Vector(L.RowMap())
+            errorVector = Epetra.Vector(L.RangeMap())
+            Problem = Epetra.LinearProblem(L, xError, errorVector)
+            Solver = self.Factory.Create("Klu", Problem)
+            Solver.SymbolicFactorization()
+            Solver.NumericFactorization()
+            # keep the initial vectors alive as long as Problem refers to them
+            return (Problem, Solver, xError, errorVector)
+
+        rowptr, colind, values = L.ExtractCrsDataPointers()
+
+        return self._factorizations.factorize(factorize,
+                                              structure=(rowptr.copy(), colind.copy()),
+                                              values=(values.copy(),),
+                                              comm=self.var.mesh.communicator)
+
+    def _refine(self, L, x, b, LU):
+        Problem, Solver = LU[:2]
+
+        converged = False
         for iteration in range(self.iterations):
              # errorVector = L*x - b
              errorVector = Epetra.Vector(L.RangeMap())
@@ -89,16 +119,29 @@ class LinearLUSolver(TrilinosSolver):
                  tol0 = tol
 
              if (tol / tol0) <= self.tolerance:
+                 converged = True
                  break
 
              xError = Epetra.Vector(L.RowMap())
 
-             Problem = Epetra.LinearProblem(L, xError, errorVector)
-             Solver = self.Factory.Create("Klu", Problem)
+             Problem.SetLHS(xError)
+             Problem.SetRHS(errorVector)
              Solver.Solve()
 
              x[:] = x - xError
 
+        return iteration, errorVector, converged
+
+    def _solve_(self, L, x, b):
+
+        LU, stale = self._factorize(L)
+        iteration, errorVector, converged = self._refine(L, x, b, LU)
+
+        if stale and not converged:
+            self._factorizations.clear()
+            LU, stale = self._factorize(L)
+            iteration, errorVector, converged = self._refine(L, x, b, LU)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
             PRINT('iterations: %d / %d' % (iteration + 1, self.iterations))
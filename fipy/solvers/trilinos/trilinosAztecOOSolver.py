@@ -40,6 +40,7 @@ import os
 from PyTrilinos import AztecOO
 
 from fipy.solvers.trilinos.trilinosSolver import TrilinosSolver
+from fipy.tools import profiling
 from fipy.solvers.trilinos.preconditioners.jacobiPreconditioner import JacobiPreconditioner
 
 __all__ = ["TrilinosAztecOOSolver"]
@@ -82,6 +83,11 @@ class TrilinosAztecOOSolver(TrilinosSolver):
 
         output = Solver.Iterate(self.iterations, self.tolerance)
 
+        if profiling._isActive():
+            status = Solver.GetAztecStatus()
+            profiling._report(iterations=int(status[AztecOO.AZ_its]),
+                              residual=status[AztecOO.AZ_scaled_r])
+
         if self.preconditioner is not None:
             if hasattr(self.preconditioner, 'Prec'):
                 del self.preconditioner.Prec
@@ -192,6 +192,29 @@ class _AbstractConvectionTerm(FaceTerm):
 
 ##        if var.rank != 1:
 
+        self._calcConstraints_(var, transientGeomCoeff, diffusionGeomCoeff)
+
+        ids = self._reshapeIDs(var, numerix.arange(var.mesh.numberOfCells))
+        L.addAt(numerix.array(self.constraintL).ravel(), ids.ravel(), ids.swapaxes(0,1).ravel())
+        b += numerix.reshape(self.constraintB.value, ids.shape).sum(0).ravel()
+
+        return (var, L, b)
+
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        if self._vectorSize(var) > 1:
+            return FaceTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt,
+                                           transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        b = FaceTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        self._calcConstraints_(var, transientGeomCoeff, diffusionGeomCoeff)
+
+        b += numerix.array(self.constraintB).ravel()
+        b -= numerix.array(self.constraintL).ravel() * var.value.ravel()
+
+        return b
+
+    def _calcConstraints_(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
         mesh = var.mesh
 
         if (not hasattr(self, 'constraintL')) or (not hasattr(self, 'constraintB')):
@@ -210,12 +233,6 @@ class _AbstractConvectionTerm(FaceTerm):
             self.constraintL = (alpha * constraintMask * exteriorCoeff).divergence * mesh.cellVolumes
             self.constraintB =  -((1 - alpha) * var.arithmeticFaceValue * constraintMask * exteriorCoeff).divergence * mesh.cellVolumes
 
-        ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
-        L.addAt(numerix.array(self.constraintL).ravel(), ids.ravel(), ids.swapaxes(0,1).ravel())
-        b += numerix.reshape(self.constraintB.value, ids.shape).sum(0).ravel()
-
-        return (var, L, b)
-
 class __ConvectionTerm(_AbstractConvectionTerm):
     """
     Dummy subclass for tests
@@ -40,6 +40,7 @@ import os
 
 from fipy.terms.unaryTerm import _UnaryTerm
 from fipy.tools import numerix
+from fipy.tools import vector
 from fipy.terms import TermMultiplyError
 from fipy.terms import AbstractBaseClassError
 from fipy.variables.faceVariable import FaceVariable
@@ -267,7 +268,7 @@ class _AbstractDiffusionTerm(_UnaryTerm):
         boundaryB += bb
 
     def __doBCs(self, SparseMatrix, higherOrderBCs, N, M, coeffs, coefficientMatrix, boundaryB):
-        for boundaryCondition in higherOrderBCs:
+        for boundaryCondition in self._batchBoundaryConditions(higherOrderBCs):
             LL, bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffs)
             if 'FIPY_DISPLAY_MATRIX' in os.environ:
                 self._viewer.title = r"%s %s" % (boundaryCondition.__class__.__name__, self.__class__.__name__)
@@ -320,40 +321,43 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         if self.order == 2:
 
-            if (not hasattr(self, 'constraintL')) or (not hasattr(self, 'constraintB')):
+            self.__calcConstraints(var)
 
-                normals = FaceVariable(mesh=mesh, rank=1, value=mesh._orientedFaceNormals)
+            ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
+            L.addAt(self.constraintL.ravel(), ids.ravel(), ids.swapaxes(0,1).ravel())
+            b += numerix.reshape(self.constraintB.ravel(), ids.shape).sum(-2).ravel()
 
-                if len(var.shape) == 1 and len(self.nthCoeff.shape) > 1:
-                    nthCoeffFaceGrad = var.faceGrad.dot(self.nthCoeff)
-                    normalsNthCoeff =  normals.dot(self.nthCoeff)
-                else:
+        return (var, L, b)
+
+    def __calcConstraints(self, var):
+        mesh = var.mesh
 
-                    if self.nthCoeff.shape != () and not isinstance(self.nthCoeff, FaceVariable):
-                        coeff = self.nthCoeff[...,numerix.newaxis]
-                    else:
-                        coeff = self.nthCoeff
+        if (not hasattr(self, 'constraintL')) or (not hasattr(self, 'constraintB')):
 
-                    nthCoeffFaceGrad = coeff[numerix.newaxis] * var.faceGrad[:,numerix.newaxis]
-                    s = (slice(0,None,None),) + (numerix.newaxis,) * (len(coeff.shape) - 1) + (slice(0,None,None),)
-                    normalsNthCoeff = coeff[numerix.newaxis] * normals[s]
+            normals = FaceVariable(mesh=mesh, rank=1, value=mesh._orientedFaceNormals)
 
-                self.constraintB = -(var.faceGrad.constraintMask * nthCoeffFaceGrad).divergence * mesh.cellVolumes
+            if len(var.shape) == 1 and len(self.nthCoeff.shape) > 1:
+                nthCoeffFaceGrad = var.faceGrad.dot(self.nthCoeff)
+                normalsNthCoeff =  normals.dot(self.nthCoeff)
+            else:
 
-                constrainedNormalsDotCoeffOverdAP = var.arithmeticFaceValue.constraintMask * \
-                                                    normalsNthCoeff / mesh._cellDistances
+                if self.nthCoeff.shape != () and not isinstance(self.nthCoeff, FaceVariable):
+                    coeff = self.nthCoeff[...,numerix.newaxis]
+                else:
+                    coeff = self.nthCoeff
 
-                self.constraintB -= (constrainedNormalsDotCoeffOverdAP * var.arithmeticFaceValue).divergence * mesh.cellVolumes
+                nthCoeffFaceGrad = coeff[numerix.newaxis] * var.faceGrad[:,numerix.newaxis]
+                s = (slice(0,None,None),) + (numerix.newaxis,) * (len(coeff.shape) - 1) + (slice(0,None,None),)
+                normalsNthCoeff = coeff[numerix.newaxis] * normals[s]
 
-                ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
+            self.constraintB = -(var.faceGrad.constraintMask * nthCoeffFaceGrad).divergence * mesh.cellVolumes
 
-                self.constraintL = -constrainedNormalsDotCoeffOverdAP.divergence * mesh.cellVolumes
+            constrainedNormalsDotCoeffOverdAP = var.arithmeticFaceValue.constraintMask * \
+                                                normalsNthCoeff / mesh._cellDistances
 
-            ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
-            L.addAt(self.constraintL.ravel(), ids.ravel(), ids.swapaxes(0,1).ravel())
-            b += numerix.reshape(self.constraintB.ravel(), ids.shape).sum(-2).ravel()
+            self.constraintB -= (constrainedNormalsDotCoeffOverdAP * var.arithmeticFaceValue).divergence * mesh.cellVolumes
 
-        return (var, L, b)
+            self.constraintL = -constrainedNormalsDotCoeffOverdAP.divergence * mesh.cellVolumes
 
     def __higherOrderbuildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         mesh = var.mesh
@@ -412,26 +416,7 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         elif self.order == 2:
 
-            if not hasattr(self, 'coeffDict'):
-
-                coeff = self._getGeomCoeff(var)
-                minusCoeff = -coeff[0]
-
-                coeff[0].dontCacheMe()
-                minusCoeff.dontCacheMe()
-
-                self.coeffDict = {
-                    'cell 1 diag':    minusCoeff,
-                    'cell 1 offdiag':  coeff[0]
-                    }
-
-                self.coeffDict['cell 2 offdiag'] = self.coeffDict['cell 1 offdiag']
-                self.coeffDict['cell 2 diag'] = self.coeffDict['cell 1 diag']
-
-                self.__calcAnisotropySource(coeff, mesh, var)
-
-                del coeff
-                del minusCoeff
+            self.__calcSecondOrderCoeffDict(var)
 
             higherOrderBCs, lowerOrderBCs = self.__getBoundaryConditions(boundaryConditions)
             del lowerOrderBCs
@@ -453,6 +438,73 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         return (var, L, b)
 
+    def __calcSecondOrderCoeffDict(self, var):
+        if not hasattr(self, 'coeffDict'):
+
+            coeff = self._getGeomCoeff(var)
+            minusCoeff = -coeff[0]
+
+            coeff[0].dontCacheMe()
+            minusCoeff.dontCacheMe()
+
+            self.coeffDict = {
+                'cell 1 diag':    minusCoeff,
+                'cell 1 offdiag':  coeff[0]
+                }
+
+            self.coeffDict['cell 2 offdiag'] = self.coeffDict['cell 1 offdiag']
+            self.coeffDict['cell 2 diag'] = self.coeffDict['cell 1 diag']
+
+            self.__calcAnisotropySource(coeff, var.mesh, var)
+
+            del coeff
+            del minusCoeff
+
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Apply the second-order stencil to `var` as face fluxes
+
+        Higher orders and coupled variables fall back to building
+        the matrix.
+        """
+        if self.order != 2 or self._vectorSize(var) > 1:
+            return _UnaryTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt,
+                                             transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        mesh = var.mesh
+
+        self.__calcSecondOrderCoeffDict(var)
+
+        id1, id2 = mesh._adjacentCellIDs
+        interiorFaces = numerix.nonzero(mesh.interiorFaces)[0]
+
+        id1 = numerix.take(id1, interiorFaces)
+        id2 = numerix.take(id2, interiorFaces)
+
+        value = var.value.ravel()
+        interiorCoeff = numerix.take(self.coeffDict['cell 1 offdiag'], interiorFaces, axis=-1).ravel()
+        flux = interiorCoeff * (numerix.take(value, id2) - numerix.take(value, id1))
+
+        b = numerix.zeros(len(value), 'd')
+        vector.putAdd(b, id1, -flux)
+        vector.putAdd(b, id2, flux)
+
+        higherOrderBCs, lowerOrderBCs = self.__getBoundaryConditions(boundaryConditions)
+        for boundaryCondition in self._batchBoundaryConditions(higherOrderBCs):
+            LL, bb = boundaryCondition._buildMatrix(SparseMatrix, mesh.numberOfCells, mesh._maxFacesPerCell, self.coeffDict)
+            if LL != 0:
+                b -= LL * value
+            b += bb
+
+        if hasattr(self, 'anisotropySource'):
+            b -= self.anisotropySource
+
+        self.__calcConstraints(var)
+
+        b += numerix.array(self.constraintB).ravel()
+        b -= numerix.array(self.constraintL).ravel() * value
+
+        return b
+
     def _getDiffusionGeomCoeff(self, var):
         if var is self.var or self.var is None:
             return self._getGeomCoeff(var)
@@ -203,20 +203,21 @@ class AdvectionTerm(FirstOrderAdvectionTerm):
     The maximum error is 2 % when using a higher order contribution.
 
     """
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cells):
 
-        dAP = mesh._cellToCellDistances
+        dAP = mesh._cellToCellDistances[..., cells]
+        cellNormals = mesh._cellNormals[..., cells]
 
 ##        adjacentGradient = numerix.take(oldArray.grad, cellToCellIDs)
-        adjacentGradient = numerix.take(oldArray.grad, mesh._cellToCellIDs, axis=-1)
-        adjacentNormalGradient = numerix.dot(adjacentGradient, mesh._cellNormals)
+        adjacentGradient = numerix.take(oldArray.grad, mesh._cellToCellIDs[..., cells], axis=-1)
+        adjacentNormalGradient = numerix.dot(adjacentGradient, cellNormals)
         adjacentUpValues = cellValues + 2 * dAP * adjacentNormalGradient
 
-        cellIDs = numerix.repeat(numerix.arange(mesh.numberOfCells)[numerix.newaxis, ...],
+        cellIDs = numerix.repeat(numerix.arange(mesh.numberOfCells)[numerix.newaxis, cells],
                 mesh._maxFacesPerCell, axis=0)
-        cellIDs = MA.masked_array(cellIDs, mask = MA.getmask(mesh._cellToCellIDs))
+        cellIDs = MA.masked_array(cellIDs, mask = MA.getmask(mesh._cellToCellIDs[..., cells]))
         cellGradient = numerix.take(oldArray.grad, cellIDs, axis=-1)
-        cellNormalGradient = numerix.dot(cellGradient, mesh._cellNormals)
+        cellNormalGradient = numerix.dot(cellGradient, cellNormals)
         cellUpValues = adjacentValues - 2 * dAP * cellNormalGradient
 
         cellLaplacian = (cellUpValues + adjacentValues - 2 * cellValues) / dAP**2
@@ -231,7 +232,7 @@ class AdvectionTerm(FirstOrderAdvectionTerm):
                                          adjacentLaplacian,
                                          cellLaplacian))
 
-        return FirstOrderAdvectionTerm._getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh) -  mm * dAP / 2.
+        return FirstOrderAdvectionTerm._getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cells) -  mm * dAP / 2.
 
 class __AdvectionTerm(FirstOrderAdvectionTerm):
     """
@@ -164,6 +164,18 @@ class CellTerm(_NonDiffusionTerm):
 
         return (var, L, b)
 
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        coeffVectors = self._getCoeffVectors_(var=var, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        dt = self._checkDt(dt)
+
+        b = (var.old.value[numerix.newaxis] * coeffVectors['old value']).sum(-2).ravel() / dt
+        b += coeffVectors['b vector'][numerix.newaxis].sum(-2).ravel()
+        diagonal = coeffVectors['new value'] / dt + coeffVectors['diagonal']
+        b -= (var.value[numerix.newaxis] * diagonal).sum(-2).ravel()
+
+        return b
+
     def _test(self):
         """
         The following tests demonstrate how the `CellVariable` objects
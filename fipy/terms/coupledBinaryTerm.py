@@ -108,9 +108,14 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
             SparseMatrix.equationIndex = equationIndex
             termRHSvector = 0
             termMatrix = SparseMatrix(mesh=var.mesh)
+            coupledVars = self._coupledVars(uncoupledTerm, buildExplicitIfOther)
 
             for varIndex, tmpVar in enumerate(var.vars):
 
+                if coupledVars is not None and id(tmpVar) not in coupledVars:
+                    # this block of the matrix is empty
+                    continue
+
                 SparseMatrix.varIndex = varIndex
 
                 tmpVar, tmpMatrix, tmpRHSvector = uncoupledTerm._buildAndAddMatrices(tmpVar,
@@ -130,6 +135,58 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
 
         return (var, matrix, _CoupledCellVariable(RHSvectors))
 
+    @staticmethod
+    def _coupledVars(uncoupledTerm, buildExplicitIfOther):
+        """The ids of the variables that `uncoupledTerm` builds a matrix or
+        RHS vector for, or `None` if it may build for any variable.
+
+        Any other variable only gets an empty matrix and a zero RHS
+        vector, so its block need not be built.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> v0 = CellVariable(mesh=m, value=1.)
+        >>> v1 = CellVariable(mesh=m, value=2.)
+        >>> v2 = CellVariable(mesh=m, value=3.)
+        >>> eq0 = TransientTerm(var=v0) == DiffusionTerm(var=v0) + ImplicitSourceTerm(coeff=-1., var=v1)
+        >>> eq1 = TransientTerm(var=v1) == DiffusionTerm(var=v1) + 1.
+        >>> eq2 = TransientTerm(var=v2) == DiffusionTerm(var=v2) + ImplicitSourceTerm(coeff=-1., var=v0)
+        >>> eq = eq0 & eq1 & eq2
+        >>> print [[id(v) in _CoupledBinaryTerm._coupledVars(term, False) for v in eq._vars]
+        ...        for term in eq._uncoupledTerms]
+        [[True, True, False], [False, True, False], [True, False, True]]
+        >>> print _CoupledBinaryTerm._coupledVars(eq._uncoupledTerms[0], True)
+        None
+
+        Skipping the empty blocks doesn't change the solution
+
+        >>> eq.cacheMatrix()
+        >>> eq.cacheRHSvector()
+        >>> eq.solve(dt=1.)
+        >>> print numerix.allclose(eq.matrix.numpyArray,
+        ...                        [[ 2., -1.,  0.,  1.,  0.,  0.,  0.,  0.,  0.],
+        ...                         [-1.,  3., -1.,  0.,  1.,  0.,  0.,  0.,  0.],
+        ...                         [ 0., -1.,  2.,  0.,  0.,  1.,  0.,  0.,  0.],
+        ...                         [ 0.,  0.,  0.,  2., -1.,  0.,  0.,  0.,  0.],
+        ...                         [ 0.,  0.,  0., -1.,  3., -1.,  0.,  0.,  0.],
+        ...                         [ 0.,  0.,  0.,  0., -1.,  2.,  0.,  0.,  0.],
+        ...                         [ 1.,  0.,  0.,  0.,  0.,  0.,  2., -1.,  0.],
+        ...                         [ 0.,  1.,  0.,  0.,  0.,  0., -1.,  3., -1.],
+        ...                         [ 0.,  0.,  1.,  0.,  0.,  0.,  0., -1.,  2.]]) # doctest: +SERIAL
+        True
+        >>> print numerix.allclose(eq.RHSvector, [1., 1., 1., 3., 3., 3., 3., 3., 3.]) # doctest: +SERIAL
+        True
+        """
+        if buildExplicitIfOther:
+            return None
+
+        ids = set()
+        for v in uncoupledTerm._vars:
+            if v is None:
+                return None
+            ids.add(id(v))
+        return ids
+
     def __repr__(self):
         return '(' + repr(self.term) + ' & ' + repr(self.other) + ')'
 
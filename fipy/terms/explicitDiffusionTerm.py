@@ -35,6 +35,7 @@
 __docformat__ = 'restructuredtext'
 
 from fipy.terms.abstractDiffusionTerm import _AbstractDiffusionTerm
+from fipy.terms.unaryTerm import _UnaryTerm
 
 __all__ = ["ExplicitDiffusionTerm"]
 
@@ -64,6 +65,12 @@ class ExplicitDiffusionTerm(_AbstractDiffusionTerm):
 
         return (var, SparseMatrix(mesh=var.mesh), b - L * var.value)
 
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        # the constraints come from `var.old`, so `_buildMatrix()` already
+        # returns the explicit contribution
+        return _UnaryTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt,
+                                         transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
     def _getNormals(self, mesh):
         return mesh._faceCellToCellNormals
 
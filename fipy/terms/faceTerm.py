@@ -79,7 +79,7 @@ class FaceTerm(_NonDiffusionTerm):
         N = mesh.numberOfCells
         M = mesh._maxFacesPerCell
 
-        for boundaryCondition in boundaryConditions:
+        for boundaryCondition in self._batchBoundaryConditions(boundaryConditions):
             LL, bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffMatrix)
 
             if 'FIPY_DISPLAY_MATRIX' in os.environ:
@@ -102,7 +102,7 @@ class FaceTerm(_NonDiffusionTerm):
         N = mesh.numberOfCells
         M = mesh._maxFacesPerCell
 
-        for boundaryCondition in boundaryConditions:
+        for boundaryCondition in self._batchBoundaryConditions(boundaryConditions):
 
             LL,bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffMatrix)
             if LL != 0:
@@ -110,6 +110,31 @@ class FaceTerm(_NonDiffusionTerm):
                 b -= LL * numerix.array(oldArray)
             b += bb
 
+    def _applyStencil_(self, SparseMatrix, value, id1, id2, b, weight, var, boundaryConditions, interiorFaces):
+        mesh = var.mesh
+        coeffMatrix = self._getCoeffMatrix_(var, weight)
+
+        value = numerix.array(value)
+        value1 = numerix.take(value, id1)
+        value2 = numerix.take(value, id2)
+
+        cell1diag = numerix.take(coeffMatrix['cell 1 diag'], interiorFaces)
+        cell1offdiag = numerix.take(coeffMatrix['cell 1 offdiag'], interiorFaces)
+        cell2diag = numerix.take(coeffMatrix['cell 2 diag'], interiorFaces)
+        cell2offdiag = numerix.take(coeffMatrix['cell 2 offdiag'], interiorFaces)
+
+        vector.putAdd(b, id1, -(cell1diag * value1 + cell1offdiag * value2))
+        vector.putAdd(b, id2, -(cell2diag * value2 + cell2offdiag * value1))
+
+        N = mesh.numberOfCells
+        M = mesh._maxFacesPerCell
+
+        for boundaryCondition in self._batchBoundaryConditions(boundaryConditions):
+            LL, bb = boundaryCondition._buildMatrix(SparseMatrix, N, M, coeffMatrix)
+            if LL != 0:
+                b -= LL * value
+            b += bb
+
     if inline.doInline:
         def _explicitBuildMatrixInline_(self, oldArray, id1, id2, b, coeffMatrix, mesh, interiorFaces, dt, weight):
 
@@ -181,3 +206,29 @@ class FaceTerm(_NonDiffusionTerm):
             self._explicitBuildMatrix_(SparseMatrix, var.old, id1, id2, b, weight['explicit'], var, boundaryConditions, interiorFaces, dt)
 
         return (var, L, b)
+
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Apply the face stencil to `var` without building a matrix
+        """
+        if self._vectorSize(var) > 1:
+            return _NonDiffusionTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt,
+                                                    transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        mesh = var.mesh
+        id1, id2 = mesh._adjacentCellIDs
+        interiorFaces = numerix.nonzero(mesh.interiorFaces)[0]
+
+        id1 = numerix.take(id1, interiorFaces)
+        id2 = numerix.take(id2, interiorFaces)
+
+        b = numerix.zeros(var.shape,'d').ravel()
+
+        weight = self._getWeight(var, transientGeomCoeff, diffusionGeomCoeff)
+
+        if 'implicit' in weight:
+            self._applyStencil_(SparseMatrix, var.value, id1, id2, b, weight['implicit'], var, boundaryConditions, interiorFaces)
+
+        if 'explicit' in weight:
+            self._explicitBuildMatrix_(SparseMatrix, var.old, id1, id2, b, weight['explicit'], var, boundaryConditions, interiorFaces, dt)
+
+        return b
@@ -112,6 +112,18 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
     >>> answer = -vel * numerix.array((2, numerix.sqrt(2**2 + 6**2), 1, 0))
     >>> print numerix.allclose(b, answer, atol = 1e-10) # doctest: +PROCESSOR_0
     True
+
+    The advection of a `DistanceVariable` with a `narrowBandWidth` is
+    restricted to its narrow band
+
+    >>> from fipy.variables.distanceVariable import DistanceVariable
+    >>> mesh = Grid1D(dx = 1., nx = 8)
+    >>> var = DistanceVariable(mesh = mesh, value = numerix.arange(8) - 3.5, narrowBandWidth = 2.)
+    >>> print var.narrowBand
+    [2 3 4 5]
+    >>> v, L, b = FirstOrderAdvectionTerm(1.)._buildMatrix(var, SparseMatrix)
+    >>> print numerix.allclose(b, (0., 0., -1., -1., -1., -1., 0., 0.), atol = 1e-10) # doctest: +PROCESSOR_0
+    True
     """
 
     def __init__(self, coeff = None):
@@ -120,38 +132,59 @@ class FirstOrderAdvectionTerm(_NonDiffusionTerm):
 
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, equation=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
 
+        cells = self._getAdvectedCells(var)
         oldArray = var.old
 
         mesh = var.mesh
         NCells = mesh.numberOfCells
         NCellFaces = mesh._maxFacesPerCell
 
-        cellValues = numerix.repeat(oldArray[numerix.newaxis, ...], NCellFaces, axis = 0)
+        oldValue = numerix.array(oldArray)
+        cellIDs = numerix.arange(NCells)[cells]
+        NAdvected = len(cellIDs)
 
-        cellIDs = numerix.repeat(numerix.arange(NCells)[numerix.newaxis, ...], NCellFaces, axis = 0)
-        cellToCellIDs = mesh._cellToCellIDs
+        cellValues = numerix.repeat(oldValue[numerix.newaxis, cells], NCellFaces, axis = 0)
 
-        if NCells > 0:
+        cellIDs = numerix.repeat(cellIDs[numerix.newaxis, ...], NCellFaces, axis = 0)
+        cellToCellIDs = mesh._cellToCellIDs[..., cells]
+
+        if NAdvected > 0:
             cellToCellIDs = MA.where(MA.getmask(cellToCellIDs), cellIDs, cellToCellIDs)
 
-            adjacentValues = numerix.take(oldArray, cellToCellIDs)
+            adjacentValues = numerix.take(oldValue, cellToCellIDs)
 
-            differences = self._getDifferences(adjacentValues, cellValues, oldArray, cellToCellIDs, mesh)
+            differences = self._getDifferences(adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cells)
             differences = MA.filled(differences, 0)
 
-            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
-            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, numerix.zeros((NCellFaces, NCells), 'l'))**2, axis=0))
+            minsq = numerix.sqrt(numerix.sum(numerix.minimum(differences, numerix.zeros((NCellFaces, NAdvected), 'l'))**2, axis=0))
+            maxsq = numerix.sqrt(numerix.sum(numerix.maximum(differences, numerix.zeros((NCellFaces, NAdvected), 'l'))**2, axis=0))
 
             coeff = numerix.array(self._getGeomCoeff(var))
+            if coeff.shape != ():
+                coeff = coeff[..., cells]
 
             coeffXdifferences = coeff * ((coeff > 0.) * minsq + (coeff < 0.) * maxsq)
         else:
             coeffXdifferences = 0.
 
-        return (var, SparseMatrix(mesh=var.mesh), -coeffXdifferences * mesh.cellVolumes)
+        b = numerix.zeros((NCells,), 'd')
+        b[cells] = -coeffXdifferences * mesh.cellVolumes[cells]
+
+        return (var, SparseMatrix(mesh=var.mesh), b)
+
+    def _getAdvectedCells(self, var):
+        """
+        The narrow band of `var`, if it is a `DistanceVariable` with a
+        `narrowBandWidth`, or all of the cells. The cells outside of the
+        band are left unchanged.
+        """
+        if getattr(var, 'narrowBandWidth', None) is None:
+            return slice(None)
+        else:
+            return var.narrowBand
 
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
-        return (adjacentValues - cellValues) / mesh._cellToCellDistances
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cells):
+        return (adjacentValues - cellValues) / mesh._cellToCellDistances[..., cells]
 
     def _getDefaultSolver(self, var, solver, *args, **kwargs):
         solver = solver or super(FirstOrderAdvectionTerm, self)._getDefaultSolver(var, solver, *args, **kwargs)
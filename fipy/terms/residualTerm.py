@@ -35,6 +35,7 @@
 __docformat__ = 'restructuredtext'
 
 from fipy.terms.explicitSourceTerm import _ExplicitSourceTerm
+from fipy.terms.unaryTerm import _UnaryTerm
 from fipy.variables.cellVariable import CellVariable
 
 __all__ = ["ResidualTerm"]
@@ -67,3 +68,8 @@ class ResidualTerm(_ExplicitSourceTerm):
         self.coeffVectors = None
 
         return _ExplicitSourceTerm._buildMatrix(self, var=var, SparseMatrix=SparseMatrix, boundaryConditions=boundaryConditions, dt=dt, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        # the source is recomputed by `_buildMatrix()`
+        return _UnaryTerm._applyOperator(self, var, SparseMatrix, boundaryConditions=boundaryConditions, dt=dt,
+                                         transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
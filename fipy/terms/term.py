@@ -37,6 +37,8 @@ __docformat__ = 'restructuredtext'
 import os
 
 from fipy.tools import numerix
+from fipy.tools import profiling
+from fipy.boundaryConditions.boundaryCondition import _BoundaryConditionBatch
 from fipy.terms import AbstractBaseClassError
 from fipy.terms import SolutionVariableRequiredError
 
@@ -66,6 +68,8 @@ class Term(object):
         self._matrix = None
         self._cacheRHSvector = False
         self._RHSvector = None
+        self._assemblyPlan = None
+        self._boundaryConditionBatch = None
         self.var = var
 
     def _calcVars(self):
@@ -131,6 +135,77 @@ class Term(object):
 
         return SparseMatrix
 
+    def _applyAssemblyPlan(self, var, solver, boundaryConditions, matrix):
+        """Finish assembling `matrix`, reusing the sparsity structure from
+        the last time this `Term` was assembled, if possible.
+
+        The plan is only offered back to the matrix when the matrix class,
+        the solution variable(s) and the boundary conditions are the same
+        objects as last time; any change discards it.
+
+        Only the SciPy matrices currently support reuse.
+
+        >>> from fipy import *
+        >>> from fipy.solvers.scipy import LinearLUSolver # doctest: +SCIPY
+        >>> m = Grid1D(nx=3)
+        >>> v = CellVariable(mesh=m, value=1.)
+        >>> eq = TransientTerm() == DiffusionTerm()
+        >>> eq.solve(v, dt=1., solver=LinearLUSolver()) # doctest: +SCIPY
+        >>> plan = eq._assemblyPlan[1] # doctest: +SCIPY
+        >>> eq.solve(v, dt=1., solver=LinearLUSolver()) # doctest: +SCIPY
+        >>> print eq._assemblyPlan[1] is plan # doctest: +SCIPY
+        True
+        >>> bc = FixedValue(faces=m.facesLeft, value=0.)
+        >>> eq.solve(v, dt=1., solver=LinearLUSolver(), boundaryConditions=bc) # doctest: +SCIPY
+        >>> print eq._assemblyPlan[1] is plan # doctest: +SCIPY
+        False
+        """
+        key = [solver._matrixClass] + list(getattr(var, 'vars', [var])) + list(boundaryConditions)
+
+        plan = None
+        if self._assemblyPlan is not None:
+            oldKey, oldPlan = self._assemblyPlan
+            if len(oldKey) == len(key) and False not in [a is b for a, b in zip(oldKey, key)]:
+                plan = oldPlan
+
+        plan = matrix._applyAssemblyPlan(plan)
+
+        if plan is None:
+            self._assemblyPlan = None
+        else:
+            self._assemblyPlan = (key, plan)
+
+    def _batchBoundaryConditions(self, boundaryConditions):
+        """Gather `boundaryConditions` into a single
+        `_BoundaryConditionBatch`, to be applied in one go.
+
+        The batch, and the cell IDs it concatenates, are kept for as long as
+        the boundary conditions are the same objects as last time.
+
+        >>> from fipy import *
+        >>> m = Grid1D(nx=3)
+        >>> bcs = (FixedValue(faces=m.facesLeft, value=0.),
+        ...        FixedValue(faces=m.facesRight, value=1.))
+        >>> term = DiffusionTerm()
+        >>> batch = term._batchBoundaryConditions(bcs)
+        >>> print term._batchBoundaryConditions(list(bcs)) == batch
+        True
+        >>> print term._batchBoundaryConditions(bcs[:1]) == batch
+        False
+        >>> print term._batchBoundaryConditions(())
+        []
+        """
+        if len(boundaryConditions) == 0:
+            return []
+
+        batch = self._boundaryConditionBatch
+        if (batch is None
+            or len(batch.boundaryConditions) != len(boundaryConditions)
+            or False in [a is b for a, b in zip(batch.boundaryConditions, boundaryConditions)]):
+            batch = self._boundaryConditionBatch = _BoundaryConditionBatch(boundaryConditions)
+
+        return [batch]
+
     def _prepareLinearSystem(self, var, solver, boundaryConditions, dt):
         solver = self.getDefaultSolver(var, solver)
 
@@ -156,9 +231,14 @@ class Term(object):
                                                            diffusionGeomCoeff=self._getDiffusionGeomCoeff(var),
                                                            buildExplicitIfOther=self._buildExplcitIfOther)
 
-        self._buildCache(matrix, RHSvector)
+        with profiling._phase("assemble", self.__class__.__name__) as phase:
+            self._applyAssemblyPlan(var, solver, boundaryConditions, matrix)
 
-        solver._storeMatrix(var=var, matrix=matrix, RHSvector=RHSvector)
+            self._buildCache(matrix, RHSvector)
+
+            solver._storeMatrix(var=var, matrix=matrix, RHSvector=RHSvector)
+
+            profiling._reportSystem(phase, matrix, RHSvector)
 
         if 'FIPY_DISPLAY_MATRIX' in os.environ:
             if var is None:
@@ -197,7 +277,8 @@ class Term(object):
 
         solver = self._prepareLinearSystem(var, solver, boundaryConditions, dt)
 
-        solver._solve()
+        with profiling._phase("solve", solver.__class__.__name__):
+            solver._solve()
 
     def sweep(self, var=None, solver=None, boundaryConditions=(), dt=None, underRelaxation=None, residualFn=None, cacheResidual=False, cacheError=False):
         r"""
@@ -222,7 +303,9 @@ class Term(object):
         """
         solver = self._prepareLinearSystem(var=var, solver=solver, boundaryConditions=boundaryConditions, dt=dt)
         solver._applyUnderRelaxation(underRelaxation=underRelaxation)
-        residual = solver._calcResidual(residualFn=residualFn)
+        with profiling._phase("residual", self.__class__.__name__) as phase:
+            residual = solver._calcResidual(residualFn=residualFn)
+            phase.report(residual=residual)
 
         if cacheResidual or cacheError:
             self.residualVector = solver._calcResidualVector(residualFn=residualFn)
@@ -238,7 +321,8 @@ class Term(object):
         if not cacheResidual:
             self.residualVector = None
 
-        solver._solve()
+        with profiling._phase("solve", solver.__class__.__name__):
+            solver._solve()
 
         return residual
 
@@ -461,7 +545,7 @@ class Term(object):
     def _getOldAdjacentValues(self, oldArray, id1, id2, dt):
         raise NotImplementedError
 
-    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh):
+    def _getDifferences(self, adjacentValues, cellValues, oldArray, cellToCellIDs, mesh, cells):
         raise NotImplementedError
 
     def _alpha(self, P):
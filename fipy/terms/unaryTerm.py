@@ -39,6 +39,7 @@ __all__ = []
 import os
 
 from fipy.tools import numerix
+from fipy.tools import profiling
 from fipy.terms.term import Term
 
 class _UnaryTerm(Term):
@@ -91,21 +92,24 @@ class _UnaryTerm(Term):
         """
 
         if var is self.var or self.var is None:
-            var, matrix, RHSvector = self._buildMatrix(var,
-                                                       SparseMatrix,
-                                                       boundaryConditions=boundaryConditions,
-                                                       dt=dt,
-                                                       transientGeomCoeff=transientGeomCoeff,
-                                                       diffusionGeomCoeff=diffusionGeomCoeff)
+            with profiling._phase("build", self.__class__.__name__) as phase:
+                var, matrix, RHSvector = self._buildMatrix(var,
+                                                           SparseMatrix,
+                                                           boundaryConditions=boundaryConditions,
+                                                           dt=dt,
+                                                           transientGeomCoeff=transientGeomCoeff,
+                                                           diffusionGeomCoeff=diffusionGeomCoeff)
+                profiling._reportSystem(phase, matrix, RHSvector)
         elif buildExplicitIfOther:
-            _, matrix, RHSvector = self._buildMatrix(self.var,
-                                                     SparseMatrix,
-                                                     boundaryConditions=boundaryConditions,
-                                                     dt=dt,
-                                                     transientGeomCoeff=transientGeomCoeff,
-                                                     diffusionGeomCoeff=diffusionGeomCoeff)
-            RHSvector = RHSvector - matrix * self.var.value
-            matrix = SparseMatrix(mesh=var.mesh)
+            with profiling._phase("build", self.__class__.__name__) as phase:
+                RHSvector = self._applyOperator(self.var,
+                                                SparseMatrix,
+                                                boundaryConditions=boundaryConditions,
+                                                dt=dt,
+                                                transientGeomCoeff=transientGeomCoeff,
+                                                diffusionGeomCoeff=diffusionGeomCoeff)
+                matrix = SparseMatrix(mesh=var.mesh)
+                profiling._reportSystem(phase, matrix, RHSvector)
         else:
             RHSvector = numerix.zeros(len(var.ravel()),'d')
             matrix = SparseMatrix(mesh=var.mesh)
@@ -118,6 +122,55 @@ class _UnaryTerm(Term):
 
         return (var, matrix, RHSvector)
 
+    def _applyOperator(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        r"""Evaluate :math:`b - L \phi` for the current value of `var`
+
+        Used when this `Term` acts on a variable other than the one being
+        solved for. Subclasses that can apply themselves directly to
+        `var.value` override this to avoid building `L`; this default
+        builds the matrix and throws it away.
+
+        The matrix-free overrides agree with the assembled matrix.
+
+        >>> from fipy import *
+        >>> m = Grid2D(nx=3, ny=4)
+        >>> v = CellVariable(mesh=m, value=m.x * m.y**2, hasOld=True)
+        >>> v.constrain(1., where=m.facesLeft)
+        >>> v.faceGrad.constrain([[0.5], [0.]], where=m.facesTop)
+        >>> v.updateOld()
+        >>> v.setValue(m.y)
+        >>> SparseMatrix = DefaultSolver()._matrixClass
+        >>> def check(term):
+        ...     _, L, b = term._buildMatrix(v, SparseMatrix, dt=0.5)
+        ...     return numerix.allclose(term._applyOperator(v, SparseMatrix, dt=0.5),
+        ...                             b - L * v.value)
+        >>> for term in [TransientTerm(coeff=m.x),
+        ...              ImplicitSourceTerm(coeff=2.),
+        ...              DiffusionTerm(coeff=m.x + 1.),
+        ...              DiffusionTerm(coeff=[[[1., 0.5], [0.5, 2.]]]),
+        ...              ExplicitDiffusionTerm(coeff=3.),
+        ...              PowerLawConvectionTerm(coeff=(1., -2.)),
+        ...              CentralDifferenceConvectionTerm(coeff=(-1., 0.5)),
+        ...              ExplicitUpwindConvectionTerm(coeff=(1., 1.))]:
+        ...     print term.__class__.__name__, check(term)
+        TransientTerm True
+        ImplicitSourceTerm True
+        DiffusionTerm True
+        DiffusionTerm True
+        ExplicitDiffusionTerm True
+        PowerLawConvectionTerm True
+        CentralDifferenceConvectionTerm True
+        ExplicitUpwindConvectionTerm True
+
+        """
+        var, L, b = self._buildMatrix(var,
+                                      SparseMatrix,
+                                      boundaryConditions=boundaryConditions,
+                                      dt=dt,
+                                      transientGeomCoeff=transientGeomCoeff,
+                                      diffusionGeomCoeff=diffusionGeomCoeff)
+        return b - L * var.value
+
     def _reshapeIDs(self, var, ids):
         shape = (self._vectorSize(var), self._vectorSize(var), ids.shape[-1])
         ids = numerix.resize(ids, shape)
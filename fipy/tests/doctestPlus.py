@@ -44,7 +44,22 @@ _DocTestTimes = []
 
 from fipy.tests.lateImportTest import _LateImportTestCase, _LateImportTestSuite
 
+# Modules that register skippers when they are imported. `import fipy`
+# no longer imports them, so they are imported before any doctest is
+# parsed for their option flags to be known.
+_skipperModules = ('fipy.tools',
+                   'fipy.tools.inline',
+                   'fipy.meshes.gmshMesh',
+                   'fipy.solvers',
+                   'fipy.variables.distanceVariable',
+                   'fipy.viewers.vtkViewer.vtkViewer')
+
+def _importSkippers():
+    for name in _skipperModules:
+        __import__(name)
+
 def _getScript(name = '__main__'):
+    _importSkippers()
     module = sys.modules.get(name)
     # the syntax of doctest changed substantially between Python 2.3 and 2.4
     # <http://sourceforge.net/tracker/index.php?func=detail&aid=1120348&group_id=118428&atid=681141>
@@ -57,6 +72,7 @@ def _getScript(name = '__main__'):
         return doctest.testsource(module, "")
 
 def execButNoTest(name='__main__'):
+    _importSkippers()
     module = sys.modules.get(name)
 
     # the syntax of doctest changed substantially between Python 2.3 and 2.4
@@ -150,6 +166,7 @@ class _SelectiveDocTestParser(doctest.DocTestParser):
     Custom doctest parser that adds support for skipping test examples
     """
     def parse(self, string, name='<string>'):
+        _importSkippers()
         pieces = doctest.DocTestParser.parse(self, string, name)
 
         return [piece for piece in pieces if not self._skipExample(piece)]
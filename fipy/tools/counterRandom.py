@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "counterRandom.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+
+"""Counter-based random numbers
+
+Each deviate is a pure function of a key, a step and an ID, computed with
+the Philox-4x32-10 generator of Salmon et al., "Parallel Random Numbers:
+As Easy as 1, 2, 3", SC11 (2011). Any subset of IDs can be generated
+independently, in any order, on any number of processors, with the same
+result.
+"""
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+
+__all__ = []
+
+_MASK = numerix.uint64(0xFFFFFFFF)
+_SHIFT = numerix.uint64(32)
+_MULTIPLIERS = (numerix.uint64(0xD2511F53), numerix.uint64(0xCD9E8D57))
+_WEYL = (numerix.uint64(0x9E3779B9), numerix.uint64(0xBB67AE85))
+
+def _philox(counter, key, rounds=10):
+    """
+    Philox-4x32 bijection of the four 32-bit words of `counter` (each
+    either a scalar or an array) under the two 32-bit words of `key`.
+
+    The known-answer tests of the Random123 distribution
+
+    >>> def hexlify(words):
+    ...     print " ".join(["%08x" % int(w) for w in words])
+    >>> hexlify(_philox((0, 0, 0, 0), (0, 0)))
+    6627e8d5 e169c58d bc57ac4c 9b00dbd8
+    >>> hexlify(_philox((0xffffffff,) * 4, (0xffffffff,) * 2))
+    408f276d 41c83b0e a20bc7c6 6d5451fd
+    >>> hexlify(_philox((0x243f6a88, 0x85a308d3, 0x13198a2e, 0x03707344),
+    ...                 (0xa4093822, 0x299f31d0)))
+    d16cfe09 94fdcceb 5001e420 24126ea1
+    """
+    shape = numerix.broadcast(*counter).shape
+    c0, c1, c2, c3 = [numerix.empty(shape, 'uint64') for c in counter]
+    for word, c in zip((c0, c1, c2, c3), counter):
+        word[...] = numerix.asarray(c).astype('uint64') & _MASK
+    k0, k1 = [numerix.uint64(k) & _MASK for k in key]
+    p0 = numerix.empty(shape, 'uint64')
+    p1 = numerix.empty(shape, 'uint64')
+
+    # the rounds are done in place, as they are bound by memory traffic
+    for i in range(rounds):
+        if i > 0:
+            k0 = (k0 + _WEYL[0]) & _MASK
+            k1 = (k1 + _WEYL[1]) & _MASK
+        numerix.multiply(c0, _MULTIPLIERS[0], p0)
+        numerix.multiply(c2, _MULTIPLIERS[1], p1)
+        # c0 <- hi(p1) ^ c1 ^ k0, c1 <- lo(p1), c2 <- hi(p0) ^ c3 ^ k1, c3 <- lo(p0)
+        numerix.right_shift(p1, _SHIFT, c2)
+        c2 ^= c1
+        c2 ^= k0
+        numerix.bitwise_and(p1, _MASK, c1)
+        numerix.right_shift(p0, _SHIFT, c0)
+        c0 ^= c3
+        c0 ^= k1
+        numerix.bitwise_and(p0, _MASK, c3)
+        c0, c2 = c2, c0
+
+    return c0, c1, c2, c3
+
+def _toDouble(high, low):
+    # 53 random bits, centered in their interval so that 0 and 1 are excluded
+    bits = (high >> numerix.uint64(5)) * numerix.uint64(67108864) + (low >> numerix.uint64(6))
+    return (bits.astype('d') + 0.5) / 9007199254740992.
+
+def _uniforms(key, step, ids, draw):
+    """
+    Two independent arrays of deviates, uniform on (0, 1), for `ids`
+    """
+    ids = numerix.asarray(ids).astype('uint64')
+    c0, c1, c2, c3 = _philox((ids & _MASK, ids >> _SHIFT, step, draw), key)
+    return _toDouble(c0, c1), _toDouble(c2, c3)
+
+def _stream(stream):
+    return stream * 0x10000
+
+def uniform(key, step, ids, low=0., high=1.):
+    """
+    Deviates uniform on (`low`, `high`), one for each of `ids`
+
+    The deviates depend on the IDs, not on how they are grouped
+
+    >>> ids = numerix.arange(10)
+    >>> x = uniform((1, 2), 3, ids)
+    >>> print numerix.allclose(x[5:], uniform((1, 2), 3, ids[5:]))
+    True
+    >>> print numerix.allclose(x[::-1], uniform((1, 2), 3, ids[::-1]))
+    True
+    >>> print (x == uniform((1, 2), 4, ids)).any()
+    False
+    >>> print (x == uniform((2, 2), 3, ids)).any()
+    False
+    """
+    u, unused = _uniforms(key, step, ids, _stream(0))
+    return low + (high - low) * u
+
+def normal(key, step, ids, loc=0., scale=1., stream=0):
+    """
+    Normal deviates, one for each of `ids`, by the Box-Muller transform
+
+    >>> x = normal((1, 2), 3, numerix.arange(100000), loc=1., scale=2.)
+    >>> print abs(x.mean() - 1.) < 0.02, abs(x.std() - 2.) < 0.02
+    True True
+    """
+    u1, u2 = _uniforms(key, step, ids, _stream(stream))
+    return loc + scale * _boxMuller(u1, u2)
+
+def _boxMuller(u1, u2):
+    return numerix.sqrt(-2 * numerix.log(u1)) * numerix.cos(2 * numerix.pi * u2)
+
+def exponential(key, step, ids, scale=1.):
+    """
+    Exponential deviates, one for each of `ids`
+
+    >>> x = exponential((1, 2), 3, numerix.arange(100000), scale=3.)
+    >>> print abs(x.mean() - 3.) < 0.05, (x > 0).all()
+    True True
+    """
+    u, unused = _uniforms(key, step, ids, _stream(0))
+    return -scale * numerix.log(u)
+
+def gamma(key, step, ids, shape, scale=1., stream=0):
+    r"""
+    Gamma deviates, one for each of `ids`, by the rejection method of
+    Marsaglia and Tsang, "A Simple Method for Generating Gamma Variables",
+    ACM TOMS 26 (2000). Each rejected ID draws again from the next
+    counter, so the result still depends only on the ID.
+
+    >>> ids = numerix.arange(100000)
+    >>> for shape in (0.5, 1., 4.):
+    ...     x = gamma((1, 2), 3, ids, shape=shape, scale=2.)
+    ...     print abs(x.mean() / (shape * 2.) - 1) < 0.02, abs(x.var() / (shape * 4.) - 1) < 0.05
+    True True
+    True True
+    True True
+    >>> print numerix.allclose(x[::7], gamma((1, 2), 3, ids[::7], shape=4., scale=2.))
+    True
+    """
+    ids = numerix.asarray(ids)
+    shape = numerix.array(shape, 'd') * numerix.ones(ids.shape, 'd')
+
+    # shapes below 1 are boosted by 1 and scaled back with an extra uniform
+    boost = shape < 1
+    d = numerix.where(boost, shape + 1., shape) - 1. / 3
+    c = 1. / numerix.sqrt(9 * d)
+
+    value = numerix.zeros(ids.shape, 'd')
+    pending = numerix.arange(len(ids))
+    draw = _stream(stream) + 1
+    while len(pending) > 0:
+        u1, u2 = _uniforms(key, step, ids[pending], draw)
+        u3, unused = _uniforms(key, step, ids[pending], draw + 1)
+        draw += 2
+
+        x = _boxMuller(u1, u2)
+        v = (1 + c[pending] * x)**3
+        positive = v > 0
+        v = numerix.where(positive, v, 1.)
+        dp = d[pending]
+        accept = positive & (numerix.log(u3) < 0.5 * x**2 + dp - dp * v + dp * numerix.log(v))
+
+        value[pending[accept]] = dp[accept] * v[accept]
+        pending = pending[~accept]
+
+    if boost.any():
+        u, unused = _uniforms(key, step, ids, _stream(stream))
+        value = numerix.where(boost, value * u**(1. / numerix.where(boost, shape, 1.)), value)
+
+    return value * scale
+
+def beta(key, step, ids, a, b):
+    """
+    Beta deviates, one for each of `ids`, as the ratio of gamma deviates
+
+    >>> a, b = 2., 5.
+    >>> x = beta((1, 2), 3, numerix.arange(100000), a, b)
+    >>> print abs(x.mean() - a / (a + b)) < 0.01, ((x > 0) & (x < 1)).all()
+    True True
+    """
+    x = gamma(key, step, ids, shape=a, stream=0)
+    y = gamma(key, step, ids, shape=b, stream=1)
+    return x / (x + y)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -41,9 +41,10 @@ import os
 import sys
 import gzip
 
+from fipy.tools import numerix
 from fipy.tools import parallelComm
 
-__all__ = ["write", "read"]
+__all__ = ["write", "read", "save_checkpoint", "load_checkpoint"]
 
 # TODO: add test to show that round trip pickle of mesh doesn't work properly
 # FIXME: pickle fails to work properly on numpy 1.1 (run gapFillMesh.py)
@@ -150,6 +151,330 @@ def read(filename, fileobject=None, communicator=parallelComm, mesh_unmangle=Fal
 
     return unpickler.load()
 
+_CHECKPOINT_FORMAT = 1
+
+def _codec(compression):
+    """
+    Return the `(compress, decompress)` pair of functions of a named codec.
+    Only `zlib` ships with Python; the others are imported on demand.
+    """
+    if compression == 'zlib':
+        import zlib
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    elif compression == 'lz4':
+        import lz4.frame
+        return lz4.frame.compress, lz4.frame.decompress
+    elif compression == 'zstd':
+        import zstandard
+        return (zstandard.ZstdCompressor(level=1).compress,
+                zstandard.ZstdDecompressor().decompress)
+    elif compression == 'blosc':
+        import blosc
+        return (lambda data: blosc.compress(data, typesize=8)), blosc.decompress
+    else:
+        raise ValueError("unknown compression '%s'" % compression)
+
+def _writeArray(path, name, array, compression=None):
+    from numpy.lib import format
+    array = numerix.ascontiguousarray(array)
+    if compression is None:
+        f = open(os.path.join(path, name + '.npy'), 'wb')
+        try:
+            format.write_array(f, array)
+        finally:
+            f.close()
+    else:
+        import StringIO
+        buf = StringIO.StringIO()
+        format.write_array(buf, array)
+        compress, decompress = _codec(compression)
+        f = open(os.path.join(path, name + '.npy.' + compression), 'wb')
+        try:
+            f.write(compress(buf.getvalue()))
+        finally:
+            f.close()
+
+def _readArray(path, name, compression=None, mmap=True):
+    from numpy.lib import format
+    if compression is None:
+        return numerix.load(os.path.join(path, name + '.npy'),
+                            mmap_mode='r' if mmap else None)
+    else:
+        import StringIO
+        compress, decompress = _codec(compression)
+        f = open(os.path.join(path, name + '.npy.' + compression), 'rb')
+        try:
+            return format.read_array(StringIO.StringIO(decompress(f.read())))
+        finally:
+            f.close()
+
+def save_checkpoint(vars, mesh, path, compression=None, communicator=None):
+    """
+    Write a checkpoint of `CellVariable` objects and the `Mesh` they are
+    defined on to the directory `path`, which is created if necessary.
+
+    Unlike `write`, nothing is pickled but a small table of contents.
+    The mesh arrays and the variable values are stored as raw NumPy
+    buffers, one ``.npy`` file per array. Each process writes the values
+    of the cells it owns (its `_localNonOverlappingCellIDs`) to its own
+    files, along with their global IDs, so no process ever gathers the
+    whole field. Any old table of contents is removed before the first
+    array is written and the new one is written last, by process 0, so an
+    interrupted checkpoint cannot be mistaken for a complete one.
+
+    :Parameters:
+      - `vars`: A `dict` of the `CellVariable` objects to store, keyed by
+        the names they will be restored under.
+      - `mesh`: The `Mesh` that all of `vars` are defined on.
+      - `path`: The directory to write.
+      - `compression`: `None` to write uncompressed arrays, which
+        `load_checkpoint` can memory-map, or one of ``'zlib'``,
+        ``'lz4'``, ``'zstd'`` or ``'blosc'``. Only ``'zlib'`` is always
+        available; the others need their Python package.
+      - `communicator`: Object with `procID`, `Nproc` and `Barrier`
+        attributes. Defaults to the communicator of `mesh`.
+
+        >>> import shutil, tempfile
+        >>> from fipy.meshes import Grid2D
+        >>> from fipy.variables.cellVariable import CellVariable
+        >>> mesh = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=mesh, value=mesh.x * mesh.y, hasOld=True)
+        >>> phi.updateOld()
+        >>> phi.setValue(-1.)
+        >>> u = CellVariable(mesh=mesh, rank=1, value=mesh.cellCenters)
+        >>> path = tempfile.mkdtemp()
+        >>> save_checkpoint({'phi': phi, 'u': u}, mesh, path)
+        >>> vars, newMesh = load_checkpoint(path)
+        >>> print newMesh.numberOfCells
+        6
+        >>> print vars['phi']
+        [-1. -1. -1. -1. -1. -1.]
+        >>> print vars['phi'].old
+        [ 0.25  0.75  1.25  0.75  2.25  3.75]
+        >>> print numerix.allclose(vars['u'], mesh.cellCenters)
+        True
+
+    Writing to the same `path` again replaces the checkpoint
+
+        >>> phi.setValue(2.)
+        >>> save_checkpoint({'phi': phi}, mesh, path)
+        >>> vars, newMesh = load_checkpoint(path)
+        >>> print vars.keys()
+        ['phi']
+        >>> print vars['phi']
+        [ 2.  2.  2.  2.  2.  2.]
+
+    Arrays can be compressed, at the cost of memory-mapped reads
+
+        >>> shutil.rmtree(path)
+        >>> save_checkpoint({'u': u}, mesh, path, compression='zlib')
+        >>> vars, newMesh = load_checkpoint(path, mesh=mesh)
+        >>> print numerix.allclose(vars['u'], mesh.cellCenters)
+        True
+        >>> print vars['u'].mesh is mesh
+        True
+
+    Unstructured meshes are stored by their arrays
+
+        >>> from fipy.meshes import Tri2D
+        >>> tri = Tri2D(nx=2, ny=1)
+        >>> shutil.rmtree(path)
+        >>> save_checkpoint({'x': CellVariable(mesh=tri, value=tri.x)}, tri, path)
+        >>> vars, newMesh = load_checkpoint(path)
+        >>> print numerix.allclose(newMesh.vertexCoords, tri.vertexCoords)
+        True
+        >>> print numerix.allclose(vars['x'], tri.x)
+        True
+
+        >>> save_checkpoint({'x': vars['x']}, tri, path, compression='snappy')
+        Traceback (most recent call last):
+            ...
+        ValueError: unknown compression 'snappy'
+        >>> shutil.rmtree(path)
+
+    """
+    if communicator is None:
+        communicator = mesh.communicator
+
+    if compression is not None:
+        _codec(compression)
+
+    names = sorted(vars.keys())
+    for name in names:
+        if vars[name].mesh is not mesh:
+            raise ValueError("'%s' is not defined on the checkpointed mesh" % name)
+
+    if communicator.procID == 0:
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        elif os.path.exists(os.path.join(path, 'checkpoint.pickle')):
+            # the old contents must not describe the new arrays
+            os.remove(os.path.join(path, 'checkpoint.pickle'))
+    communicator.Barrier()
+
+    rank = communicator.procID
+    localIDs = mesh._localNonOverlappingCellIDs
+    _writeArray(path, 'cells.%d' % rank, mesh._globalNonOverlappingCellIDs,
+                compression)
+    for i, name in enumerate(names):
+        var = vars[name]
+        _writeArray(path, 'value.%d.%d' % (i, rank),
+                    numerix.array(var.value)[..., localIDs], compression)
+        if var._old is not None:
+            _writeArray(path, 'old.%d.%d' % (i, rank),
+                        numerix.array(var.old.value)[..., localIDs], compression)
+
+    if communicator.procID == 0:
+        meshState = mesh.__getstate__().copy()
+        meshArrays = []
+        for key, value in meshState.items():
+            if isinstance(value, numerix.ndarray):
+                _writeArray(path, 'mesh.' + key, numerix.MA.getdata(value),
+                            compression)
+                if numerix.MA.isMaskedArray(value):
+                    _writeArray(path, 'mesh.' + key + '.mask',
+                                numerix.MA.getmaskarray(value), compression)
+                meshArrays.append((key, numerix.MA.isMaskedArray(value)))
+                del meshState[key]
+
+        contents = {
+            'format': _CHECKPOINT_FORMAT,
+            'compression': compression,
+            'chunks': communicator.Nproc,
+            'globalNumberOfCells': mesh.globalNumberOfCells,
+            'meshClass': mesh.__class__,
+            'meshState': meshState,
+            'meshArrays': meshArrays,
+            'variables': [(name, vars[name].name, vars[name].rank,
+                           vars[name].unit, vars[name]._old is not None)
+                          for name in names]
+        }
+
+        f = open(os.path.join(path, 'checkpoint.tmp'), 'wb')
+        try:
+            cPickle.dump(contents, f, 2)
+        finally:
+            f.close()
+        os.rename(os.path.join(path, 'checkpoint.tmp'),
+                  os.path.join(path, 'checkpoint.pickle'))
+
+    communicator.Barrier()
+
+def load_checkpoint(path, mesh=None, mmap=True):
+    """
+    Read a checkpoint written by `save_checkpoint`. Returns a `dict` of
+    the restored `CellVariable` objects and their `Mesh`.
+
+    Every process reads only the cells it needs straight from the files
+    the writing processes left behind, so a checkpoint can be restarted
+    on a different number of processes than wrote it.
+
+    :Parameters:
+      - `path`: The directory written by `save_checkpoint`.
+      - `mesh`: The `Mesh` to restore the variables onto. It must have
+        as many cells as the checkpointed mesh, in the same order. If
+        `None`, the checkpointed mesh is rebuilt. A `Grid` is rebuilt from
+        its parameters, and so is partitioned over the current processes.
+        Any other mesh is rebuilt from the arrays of process 0, which only
+        describe the whole mesh if the checkpoint was written by a single
+        process; a checkpoint of such a mesh written in parallel must be
+        given its `mesh`.
+      - `mmap`: Whether to memory-map uncompressed arrays rather than
+        read them into memory.
+
+    A checkpoint of an unstructured mesh cannot be rebuilt from process
+    0's partition alone
+
+        >>> import shutil, tempfile
+        >>> from fipy.meshes import Tri2D
+        >>> from fipy.variables.cellVariable import CellVariable
+        >>> tri = Tri2D(nx=2, ny=1) + ((1,), (0,))
+        >>> path = tempfile.mkdtemp()
+        >>> save_checkpoint({'x': CellVariable(mesh=tri, value=tri.x)}, tri, path)
+        >>> f = open(os.path.join(path, 'checkpoint.pickle'), 'rb')
+        >>> contents = cPickle.load(f)
+        >>> f.close()
+        >>> contents['chunks'] = 2
+        >>> f = open(os.path.join(path, 'checkpoint.pickle'), 'wb')
+        >>> cPickle.dump(contents, f, 2)
+        >>> f.close()
+        >>> vars, newMesh = load_checkpoint(path)
+        Traceback (most recent call last):
+            ...
+        ValueError: the checkpointed Mesh2D was written by 2 processes and must be given as `mesh`
+        >>> shutil.rmtree(path)
+
+    """
+    f = open(os.path.join(path, 'checkpoint.pickle'), 'rb')
+    try:
+        contents = cPickle.load(f)
+    finally:
+        f.close()
+
+    if contents['format'] != _CHECKPOINT_FORMAT:
+        raise IOError("unknown checkpoint format %s" % contents['format'])
+
+    compression = contents['compression']
+
+    if mesh is None:
+        from fipy.meshes.representations.gridRepresentation import _GridRepresentation
+        klass = contents['meshClass']
+        if (contents['chunks'] > 1
+            and not issubclass(contents['meshState']['_RepresentationClass'],
+                               _GridRepresentation)):
+            raise ValueError("the checkpointed %s was written by %d processes and must be given as `mesh`"
+                             % (klass.__name__, contents['chunks']))
+        meshState = contents['meshState'].copy()
+        for key, masked in contents['meshArrays']:
+            value = numerix.array(_readArray(path, 'mesh.' + key, compression, mmap))
+            if masked:
+                value = numerix.MA.array(value,
+                                         mask=_readArray(path, 'mesh.' + key + '.mask',
+                                                         compression, mmap))
+            meshState[key] = value
+        mesh = klass.__new__(klass)
+        mesh.__setstate__(meshState)
+    elif mesh.globalNumberOfCells != contents['globalNumberOfCells']:
+        raise ValueError("the mesh has %d cells, but the checkpoint has %d"
+                         % (mesh.globalNumberOfCells, contents['globalNumberOfCells']))
+
+    ## look up each stored global cell ID among the local overlapping
+    ## cells by a sorted search, so no global-sized array is needed
+    neededIDs = numerix.asarray(mesh._globalOverlappingCellIDs)
+    order = numerix.argsort(neededIDs)
+    sortedIDs = neededIDs[order]
+
+    chunks = []
+    for rank in range(contents['chunks']):
+        cellIDs = _readArray(path, 'cells.%d' % rank, compression, mmap)
+        if len(sortedIDs) == 0 or len(cellIDs) == 0:
+            continue
+        found = numerix.searchsorted(sortedIDs, cellIDs).clip(0, len(sortedIDs) - 1)
+        used = numerix.nonzero(sortedIDs[found] == cellIDs)[0]
+        if len(used) > 0:
+            chunks.append((rank, used, order[found[used]]))
+
+    def gather(prefix, i):
+        value = None
+        for rank, used, local in chunks:
+            chunk = _readArray(path, '%s.%d.%d' % (prefix, i, rank), compression, mmap)
+            if value is None:
+                value = numerix.empty(chunk.shape[:-1] + (len(neededIDs),), chunk.dtype)
+            value[..., local] = chunk[..., used]
+        return value
+
+    from fipy.variables.cellVariable import CellVariable
+
+    vars = {}
+    for i, (key, name, rank, unit, hasOld) in enumerate(contents['variables']):
+        var = CellVariable(mesh=mesh, name=name, rank=rank, unit=unit,
+                           value=gather('value', i), hasOld=hasOld)
+        if hasOld:
+            var._old.value = gather('old', i)
+        vars[key] = var
+
+    return vars, mesh
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "fastMarching.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+"""Fast marching on the cell-to-cell connectivity of any mesh
+"""
+__docformat__ = 'restructuredtext'
+
+import heapq
+import itertools
+import math
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+
+__all__ = []
+
+class _FastMarcher(object):
+    r"""
+    Solves :math:`\abs{\nabla \phi} = 1` outward from the zero level set of
+    :math:`\phi`, using only the cell centers and the cell-to-cell
+    connectivity of a mesh, so that any `Mesh` can be used.
+
+    Cells next to the zero level set are initialized from the points where
+    the linear interpolant of :math:`\phi` crosses zero along their
+    cell-to-cell connections. The remaining cells are accepted in order of
+    increasing distance from a binary heap. Each trial cell is updated from
+    every simplex formed by up to `dim` of its accepted neighbors, keeping
+    the smallest upwind solution. On a grid, this is the usual first-order
+    fast marching stencil; with `order=2`, a neighbor is replaced by the
+    second-order one-sided difference whenever the next cell along the same
+    direction is also accepted.
+
+    >>> from fipy import Grid1D, Grid2D, Grid3D, Tri2D
+    >>> from fipy.tools import serialComm
+    >>> mesh = Grid1D(dx=.5, nx=8, communicator=serialComm)
+    >>> phi = numerix.array((-1., -1., -1., -1., 1., 1., 1., 1.))
+    >>> print numerix.allclose(_FastMarcher(mesh).distance(phi),
+    ...                        (-1.75, -1.25, -.75, -0.25, 0.25, 0.75, 1.25, 1.75))
+    True
+
+    Cells with neighbors across the interface in more than one direction
+    use the plane through the crossing points
+
+    >>> mesh = Grid2D(nx=2, ny=2, communicator=serialComm)
+    >>> d = _FastMarcher(mesh).distance(numerix.array((-1., 1., 1., 1.)))
+    >>> tmp = 1 / numerix.sqrt(2)
+    >>> print numerix.allclose(d, (-tmp / 2, 0.5, 0.5, 0.5 + tmp))
+    True
+
+    Non-orthogonal neighbors are handled by the same simplex update.
+
+    >>> dx, dy = 1., 2.
+    >>> mesh = Grid2D(dx=dx, dy=dy, nx=2, ny=3, communicator=serialComm)
+    >>> d = _FastMarcher(mesh).distance(numerix.array((-1., 1., 1., 1., -1., 1.)))
+    >>> vbl = -dx * dy / numerix.sqrt(dx**2 + dy**2) / 2.
+    >>> vbr = dx / 2
+    >>> vml = dy / 2.
+    >>> dsq = dx**2 + dy**2
+    >>> top = vbr * dx**2 + vml * dy**2
+    >>> sqrt = numerix.sqrt((dx * dy)**2 * (dsq - (vbr - vml)**2))
+    >>> vmr = (top + sqrt) / dsq
+    >>> print numerix.allclose(d, (vbl, vbr, vml, vmr, vbl, vbr))
+    True
+
+    The distance from a sphere on a `Grid3D` is accurate to a fraction of a
+    cell with second order
+
+    >>> dx = [.1] * 20
+    >>> mesh = Grid3D(dx=dx, dy=dx, dz=dx, communicator=serialComm)
+    >>> x, y, z = mesh.cellCenters
+    >>> r = numerix.sqrt((x - 1.)**2 + (y - 1.)**2 + (z - 1.)**2)
+    >>> d = _FastMarcher(mesh).distance(numerix.array(r - .5), order=2)
+    >>> print abs(d - (r - .5)).max() < 0.4 * .1
+    True
+
+    as is the distance from a circle on a triangulated mesh
+
+    >>> mesh = Tri2D(nx=20, ny=20, dx=.1, dy=.1)
+    >>> x, y = mesh.cellCenters
+    >>> r = numerix.sqrt((x - 1.)**2 + (y - 1.)**2)
+    >>> d = _FastMarcher(mesh).distance(numerix.array(r - .5))
+    >>> print abs(d - (r - .5)).max() < 0.4 * .1
+    True
+
+    `extend()` carries values from the cells on the non-negative side of
+    the zero level set along the characteristics of the distance function
+
+    >>> mesh = Grid2D(nx=2, ny=2, communicator=serialComm)
+    >>> marcher = _FastMarcher(mesh)
+    >>> d = marcher.distance(numerix.array((-1., 1., 1., 1.)))
+    >>> print marcher.extend(d, numerix.array((-1., .5, 2., -1.)), order=1)
+    [ 1.25  0.5   2.    1.25]
+
+    Marching can be restricted to a narrow band around the zero level set
+
+    >>> mesh = Grid1D(dx=.5, nx=8, communicator=serialComm)
+    >>> marcher = _FastMarcher(mesh)
+    >>> phi = numerix.array((-1., -1., -1., -1., 1., 1., 1., 1.))
+    >>> print marcher.distance(phi, narrow=1.)
+    [-1.   -1.   -0.75 -0.25  0.25  0.75  1.    1.  ]
+    >>> print marcher.extend(phi, numerix.arange(8.), narrow=1.)
+    [ 0.  1.  4.  4.  4.  4.  6.  7.]
+
+    A mesh with no zero level set is left as it is
+
+    >>> marcher = _FastMarcher(Grid2D(nx=2, ny=2, communicator=serialComm))
+    >>> print marcher.distance(numerix.array((1., 2., 3., 4.)))
+    [ 1.  2.  3.  4.]
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.dim = mesh.dim
+
+        cellToCellIDs = MA.filled(mesh._cellToCellIDs, -1)
+        centers = numerix.array(mesh.cellCenters)
+        valid = cellToCellIDs >= 0
+
+        vectors = numerix.take(centers, numerix.where(valid, cellToCellIDs, 0), axis=1) - centers[:, numerix.newaxis]
+        vectors = numerix.where(valid[numerix.newaxis], vectors, 0.)
+
+        self._cellToCellIDs = cellToCellIDs
+        self._valid = valid
+        self._vectors = vectors
+        self._nextIDs = self._calcNextIDs(cellToCellIDs, valid, vectors)
+
+        self._neighbors = None
+
+    @staticmethod
+    def _calcNextIDs(cellToCellIDs, valid, vectors):
+        """ID of the cell one step further along each cell-to-cell direction, or -1
+        """
+        distances = numerix.sqrt((vectors**2).sum(0))
+        nextIDs = -numerix.ones(cellToCellIDs.shape, 'l')
+        neighborIDs = numerix.where(valid, cellToCellIDs, 0)
+        for m in range(cellToCellIDs.shape[0]):
+            ids = neighborIDs[m]
+            further = numerix.take(vectors, ids, axis=2)
+            mismatch = numerix.sqrt(((further - vectors[:, m, numerix.newaxis])**2).sum(0))
+            matches = (mismatch < 1e-6 * distances[m]) & numerix.take(valid, ids, axis=1) & valid[m]
+            found = matches.any(0)
+            first = matches.argmax(0)
+            nextIDs[m] = numerix.where(found, numerix.take(cellToCellIDs, ids, axis=1)[first, numerix.arange(len(ids))], -1)
+
+        return nextIDs
+
+    def _isGridLike(self):
+        """Whether the connections of each cell are mutually orthogonal or opposite
+        """
+        distances = numerix.sqrt((self._vectors**2).sum(0))
+        directions = self._vectors / numerix.where(self._valid, distances, 1.)
+        cosines = (directions[:, :, numerix.newaxis] * directions[:, numerix.newaxis]).sum(0)
+        M = self._valid.shape[0]
+        pairs = self._valid[:, numerix.newaxis] & self._valid[numerix.newaxis] & ~numerix.identity(M, 'bool')[..., numerix.newaxis]
+        return (~pairs | (abs(cosines) < 1e-6) | (cosines < -1 + 1e-6)).all(0).all(0)
+
+    def _getNeighbors(self):
+        """Stencil of each cell, as lists of (ID, vector, next ID), and the
+        cells whose stencils contain each cell.
+
+        Cells whose connections are not those of a grid also use the
+        neighbors of their neighbors, as the simplices formed by adjacent
+        cells of an unstructured mesh often do not contain the
+        characteristic.
+        """
+        if self._neighbors is None:
+            ids = self._cellToCellIDs.swapaxes(0, 1).tolist()
+            nextIDs = self._nextIDs.swapaxes(0, 1).tolist()
+            vectors = self._vectors.transpose((2, 1, 0)).tolist()
+            stencils = [[(j, tuple(a), nxt) for j, a, nxt in zip(cellIDs, cellVectors, cellNext) if j >= 0]
+                        for cellIDs, cellVectors, cellNext in zip(ids, vectors, nextIDs)]
+
+            irregular = numerix.nonzero(~self._isGridLike())[0]
+            if len(irregular) > 0:
+                centers = numerix.array(self.mesh.cellCenters).swapaxes(0, 1).tolist()
+                adjacent = [set([j for j in cellIDs if j >= 0]) for cellIDs in ids]
+                for i in irregular:
+                    xi = centers[i]
+                    for j in sorted(set().union(*[adjacent[k] for k in adjacent[i]]) - adjacent[i] - set([i])):
+                        stencils[i].append((j, tuple([xj - x for xj, x in zip(centers[j], xi)]), -1))
+
+            dependents = [[] for i in range(len(stencils))]
+            for i, stencil in enumerate(stencils):
+                for j, a, nxt in stencil:
+                    dependents[j].append(i)
+
+            self._neighbors = (stencils, dependents)
+        return self._neighbors
+
+    def _initialize(self, phi):
+        r"""Distance to the zero level set of the cells adjacent to it
+
+        Returns the distances, a mask of the initialized cells, the IDs of
+        the cells across the level set that were used and their weights.
+        The zero level set is approximated, for each cell, by the plane
+        through up to `dim` linearly independent crossing points, nearest
+        first.
+        """
+        M, N = self._cellToCellIDs.shape
+        neighborIDs = numerix.where(self._valid, self._cellToCellIDs, 0)
+        phiAdjacent = numerix.take(phi, neighborIDs)
+
+        crossing = self._valid & (phi * phiAdjacent < 0)
+        theta = numerix.where(crossing, phi / numerix.where(crossing, phi - phiAdjacent, 1.), 0.)
+        points = theta * self._vectors
+        lengths = numerix.where(crossing, numerix.sqrt((points**2).sum(0)), numerix.inf)
+
+        cells = numerix.nonzero(crossing.any(0))[0]
+        order = numerix.argsort(lengths[:, cells], axis=0)
+        points = points[..., cells]
+        lengths = lengths[:, cells]
+        crossing = crossing[:, cells]
+        n = len(cells)
+        index = numerix.arange(n)
+
+        dim = self.dim
+        basis = numerix.zeros((dim, dim, n), 'd')
+        chosen = numerix.zeros((dim, n), 'l')
+        count = numerix.zeros((n,), 'l')
+        for m in range(M):
+            slot = order[m]
+            point = points[:, slot, index]
+            residual = point.copy()
+            for q in range(dim):
+                residual -= (point * basis[:, q]).sum(0) * basis[:, q]
+            size = numerix.sqrt((residual**2).sum(0))
+            accept = (crossing[slot, index]
+                      & (size > 1e-8 * lengths[slot, index])
+                      & (count < dim))
+            accepted = numerix.nonzero(accept)[0]
+            basis[:, count[accepted], accepted] = residual[:, accepted] / size[accepted]
+            chosen[count[accepted], accepted] = slot[accepted]
+            count[accepted] += 1
+
+        used = numerix.arange(dim)[:, numerix.newaxis] < count
+        selected = points[:, chosen, index] * used
+        gram = (selected[:, :, numerix.newaxis] * selected[:, numerix.newaxis]).sum(0)
+        gram += numerix.identity(dim)[..., numerix.newaxis] * ~used
+        ones = used.astype('d')
+        solution = numerix.linalg.solve(gram.transpose((2, 0, 1)), ones.swapaxes(0, 1)[..., numerix.newaxis])[..., 0]
+        norm = (solution * ones.swapaxes(0, 1)).sum(1)
+        weights = (solution / norm[:, numerix.newaxis]).swapaxes(0, 1) * used
+        distances = 1. / numerix.sqrt(norm)
+
+        nearest = lengths.min(0)
+        outside = (weights < -1e-10).any(0) | (distances > nearest) | ~numerix.isfinite(distances)
+        distances = numerix.where(outside, nearest, distances)
+        weights = numerix.where(outside[numerix.newaxis], numerix.arange(dim)[:, numerix.newaxis] == 0, weights)
+        chosen = numerix.where(outside[numerix.newaxis], order[:1], chosen)
+
+        initialized = numerix.zeros((N,), 'bool')
+        initialized[cells] = True
+        initialDistances = numerix.zeros((N,), 'd')
+        initialDistances[cells] = distances
+
+        return initialDistances, initialized, cells, self._cellToCellIDs[chosen, cells], weights
+
+    def _march(self, phi, order=2, extension=None, narrow=None):
+        N = len(phi)
+        initialDistances, initialized, cells, partners, weights = self._initialize(phi)
+
+        value = abs(numerix.array(phi, 'd'))
+        known = initialized | (phi == 0)
+        value[known] = initialDistances[known]
+
+        if extension is not None:
+            extension = numerix.array(extension, 'd')
+            original = extension.copy()
+            masked = phi[cells] < 0
+            extension[cells[masked]] = (numerix.take(extension, partners[:, masked])
+                                        * weights[:, masked]).sum(0)
+
+        if not known.any():
+            return value, extension
+
+        neighbors, dependents = self._getNeighbors()
+        value = value.tolist()
+        known = known.tolist()
+        if extension is not None:
+            extension = extension.tolist()
+
+        side = numerix.sign(phi).astype('l').tolist()
+        tentative = [None] * N
+        heap = []
+
+        def update(i):
+            t, u = self._update(neighbors[i], side[i], side, value, known, extension, order)
+            if t is not None:
+                tentative[i] = t
+                value[i] = t
+                if extension is not None:
+                    extension[i] = u
+                heapq.heappush(heap, (t, i))
+
+        for i in numerix.nonzero(known)[0]:
+            for j in dependents[i]:
+                if not known[j] and tentative[j] is None:
+                    update(j)
+
+        while heap:
+            t, i = heapq.heappop(heap)
+            if narrow is not None and t > narrow:
+                break
+            if known[i] or t != tentative[i]:
+                continue
+            known[i] = True
+            for j in dependents[i]:
+                if not known[j]:
+                    update(j)
+
+        value = numerix.array(value)
+        if narrow is not None:
+            known = numerix.array(known, 'bool')
+            value[~known] = narrow
+            if extension is not None:
+                extension = numerix.where(known, extension, original)
+
+        return value, extension
+
+    def _update(self, neighbors, sign, side, value, known, extension, order):
+        candidates = []
+        for j, a, nxt in neighbors:
+            if known[j] and side[j] in (0, sign):
+                v = value[j]
+                if extension is None:
+                    u = None
+                else:
+                    u = extension[j]
+                if (order == 2 and nxt >= 0 and known[nxt]
+                    and side[nxt] in (0, sign) and value[nxt] <= v):
+                    v = (4 * v - value[nxt]) / 3.
+                    a = tuple([2. * ai / 3. for ai in a])
+                    if u is not None:
+                        u = (4 * u - extension[nxt]) / 3.
+                candidates.append((v, a, u))
+
+        best = None
+        bestU = None
+        for k in range(1, min(self.dim, len(candidates)) + 1):
+            for subset in itertools.combinations(candidates, k):
+                t, mu = _simplexUpdate(subset)
+                if t is not None and (best is None or t < best):
+                    best = t
+                    if extension is not None:
+                        bestU = sum([m * s[2] for m, s in zip(mu, subset)]) / sum(mu)
+
+        return best, bestU
+
+    def distance(self, phi, order=2, narrow=None):
+        """Signed distance to the zero level set of `phi`
+
+        If `narrow` is given, marching stops at that distance and the cells
+        beyond it are set to `narrow`, with the sign of `phi`.
+        """
+        phi = numerix.array(phi, 'd')
+        value, extension = self._march(phi, order=order, narrow=narrow)
+        return numerix.where(phi < 0, -value, value)
+
+    def extend(self, phi, extension, order=2, narrow=None):
+        """Extend `extension` from the cells where `phi` is non-negative and
+        adjacent to the zero level set, so that its gradient is orthogonal to
+        that of the distance function.
+
+        If `narrow` is given, only the cells within that distance of the
+        zero level set are changed.
+        """
+        phi = numerix.array(phi, 'd')
+        value, extension = self._march(phi, order=order, extension=extension, narrow=narrow)
+        return numerix.array(extension)
+
+def _simplexUpdate(subset):
+    r"""Value at a cell for which :math:`\abs{\nabla \phi} = 1` on the simplex
+    formed with `subset`, a sequence of (value, vector, extension) of its
+    accepted neighbors, or `None` if the characteristic does not pass
+    through the simplex.
+
+    Also returns the weights of the neighbors along the characteristic.
+    """
+    k = len(subset)
+    if k == 1:
+        v, a, u = subset[0]
+        length = math.sqrt(sum([ai * ai for ai in a]))
+        return v + length, (1.,)
+
+    gram = [[sum([ai * aj for ai, aj in zip(s[1], r[1])]) for r in subset] for s in subset]
+    if min([min(row) for row in gram]) < 0:
+        # obtuse simplices are not causal and can undershoot
+        return None, None
+    inverse = _invert(gram)
+    if inverse is None:
+        return None, None
+
+    v = [s[0] for s in subset]
+    A = sum([sum(row) for row in inverse])
+    B = sum([sum([g * vj for g, vj in zip(row, v)]) for row in inverse])
+    C = sum([vi * sum([g * vj for g, vj in zip(row, v)]) for vi, row in zip(v, inverse)]) - 1.
+    discriminant = B * B - A * C
+    if A <= 0 or discriminant < 0:
+        return None, None
+
+    t = (B + math.sqrt(discriminant)) / A
+    mu = [sum([g * (t - vj) for g, vj in zip(row, v)]) for row in inverse]
+    if min(mu) < -1e-12 * max([abs(m) for m in mu]):
+        return None, None
+
+    return t, [max(m, 0.) for m in mu]
+
+def _invert(matrix):
+    """Inverse of a symmetric 2x2 or 3x3 matrix, or `None` if it is (nearly) singular
+    """
+    if len(matrix) == 2:
+        (a, b), (c, d) = matrix
+        det = a * d - b * c
+        if det <= 1e-10 * a * d:
+            return None
+        return [[d / det, -b / det], [-c / det, a / det]]
+    else:
+        (a, b, c), (d, e, f), (g, h, i) = matrix
+        A = e * i - f * h
+        B = -(d * i - f * g)
+        C = d * h - e * g
+        det = a * A + b * B + c * C
+        if det <= 1e-10 * a * e * i:
+            return None
+        return [[A / det, -(b * i - c * h) / det, (b * f - c * e) / det],
+                [B / det, (a * i - c * g) / det, -(a * f - c * d) / det],
+                [C / det, -(a * h - b * g) / det, (a * e - b * d) / det]]
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
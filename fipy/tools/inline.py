@@ -4,10 +4,60 @@ import inspect
 import os
 import sys
 
-if '--inline' in [s.lower() for s in sys.argv[1:]]:
-    doInline = True
-else:
-    doInline = 'FIPY_INLINE' in os.environ
+def _weaveAvailable():
+    try:
+        import weave
+    except ImportError:
+        return False
+    return True
+
+def _compilerAvailable():
+    from distutils.spawn import find_executable
+    return find_executable(os.environ.get('CC', 'cc')) is not None
+
+_backends = {
+    'weave': _weaveAvailable,
+    'cc': _compilerAvailable
+}
+
+def _chooseBackend():
+    """Pick the inline backend requested by `FIPY_INLINE` or `--inline`
+
+    `FIPY_INLINE` may name a backend ("weave" or "cc"); any other value,
+    or the `--inline` flag, chooses the first one available. If the
+    requested backend is not available, inlining is switched off and the
+    NumPy implementations are used.
+    """
+    if '--inline' in [s.lower() for s in sys.argv[1:]]:
+        requested = os.environ.get('FIPY_INLINE', '')
+    elif 'FIPY_INLINE' in os.environ:
+        requested = os.environ['FIPY_INLINE']
+    else:
+        return None
+
+    requested = requested.lower()
+    if requested in _backends:
+        candidates = [requested]
+    else:
+        candidates = ['weave', 'cc']
+
+    for backend in candidates:
+        if _backends[backend]():
+            return backend
+
+    import warnings
+    warnings.warn("No inline backend is available (tried %s). Falling back to NumPy." % ", ".join(candidates),
+                  UserWarning, stacklevel=2)
+    return None
+
+_backend = _chooseBackend()
+doInline = _backend is not None
+
+from fipy.tests.doctestPlus import register_skipper
+
+register_skipper(flag="CC",
+                 test=_compilerAvailable,
+                 why="no C compiler is available for the `cc` inline backend")
 
 _inlineFrameComment = 'FIPY_INLINE_COMMENT' in os.environ
 
@@ -95,20 +145,7 @@ def _runInline(code_in, converters=None, verbose=0, comment=None, **args):
 
     code = "\n" + comment + "\n" + code
 
-    import weave
-
-    for key in args.keys():
-        if hasattr(args[key], 'dtype') and args[key].dtype.char == '?':
-            args[key] = args[key].astype('B')
-
-    weave.inline(code,
-                 args.keys(),
-                 local_dict=args,
-                 type_converters=None, #weave.converters.blitz,
-                 compiler = 'gcc',
-                 force=0,
-                 verbose = 0 or verbose,
-                 extra_compile_args =['-O3'])
+    _compileAndRun(code, args, verbose=verbose)
 
 def _runIterateElementInline(code_in, converters=None, verbose=0, comment=None, **args):
     loops = """
@@ -146,21 +183,9 @@ for(i=0; i < ni; i++) {
 
     code = "\n" + comment + "\n" + code
 
-    import weave
-
-    for key in args.keys():
-        if hasattr(args[key], 'dtype') and args[key].dtype.char == '?':
-            args[key] = args[key].astype('B')
+    _compileAndRun(code, args, verbose=verbose, iterateElements=True)
 
-    weave.inline(code,
-                 args.keys(),
-                 local_dict=args,
-                 type_converters=None, #weave.converters.blitz,
-                 compiler = 'gcc',
-                 force=0,
-                 verbose = 0 or verbose,
-                 extra_compile_args =['-O3'],
-                 support_code="""
+_weaveArrayIndex = """
 
 // returns the index (accounting for strides) of the tensor element vec
 // in position i of array
@@ -180,4 +205,205 @@ static int arrayIndex(PyArrayObject* array, int i, int vec[])
 
     return index / array->descr->elsize;
 }
-                 """)
+"""
+
+def _compileAndRun(code, args, verbose=0, iterateElements=False):
+    for key in args.keys():
+        if hasattr(args[key], 'dtype') and args[key].dtype.char == '?':
+            args[key] = args[key].astype('B')
+
+    if _backend == 'cc':
+        _CKernel.get(code, args).run(args)
+    else:
+        import weave
+
+        if iterateElements:
+            support_code = _weaveArrayIndex
+        else:
+            support_code = None
+
+        weave.inline(code,
+                     args.keys(),
+                     local_dict=args,
+                     type_converters=None, #weave.converters.blitz,
+                     compiler = 'gcc',
+                     force=0,
+                     verbose = 0 or verbose,
+                     extra_compile_args =['-O3'],
+                     support_code=support_code)
+
+class _CKernel(object):
+    """A kernel compiled with the system C compiler and called via `ctypes`
+
+    This is the "cc" backend, an alternative to :mod:`weave`. The same
+    kernel source is wrapped in a plain C function taking one argument per
+    scalar and, for each array, its data pointer, rank, strides and item
+    size (so that `ITEM()` works on non-contiguous arrays). Compiled
+    kernels are kept in memory and in an on-disk cache (`FIPY_INLINE_CACHE`,
+    by default `~/.fipy/inline`), keyed on the source and argument types.
+
+        >>> from fipy.tools import numerix
+        >>> args = dict(b=numerix.zeros((3,), 'd'), ids=numerix.arange(3), x=2., ni=3)
+        >>> code = "int i; for (i=0; i < ni; i++) b[i] += x * ids[i];"
+        >>> _CKernel.get(code, args).run(args) # doctest: +CC
+        >>> print args['b'] # doctest: +CC
+        [ 0.  2.  4.]
+    """
+
+    _kernels = {}
+
+    _cTypes = {
+        'd': 'double', 'f': 'float', 'g': 'long double',
+        'b': 'signed char', 'B': 'unsigned char',
+        'h': 'short', 'H': 'unsigned short',
+        'i': 'int', 'I': 'unsigned int',
+        'l': 'long', 'L': 'unsigned long',
+        'q': 'long long', 'Q': 'unsigned long long'
+    }
+
+    _cScalars = {
+        'd': 'c_double', 'f': 'c_float', 'g': 'c_longdouble',
+        'b': 'c_byte', 'B': 'c_ubyte',
+        'h': 'c_short', 'H': 'c_ushort',
+        'i': 'c_int', 'I': 'c_uint',
+        'l': 'c_long', 'L': 'c_ulong',
+        'q': 'c_longlong', 'Q': 'c_ulonglong'
+    }
+
+    _support = """
+#include <math.h>
+#include <stdlib.h>
+
+static long arrayIndex(int nd, const long* strides, long elsize, int i, int vec[])
+{
+    long index = strides[nd-1] * (long) i;
+
+    if (vec != NULL) {
+        int j;
+        for (j=0; j < nd - 1; j++) {
+            index += strides[j] * vec[j];
+        }
+    }
+
+    return index / elsize;
+}
+"""
+
+    def __init__(self, path, names, kinds):
+        import ctypes
+
+        self.names = names
+        self.kinds = kinds
+        self.function = ctypes.CDLL(path).fipy_kernel
+        self.function.restype = None
+
+    @staticmethod
+    def _kind(value):
+        from fipy.tools import numerix
+
+        if isinstance(value, numerix.ndarray) and value.shape != ():
+            return ('array', value.dtype.char)
+        elif isinstance(value, (bool, int, long)):
+            return ('scalar', 'l')
+        elif isinstance(value, float):
+            return ('scalar', 'd')
+        elif isinstance(value, (numerix.ndarray, numerix.generic)):
+            return ('scalar', numerix.asarray(value).dtype.char)
+        else:
+            raise TypeError("Cannot pass %s to an inline kernel" % type(value))
+
+    @classmethod
+    def get(cls, code, args):
+        names = sorted(args.keys())
+        kinds = tuple([cls._kind(args[name]) for name in names])
+        key = (code, tuple(names), kinds)
+
+        if key not in cls._kernels:
+            cls._kernels[key] = cls._build(code, names, kinds)
+
+        return cls._kernels[key]
+
+    @classmethod
+    def _source(cls, code, names, kinds):
+        params = []
+        defines = []
+        for name, (kind, char) in zip(names, kinds):
+            if char not in cls._cTypes:
+                raise TypeError("Cannot pass arrays of type '%s' to an inline kernel" % char)
+            ctype = cls._cTypes[char]
+            if kind == 'array':
+                params += ["%s* %s" % (ctype, name),
+                           "int %s_nd" % name,
+                           "const long* %s_strides" % name,
+                           "long %s_elsize" % name]
+                defines.append("#define %(name)s_array %(name)s_nd, %(name)s_strides, %(name)s_elsize" % locals())
+            else:
+                params.append("%s %s" % (ctype, name))
+
+        return "%s\n%s\n\nvoid fipy_kernel(%s)\n{\n%s\n}\n" \
+          % (cls._support, "\n".join(defines), ",\n                ".join(params), code)
+
+    @classmethod
+    def _build(cls, code, names, kinds):
+        import hashlib
+        import tempfile
+        import subprocess
+
+        source = cls._source(code, names, kinds)
+
+        cacheDir = os.environ.get('FIPY_INLINE_CACHE',
+                                  os.path.join(os.path.expanduser('~'), '.fipy', 'inline'))
+        if not os.path.isdir(cacheDir):
+            try:
+                os.makedirs(cacheDir)
+            except OSError:
+                cacheDir = tempfile.mkdtemp(prefix='fipy-inline-')
+
+        compiler = os.environ.get('CC', 'cc')
+        flags = ['-O3', '-shared', '-fPIC']
+
+        digest = hashlib.sha1(" ".join([compiler] + flags) + source).hexdigest()
+        path = os.path.join(cacheDir, "fipy_kernel_%s.so" % digest)
+
+        if not os.path.exists(path):
+            fd, sourcePath = tempfile.mkstemp(suffix='.c', dir=cacheDir)
+            os.write(fd, source)
+            os.close(fd)
+
+            # compile to a private name and rename, so that concurrent
+            # processes never load a partially written library
+            tmpPath = sourcePath[:-2] + '.so'
+            try:
+                subprocess.check_call([compiler] + flags + ['-o', tmpPath, sourcePath])
+                os.rename(tmpPath, path)
+            finally:
+                os.remove(sourcePath)
+
+        return cls(path, names, kinds)
+
+    def run(self, args):
+        import ctypes
+        from fipy.tools import numerix
+
+        cargs = []
+        keep = []
+        for name, (kind, char) in zip(self.names, self.kinds):
+            value = args[name]
+            if kind == 'array':
+                strides = numerix.array(value.strides, 'l')
+                keep.append(strides)
+                cargs += [ctypes.c_void_p(value.ctypes.data),
+                          ctypes.c_int(value.ndim),
+                          ctypes.c_void_p(strides.ctypes.data),
+                          ctypes.c_long(value.itemsize)]
+            else:
+                cargs.append(getattr(ctypes, self._cScalars[char])(numerix.array(value, char).item()))
+
+        self.function(*cargs)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
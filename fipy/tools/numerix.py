@@ -429,13 +429,11 @@ if inline.doInline:
 
         Usually used with v1==v2 to return magnitude of v1.
         """
-        unit1 = unit2 = 1
-
         def dimensionlessUnmasked(a):
-            unit = 1
+            unit = None
             mask = False
             if _isPhysical(a):
-                unit = a.inBaseUnits().getUnit()
+                unit = a.inBaseUnits().unit
                 a = a.numericValue
             if MA.isMaskedArray(a):
                 mask = a.mask
@@ -463,9 +461,12 @@ if inline.doInline:
         if NUMERIX.any(mask1) or NUMERIX.any(mask2):
             result1 = MA.array(result1, mask=NUMERIX.logical_or(mask1, mask2))
 
-        if unit1 != 1 or unit2 != 1:
-            from fipy.tools.dimensions.physicalField import PhysicalField
-            result1 = PhysicalField(value=result, unit=(unit1 * unit2)**0.5)
+        units = [u for u in (unit1, unit2) if u is not None]
+        if len(units) > 0:
+            unit = reduce(lambda u1, u2: u1 * u2, units)**0.5
+            if not unit.isDimensionless():
+                from fipy.tools.dimensions.physicalField import PhysicalField
+                result1 = PhysicalField(value=result1, unit=unit)
 
         return result1
 else:
@@ -478,9 +479,52 @@ else:
         ## We can't use Numeric.dot on an array of vectors
         return sqrt(dot(a1, a2))
 
-def nearest(data, points, max_mem=1e8):
+def _nearestTree(data):
+    """Build a KD-tree of the (D, N) `data` for use by `nearest`
+
+    Returns `None` if :mod:`scipy.spatial` is not available or if `data`
+    cannot be put in a tree (e.g., it has units).
+    """
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return None
+
+    data = asanyarray(data)
+    if (_isPhysical(data) or MA.isMaskedArray(data)
+        or len(data.shape) != 2 or data.shape[-1] == 0):
+        return None
+
+    try:
+        # the sliding midpoint rule is much quicker to build and
+        # just as quick to query for points on a mesh
+        return cKDTree(data.T, balanced_tree=False, compact_nodes=False)
+    except TypeError:
+        return cKDTree(data.T)
+
+def _nearestInTree(tree, points):
+    """Find the indices of the points in `tree` that are closest to `points`
+
+    Ties are resolved in favor of the lowest index, as they are by the
+    exhaustive search in `nearest`.
+    """
+    D, M = points.shape
+    k = min(2**D, tree.n)
+    distances, indices = tree.query(points.T, k=k)
+    if k == 1:
+        return indices.astype(INT_DTYPE)
+    indices = NUMERIX.where(distances == distances[..., :1], indices, tree.n)
+    return indices.min(axis=-1).astype(INT_DTYPE)
+
+def nearest(data, points, max_mem=1e8, tree=None):
     """find the indices of `data` that are closest to `points`
 
+    If :mod:`scipy.spatial` is available, the search is done with a KD-tree,
+    in :math:`O(M \log N)` time. Otherwise, the full (N, M) table of
+    distances is computed, in chunks no larger than `max_mem` bytes.
+    A `tree` built by `_nearestTree(data)` can be passed to avoid
+    rebuilding it for each search.
+
     >>> from fipy import *
     >>> m0 = Grid2D(dx=(.1, 1., 10.), dy=(.1, 1., 10.))
     >>> m1 = Grid2D(nx=2, ny=2, dx=5., dy=5.)
@@ -490,10 +534,38 @@ def nearest(data, points, max_mem=1e8):
     [4 5 7 8]
     >>> print nearest(m0.cellCenters.globalValue, m1.cellCenters.globalValue, max_mem=10000)
     [4 5 7 8]
+    >>> tree = _nearestTree(m0.cellCenters.globalValue) # doctest: +SCIPY
+    >>> print nearest(m0.cellCenters.globalValue, m1.cellCenters.globalValue, tree=tree) # doctest: +SCIPY
+    [4 5 7 8]
+
+    Points that are equidistant from several data points get the lowest
+    index, whichever way the search is done
+
+    >>> m2 = Grid2D(nx=2, ny=2)
+    >>> print nearest(m2.cellCenters.globalValue, [[0., 1., 1.5], [0., 1., 1.]])
+    [0 0 1]
+    >>> print _nearestExhaustive(m2.cellCenters.globalValue, [[0., 1., 1.5], [0., 1., 1.]])
+    [0 0 1]
     """
     data = asanyarray(data)
     points = asanyarray(points)
 
+    if data.shape[-1] == 0:
+        return arange(0)
+
+    if (len(points.shape) == 2 and points.shape[0] == data.shape[0]
+        and not _isPhysical(points)):
+        if tree is None:
+            tree = _nearestTree(data)
+        if tree is not None:
+            return _nearestInTree(tree, points)
+
+    return _nearestExhaustive(data, points, max_mem=max_mem)
+
+def _nearestExhaustive(data, points, max_mem=1e8):
+    data = asanyarray(data)
+    points = asanyarray(points)
+
     D = data.shape[0]
     N = data.shape[-1]
     M = points.shape[-1]
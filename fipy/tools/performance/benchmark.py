@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "benchmark.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+"""Benchmarks of FiPy workloads, with a history to detect regressions.
+
+Run the suite with::
+
+    $ python -m fipy.tools.performance.benchmark --history=benchmarks.json
+
+or ``python setup.py efficiency_test``; ``--help`` lists the options.
+
+Each measurement runs in a fresh interpreter, so that the solver backend
+can be chosen and the peak memory is that of the case alone
+
+    >>> result = measure("Diffusion1D", size=1000, backend="scipy", steps=2) # doctest: +SCIPY
+    >>> print result["case"], result["backend"], result["cells"], result["steps"] # doctest: +SCIPY
+    Diffusion1D scipy 1000 2
+    >>> print result["assembly"] > 0, result["solve"] > 0, result["peakRSS"] > 0 # doctest: +SCIPY
+    True True True
+    >>> print result["iterations"] > 0 # doctest: +SCIPY
+    True
+    >>> print sorted(result["highWater"].keys()) # doctest: +SCIPY
+    [u'assemble', u'build', u'evaluate', u'mesh', u'solve']
+
+A backend that is not installed cannot be measured
+
+    >>> print measure("Diffusion1D", size=10, backend="nonsense")
+    None
+
+"""
+__docformat__ = 'restructuredtext'
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from fipy.tools.performance.benchmarkCases import Benchmark
+from fipy.tools.performance.importTime import _environment
+from fipy.tools.performance.memoryUsage import _highWater
+
+__all__ = ["measure", "run", "BenchmarkHistory"]
+
+_script = """
+import json
+try:
+    # not `from fipy import solvers`, which would import `fipy.solvers`
+    # a second time after it fails, obscuring the reason
+    import fipy.solvers
+except ImportError, e:
+    result = {"unavailable": str(e)}
+else:
+    from fipy.tools.performance.benchmark import _measure
+    result = _measure(%r, %r, %r)
+print json.dumps(result)
+"""
+
+def _measure(case, size, steps):
+    import fipy.solvers
+    from fipy.tools import numerix
+    from fipy.tools.profiling import Profile
+
+    benchmark = Benchmark._case(case)(size=size)
+    if not benchmark.isAvailable():
+        return {"unavailable": "%s cannot run here" % case}
+
+    if steps is None:
+        steps = benchmark.steps
+
+    start = time.time()
+    benchmark.setup()
+    setup = time.time() - start
+
+    with Profile() as profile:
+        start = time.time()
+        for step in range(steps):
+            benchmark.step()
+        total = time.time() - start
+
+    benchmark.cleanup()
+
+    seconds = dict.fromkeys(["build", "assemble", "solve"], 0.)
+    highWater = {}
+    iterations = None
+    for (phase, name), record in profile.records.items():
+        if phase in seconds:
+            seconds[phase] += record["seconds"]
+        highWater[phase] = highWater.get(phase, 0) + record["highWater"]
+        if phase == "solve" and record["iterations"] is not None:
+            iterations = (iterations or 0) + record["iterations"]
+
+    return {"case": case,
+            "size": size,
+            "cells": int(benchmark.mesh.numberOfCells),
+            "steps": steps,
+            "backend": fipy.solvers.solver,
+            "setup": setup,
+            "total": total,
+            "assembly": seconds["build"] + seconds["assemble"],
+            "solve": seconds["solve"],
+            "iterations": iterations,
+            "peakRSS": _highWater(),
+            "highWater": highWater,
+            "fipy": fipy.__version__,
+            "numpy": numerix.__version__,
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def measure(case, size, backend=None, steps=None):
+    """
+    Time `case` on a mesh of `size` in a fresh interpreter.
+
+    Returns a dictionary of the seconds spent in ``setup``, in all of the
+    steps (``total``), building and assembling the equations
+    (``assembly``) and in the solver (``solve``), the solver
+    ``iterations`` (if the solver reports them), the ``peakRSS`` of the
+    interpreter in bytes and the bytes by which each phase of the steps
+    raised it (``highWater``; see `fipy.tools.profiling.Profile`), along
+    with the versions and host they were measured with. Returns `None` if the `backend` or the software the case
+    needs is not available.
+
+    :Parameters:
+      - `case`: The name of a `Benchmark` case.
+      - `size`: The number of cells along each side of the mesh.
+      - `backend`: The solver package, e.g., ``"scipy"``, ``"pysparse"``
+        or ``"trilinos"``. Defaults to FiPy's usual choice.
+      - `steps`: The number of steps to take. Defaults to the case's own.
+
+    """
+    env = _environment()
+    if backend is not None:
+        env['FIPY_SOLVERS'] = backend
+
+    process = subprocess.Popen([sys.executable, '-c', _script % (case, size, steps)],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    output, errors = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError("%s failed at size %d with exit status %d\n%s"
+                           % (case, size, process.returncode, errors))
+
+    result = json.loads(output.splitlines()[-1])
+    if "unavailable" in result:
+        return None
+    else:
+        return result
+
+class BenchmarkHistory(object):
+    """
+    Results of earlier benchmark runs, stored one JSON object per line.
+
+        >>> import os, shutil, tempfile
+        >>> directory = tempfile.mkdtemp()
+        >>> history = BenchmarkHistory(os.path.join(directory, "history.json"))
+        >>> for seconds in (1., 1.2, 0.9):
+        ...     history.append({"case": "Diffusion1D", "size": 10, "backend": "scipy",
+        ...                     "host": "lab", "solve": seconds, "assembly": 1.})
+        >>> print len(history.load())
+        3
+
+    A result is compared with the median of the earlier results of the
+    same case, size and backend on the same host
+
+        >>> print history.regressions({"case": "Diffusion1D", "size": 10, "backend": "scipy",
+        ...                            "host": "lab", "solve": 1.5, "assembly": 1.1})
+        [('solve', 1.0, 1.5)]
+        >>> print history.regressions({"case": "Diffusion1D", "size": 10, "backend": "scipy",
+        ...                            "host": "elsewhere", "solve": 1.5, "assembly": 1.1})
+        []
+
+        >>> shutil.rmtree(directory)
+    """
+
+    _identity = ("case", "size", "backend", "host")
+    _quantities = ("setup", "assembly", "solve", "total", "iterations", "peakRSS")
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def load(self):
+        if not os.path.exists(self.filename):
+            return []
+
+        f = open(self.filename, "r")
+        results = [json.loads(line) for line in f if line.strip()]
+        f.close()
+
+        return results
+
+    def append(self, result):
+        f = open(self.filename, "a")
+        f.write(json.dumps(result, sort_keys=True) + "\n")
+        f.close()
+
+    def regressions(self, result, tolerance=0.2):
+        """
+        The quantities of `result` that exceed the median of the earlier
+        results by more than a fraction `tolerance`, as a list of
+        `(quantity, median, value)`.
+        """
+        from fipy.tools import numerix
+
+        earlier = [old for old in self.load()
+                   if False not in [old.get(key) == result.get(key) for key in self._identity]]
+
+        regressions = []
+        for quantity in self._quantities:
+            values = [old[quantity] for old in earlier if old.get(quantity) is not None]
+            if values and result.get(quantity) is not None:
+                median = float(numerix.median(values))
+                if result[quantity] > median * (1 + tolerance):
+                    regressions.append((quantity, median, result[quantity]))
+
+        return regressions
+
+def run(cases=None, sizes=None, backends=("scipy", "pysparse", "trilinos"),
+        steps=None, history=None, tolerance=0.2, output=sys.stdout):
+    """
+    Measure each of `cases` at each of `sizes` with each of `backends`,
+    reporting to `output` as it goes.
+
+    Returns the results and, if a `history` file is given, the
+    regressions found against it, as a list of `(result, regressions)`.
+    The new results are then added to the `history`.
+
+    :Parameters:
+      - `cases`: Names of `Benchmark` cases. Defaults to all of them.
+      - `sizes`: Mesh sizes. Defaults to each case's own.
+      - `backends`: Solver packages. Those not installed are skipped.
+      - `steps`: The number of steps. Defaults to each case's own.
+      - `history`: The name of a `BenchmarkHistory` file.
+      - `tolerance`: The fractional slow down reported as a regression.
+      - `output`: Where to report.
+
+    """
+    if cases is None:
+        cases = [case.__name__ for case in Benchmark._cases()]
+    if history is not None:
+        history = BenchmarkHistory(history)
+
+    results = []
+    for case in cases:
+        for backend in backends:
+            for size in sizes or Benchmark._case(case).sizes:
+                try:
+                    result = measure(case, size, backend=backend, steps=steps)
+                except RuntimeError, e:
+                    # e.g., out of memory; larger sizes will not fare better
+                    output.write("%-22s %-9s %9d cells  %s\n"
+                                 % (case, backend, size, str(e).splitlines()[0]))
+                    break
+
+                if result is None:
+                    output.write("%-22s %-9s unavailable\n" % (case, backend))
+                    break
+
+                if result["iterations"] is None:
+                    iterations = "-"
+                else:
+                    iterations = "%d" % result["iterations"]
+                output.write("%-22s %-9s %9d cells  setup %8.3f s  assembly %8.3f s  "
+                             "solve %8.3f s  peak %7.1f MiB  %s iterations\n"
+                             % (case, backend, result["cells"], result["setup"], result["assembly"],
+                                result["solve"], result["peakRSS"] / 2.**20, iterations))
+
+                regressions = []
+                if history is not None:
+                    regressions = history.regressions(result, tolerance=tolerance)
+                    for quantity, median, value in regressions:
+                        output.write("    regression in %s: %g -> %g\n" % (quantity, median, value))
+                    history.append(result)
+
+                output.flush()
+                results.append((result, regressions))
+
+    return results
+
+def _parse(args):
+    from optparse import OptionParser
+
+    parser = OptionParser(usage="%prog [options]",
+                          description="Time FiPy workloads and compare them with earlier runs.")
+    parser.add_option("--case", action="append", dest="cases",
+                      help="case to run (repeatable); one of %s"
+                      % ", ".join([case.__name__ for case in Benchmark._cases()]))
+    parser.add_option("--size", action="append", dest="sizes", type="int",
+                      help="cells along each side of the mesh (repeatable)")
+    parser.add_option("--backend", action="append", dest="backends",
+                      help="solver package (repeatable); defaults to scipy, pysparse and trilinos")
+    parser.add_option("--steps", type="int", help="number of steps to take")
+    parser.add_option("--history", help="file of earlier results to compare with and add to")
+    parser.add_option("--tolerance", type="float", default=0.2,
+                      help="fractional slow down reported as a regression [default: %default]")
+
+    return parser.parse_args(args)[0]
+
+if __name__ == "__main__":
+    options = _parse(sys.argv[1:])
+    results = run(cases=options.cases, sizes=options.sizes,
+                  backends=options.backends or ("scipy", "pysparse", "trilinos"),
+                  steps=options.steps, history=options.history,
+                  tolerance=options.tolerance)
+    if True in [len(regressions) > 0 for result, regressions in results]:
+        sys.exit(1)
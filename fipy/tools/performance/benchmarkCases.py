@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "benchmarkCases.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+"""Workloads timed by `fipy.tools.performance.benchmark`.
+
+Each case is small by default so that the whole suite runs in minutes;
+the `sizes` are the number of cells along each side of the mesh.
+
+    >>> for case in Benchmark._cases():
+    ...     print case.__name__, case.sizes
+    Diffusion1D (1000, 10000, 100000)
+    Diffusion2D (32, 64, 128)
+    Diffusion3D (8, 16, 24)
+    CoupledCahnHilliard (16, 32, 64)
+    AnisotropicPhaseField (32, 64, 128)
+    LevelSet (32, 64, 128)
+    GmshLoading (32, 64, 128)
+
+Every case can take a step
+
+    >>> def tryStep(case):
+    ...     benchmark = case(size=case.sizes[0])
+    ...     benchmark.setup()
+    ...     benchmark.step()
+    ...     benchmark.cleanup()
+    ...     print case.__name__, benchmark.mesh.numberOfCells
+    >>> for case in Benchmark._cases()[:-1]:
+    ...     tryStep(case)
+    Diffusion1D 1000
+    Diffusion2D 1024
+    Diffusion3D 512
+    CoupledCahnHilliard 256
+    AnisotropicPhaseField 1024
+    LevelSet 1024
+
+although reading Gmsh files needs Gmsh
+
+    >>> tryStep(GmshLoading) # doctest: +GMSH
+    GmshLoading 2048
+"""
+__docformat__ = 'restructuredtext'
+
+import os
+import shutil
+import tempfile
+
+__all__ = ["Benchmark"]
+
+class Benchmark(object):
+    """
+    A workload to time at each of several `sizes`.
+
+    Subclasses build the mesh, variables and equations in `setup()` and
+    advance them by one time step in `step()`.
+
+    .. attention:: This class is abstract. Always create one of its subclasses.
+    """
+
+    sizes = ()
+    steps = 10
+
+    def __init__(self, size):
+        self.size = size
+
+    def isAvailable(self):
+        """
+        Whether the software this case needs is installed.
+        """
+        return True
+
+    def setup(self):
+        raise NotImplementedError
+
+    def step(self):
+        raise NotImplementedError
+
+    def cleanup(self):
+        pass
+
+    @staticmethod
+    def _cases():
+        return (Diffusion1D, Diffusion2D, Diffusion3D, CoupledCahnHilliard,
+                AnisotropicPhaseField, LevelSet, GmshLoading)
+
+    @staticmethod
+    def _case(name):
+        for case in Benchmark._cases():
+            if case.__name__ == name:
+                return case
+        raise KeyError("no benchmark named %r" % name)
+
+class _Diffusion(Benchmark):
+    """
+    Transient diffusion between fixed values on the left and right.
+    """
+
+    def _mesh(self):
+        raise NotImplementedError
+
+    def setup(self):
+        from fipy import CellVariable, TransientTerm, DiffusionTerm
+
+        self.mesh = self._mesh()
+        self.var = CellVariable(mesh=self.mesh, value=0.)
+        self.var.constrain(1., where=self.mesh.facesLeft)
+        self.var.constrain(0., where=self.mesh.facesRight)
+        self.eq = TransientTerm() == DiffusionTerm(coeff=1.)
+        self.dt = 0.9 * self.mesh.dx**2 / 2.
+
+    def step(self):
+        self.eq.solve(var=self.var, dt=self.dt)
+
+class Diffusion1D(_Diffusion):
+    sizes = (1000, 10000, 100000)
+
+    def _mesh(self):
+        from fipy import Grid1D
+        return Grid1D(nx=self.size, dx=1. / self.size)
+
+class Diffusion2D(_Diffusion):
+    sizes = (32, 64, 128)
+
+    def _mesh(self):
+        from fipy import Grid2D
+        return Grid2D(nx=self.size, ny=self.size, dx=1. / self.size, dy=1. / self.size)
+
+class Diffusion3D(_Diffusion):
+    sizes = (8, 16, 24)
+
+    def _mesh(self):
+        # the general 3D grid; `UniformGrid3D` indexes with more than one
+        # ellipsis, which current NumPy rejects
+        from fipy.meshes.nonUniformGrid3D import NonUniformGrid3D
+        return NonUniformGrid3D(nx=self.size, ny=self.size, nz=self.size,
+                                dx=1. / self.size, dy=1. / self.size, dz=1. / self.size)
+
+class CoupledCahnHilliard(Benchmark):
+    """
+    Cahn-Hilliard equation, solved as a coupled pair of second order
+    equations, as in ``examples/cahnHilliard/mesh2DCoupled.py``.
+    """
+
+    sizes = (16, 32, 64)
+
+    def setup(self):
+        from fipy import CellVariable, Grid2D, GaussianNoiseVariable, DiffusionTerm, TransientTerm, ImplicitSourceTerm
+        from fipy.tools import numerix
+
+        self.mesh = Grid2D(nx=self.size, ny=self.size, dx=0.25, dy=0.25)
+        phi = CellVariable(mesh=self.mesh)
+        psi = CellVariable(mesh=self.mesh)
+        phi[:] = GaussianNoiseVariable(mesh=self.mesh, mean=0.5, variance=0.01).value
+
+        dfdphi = phi * (1 - phi) * (1 - 2 * phi)
+        d2fdphi2 = 1 - 6 * phi * (1 - phi)
+        eq1 = TransientTerm(var=phi) == DiffusionTerm(coeff=1., var=psi)
+        eq2 = (ImplicitSourceTerm(coeff=1., var=psi)
+               == ImplicitSourceTerm(coeff=d2fdphi2, var=phi) - d2fdphi2 * phi + dfdphi
+               - DiffusionTerm(coeff=1., var=phi))
+        self.eq = eq1 & eq2
+        self.dt = numerix.exp(-5.)
+
+    def step(self):
+        self.eq.solve(dt=self.dt)
+
+class AnisotropicPhaseField(Benchmark):
+    """
+    Dendritic solidification with anisotropic interfacial energy, as in
+    ``examples/phase/anisotropy.py``.
+    """
+
+    sizes = (32, 64, 128)
+
+    def setup(self):
+        from fipy import Variable, CellVariable, Grid2D, TransientTerm, DiffusionTerm, ImplicitSourceTerm
+        from fipy.tools import numerix
+
+        dx = dy = 0.025
+        self.mesh = Grid2D(dx=dx, dy=dy, nx=self.size, ny=self.size)
+        self.dt = dt = 5e-4
+        self.phase = phase = CellVariable(mesh=self.mesh, hasOld=True)
+        self.dT = dT = CellVariable(mesh=self.mesh, hasOld=True)
+
+        self.heatEq = TransientTerm() == DiffusionTerm(2.25) + (phase - phase.old) / dt
+
+        c = 0.02
+        N = 6.
+        psi = numerix.pi / 8. + numerix.arctan2(phase.faceGrad[1], phase.faceGrad[0])
+        Phi = numerix.tan(N * psi / 2)
+        PhiSq = Phi**2
+        beta = (1. - PhiSq) / (1. + PhiSq)
+        DbetaDpsi = -N * 2 * Phi / (1 + PhiSq)
+        I0 = Variable(value=((1, 0), (0, 1)))
+        I1 = Variable(value=((0, -1), (1, 0)))
+        D = 0.015**2 * (1. + c * beta) * ((1. + c * beta) * I0 + c * DbetaDpsi * I1)
+
+        self.phaseEq = (TransientTerm(3e-4)
+                        == DiffusionTerm(D)
+                        + ImplicitSourceTerm((phase - 0.5 - 0.9 / numerix.pi * numerix.arctan(20. * dT))
+                                             * (1 - phase)))
+
+        x, y = self.mesh.cellCenters
+        center = self.size * dx / 2
+        phase.setValue(1., where=((x - center)**2 + (y - center)**2) < (5 * dx)**2)
+        dT.setValue(-0.5)
+
+    def step(self):
+        self.phase.updateOld()
+        self.dT.updateOld()
+        self.phaseEq.solve(self.phase, dt=self.dt)
+        self.heatEq.solve(self.dT, dt=self.dt)
+
+class LevelSet(Benchmark):
+    """
+    A circular level set expanding at unit normal speed, reinitialized to
+    a distance function after every step.
+    """
+
+    sizes = (32, 64, 128)
+
+    def setup(self):
+        from fipy import Grid2D, DistanceVariable, TransientTerm, FirstOrderAdvectionTerm
+        from fipy.tools import numerix
+
+        dx = 1. / self.size
+        self.mesh = Grid2D(dx=dx, dy=dx, nx=self.size, ny=self.size)
+        self.var = DistanceVariable(mesh=self.mesh, value=1., hasOld=True)
+        x, y = self.mesh.cellCenters
+        self.var.setValue(numerix.sqrt((x - 0.5)**2 + (y - 0.5)**2) - 0.25)
+        self.eq = TransientTerm() + FirstOrderAdvectionTerm(1.)
+        self.dt = 0.1 * dx
+
+    def step(self):
+        self.var.updateOld()
+        self.eq.solve(self.var, dt=self.dt)
+        self.var.calcDistanceFunction()
+
+class GmshLoading(Benchmark):
+    """
+    Reading a triangulated square from a Gmsh ``.msh`` file, followed by
+    steady diffusion on it. The time to read the file is the setup time.
+    """
+
+    sizes = (32, 64, 128)
+    steps = 1
+
+    def isAvailable(self):
+        from fipy.meshes.gmshMesh import gmshVersion
+        return gmshVersion() is not None
+
+    def setup(self):
+        from fipy import Gmsh2D, CellVariable, DiffusionTerm
+
+        self.directory = tempfile.mkdtemp()
+        filename = os.path.join(self.directory, "square.msh")
+        self._writeMSH(filename)
+
+        self.mesh = Gmsh2D(filename)
+        self.var = CellVariable(mesh=self.mesh, value=0.)
+        self.var.constrain(1., where=self.mesh.facesLeft)
+        self.var.constrain(0., where=self.mesh.facesRight)
+        self.eq = DiffusionTerm(coeff=1.)
+
+    def _writeMSH(self, filename):
+        from fipy.tools import numerix
+
+        n = self.size
+        x, y = numerix.meshgrid(numerix.linspace(0., 1., n + 1),
+                                numerix.linspace(0., 1., n + 1))
+        i, j = numerix.meshgrid(numerix.arange(n), numerix.arange(n))
+        v0 = (j * (n + 1) + i).ravel() + 1
+        triangles = numerix.concatenate((numerix.transpose((v0, v0 + 1, v0 + n + 2)),
+                                         numerix.transpose((v0, v0 + n + 2, v0 + n + 1))))
+
+        f = open(filename, "w")
+        f.write("$MeshFormat\n2.2 0 8\n$EndMeshFormat\n")
+        f.write("$Nodes\n%d\n" % x.size)
+        for node, (xx, yy) in enumerate(zip(x.ravel(), y.ravel())):
+            f.write("%d %r %r 0\n" % (node + 1, xx, yy))
+        f.write("$EndNodes\n$Elements\n%d\n" % len(triangles))
+        for element, (a, b, c) in enumerate(triangles):
+            f.write("%d 2 2 1 1 %d %d %d\n" % (element + 1, a, b, c))
+        f.write("$EndElements\n")
+        f.close()
+
+    def step(self):
+        self.eq.solve(var=self.var)
+
+    def cleanup(self):
+        shutil.rmtree(self.directory)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -36,158 +36,43 @@
  ##
 
 from distutils.core import Command
-import os
 import sys
 
 __all__ = ["Efficiency_test"]
 
 class Efficiency_test(Command):
-    description = "run FiPy efficiency tests"
+    description = "run FiPy benchmarks and compare them with earlier runs"
 
-    user_options = [ ('minimumelements=', None, 'minimum number of elements'),
-                     ('factor=', None, 'factor by which the number of elements is increased'),
-                     ('inline', None, 'turn on inlining for the efficiency tests'),
-                     ('cache', None, 'turn on variable caching'),
-                     ('maximumelements=', None, 'maximum number of elements'),
-                     ('sampleTime=', None, 'sampling interval for memory high-water'),
-                     ('path=', None, 'directory to place output results in'),
-                     ('uploadToCodespeed', None, 'flag to upload data to Codespeed'),
-                     ('otherExample=', None, 'designate examples other than the default ones to benchmark'),
-                     ('newElements=', None, 'alter the number of elements. NB: will not work on all examples'),
-                     ('revisionNumber=', None, 'generate history of example(s) from given revision number')]
+    user_options = [('cases=', None, 'comma-separated benchmark cases to run (default: all)'),
+                    ('sizes=', None, 'comma-separated mesh sizes (default: those of each case)'),
+                    ('backends=', None, 'comma-separated solver packages (default: scipy,pysparse,trilinos)'),
+                    ('steps=', None, 'number of steps to take (default: that of each case)'),
+                    ('history=', None, 'file of earlier results to compare with and add to'),
+                    ('tolerance=', None, 'fractional slow down reported as a regression (default: 0.2)')]
 
     def initialize_options(self):
-        self.factor = 10
-        self.inline = 0
-        self.cache = 0
-        self.maximumelements = 10000
-        self.minimumelements = 100
-        self.sampleTime = 1
-        self.path = None
-        self.otherExample = None
-        self.newElements = None
-        self.cases = ['examples/cahnHilliard/mesh2D.py', 'examples/phase/anisotropy.py', \
-                          'examples/reactiveWetting/liquidVapor2D.py']
-        self.uploadToCodespeed = False
-        self.revisionNumber = None
+        self.cases = None
+        self.sizes = None
+        self.backends = "scipy,pysparse,trilinos"
+        self.steps = None
+        self.history = "benchmarks.json"
+        self.tolerance = 0.2
 
     def finalize_options(self):
-        self.factor = int(self.factor)
-        self.maximumelements = int(self.maximumelements)
-        self.minimumelements = int(self.minimumelements)
-        self.sampleTime = float(self.sampleTime)
-        if self.otherExample is not None:
-            self.cases = [self.otherExample]
+        if self.cases is not None:
+            self.cases = self.cases.split(",")
+        if self.sizes is not None:
+            self.sizes = [int(size) for size in self.sizes.split(",")]
+        self.backends = self.backends.split(",")
+        if self.steps is not None:
+            self.steps = int(self.steps)
+        self.tolerance = float(self.tolerance)
 
     def run(self):
-        import time
-        from fipy.tools.performance import efficiencyTestGenerator
+        from fipy.tools.performance.benchmark import run
 
-        if self.revisionNumber is not None:
-            self.revisionNumber = int(self.revisionNumber)
-            from fipy.tools import efficiencyTestHistory
-            import sys
-            efficiencyTestHistory.run(self.revisionNumber)
-            sys.exit()
-        newCases = efficiencyTestGenerator.run(self.cases,self.newElements)
+        results = run(cases=self.cases, sizes=self.sizes, backends=self.backends,
+                      steps=self.steps, history=self.history, tolerance=self.tolerance)
 
-        for case in newCases:
-            print "case: %s" % case
-
-            if self.path is None:
-                testPath = os.path.split(case)[0]
-            else:
-                testPath = self.path
-
-            if not os.access(testPath, os.F_OK):
-                os.makedirs(testPath)
-
-            testPath = os.path.join(testPath, '%s.dat' % os.path.split(case)[1])
-
-            if not os.path.isfile(testPath):
-                f = open(testPath, 'w')
-
-                f.write("\t".join(["--inline".center(10), "--cache".center(10), "Date".center(25),\
-                        "Elements".center(10), "total runtime(s)".rjust(15)]))
-                f.write("\n")
-                f.flush()
-            else:
-                f = open(testPath, 'a')
-
-            numberOfElements = self.minimumelements
-
-            print "Running example:"
-            cmd = ["python", "-W ignore", case]
-
-            output = "\t".join([str(self.inline).center(10), str(self.cache).center(10),\
-                                    (time.ctime()).center(25), str(numberOfElements).center(10)])
-            print 'cmd',cmd
-            w, r = os.popen2(cmd)
-
-            outputlist= r.read().split()
-            print outputlist
-            init_time = outputlist[outputlist.index('Initialization-time:')+1]
-            frst_timestp = outputlist[outputlist.index('First-timestep:')+1]
-            avg_timestp = outputlist[outputlist.index('Average-timestep:')+1]
-            runtime = outputlist[outputlist.index('Runtime:')+1]
-            print "runtime: ", runtime
-            output += '\t' + ''.join(runtime).strip()
-            r.close()
-            w.close()
-
-            if numberOfElements == self.maximumelements:
-                f.write(output + '\n' + "-"*100 + '\n')
-                f.flush()
-            else:
-                f.write(output + '\n')
-                f.flush()
-
-            if self.uploadToCodespeed:
-                import urllib, urllib2
-                import time
-                import pysvn
-                from datetime import datetime
-
-                CODESPEED_URL = 'http://build.cmi.kent.edu/codespeed/'
-
-                revnum = pysvn.Client().info('.')['revision'].number
-                revdate  = pysvn.Client().info('.')['commit_time']
-                print 'revdate: ', datetime.fromtimestamp(revdate)
-
-                def add(data):
-                    params = urllib.urlencode(data)
-                    response = "None"
-                    print "Saving result for executable %s, revision %s, benchmark %s" % (
-                        data['executable'], data['commitid'], data['benchmark'])
-                    try:
-                        f = urllib2.urlopen(CODESPEED_URL + 'result/add/', params)
-                    except urllib2.HTTPError, e:
-                        print str(e)
-                        print e.read()
-                        return
-                    response = f.read()
-                    f.close()
-                    print "Server (%s) response: %s\n" % (CODESPEED_URL, response)
-
-                benchmarks = ['Initialization', 'First timestep',\
-                                  'Average of remaining timesteps', 'Total Runtime']
-                results = [init_time, frst_timestp, avg_timestp, runtime]
-                for i in range(len(benchmarks)):
-                    data = {
-                        'commitid': revnum,
-                        'branch': 'default', #Always use default for trunk/master/tip
-                        'project': 'FiPy',
-                        'revision_date': datetime.fromtimestamp(revdate),
-                        'executable': case,
-                        'benchmark': benchmarks[i],
-                        'environment': 'Sandbox A201590', ##"Debian A203166",
-                        'result_value': results[i],
-                        'result_date': datetime.fromtimestamp(revdate)
-                        }
-                    print datetime.fromtimestamp(revdate)
-                    add(data)
-            numberOfElements *= self.factor
-            f.close()
-            os.remove(case)
-            os.remove("%s.dat" % case)
-            print "Deleted temporary file ", case
+        if True in [len(regressions) > 0 for result, regressions in results]:
+            sys.exit(1)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "importTime.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+__docformat__ = 'restructuredtext'
+
+import os
+import subprocess
+import sys
+
+__all__ = ["importTime"]
+
+_script = """
+import json, sys, time
+start = time.time()
+exec %r
+elapsed = time.time() - start
+modules = [name for name, module in sys.modules.items() if module is not None]
+print json.dumps({'time': elapsed, 'modules': sorted(modules)})
+"""
+
+def _environment():
+    """Environment in which a fresh interpreter imports this copy of FiPy
+    """
+    import fipy
+
+    env = os.environ.copy()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(fipy.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join([root] + [path for path
+                                                  in env.get('PYTHONPATH', '').split(os.pathsep)
+                                                  if path])
+    return env
+
+def importTime(statement="import fipy", repeat=3):
+    """
+    Time `statement` in fresh Python interpreters, so that nothing is
+    already imported. Returns the best of `repeat` wall-clock times, in
+    seconds, and the names of the modules that were loaded.
+
+    ``import fipy`` loads none of the subpackages; solver packages are
+    only probed, and viewers only imported, when they are first used
+
+        >>> t, modules = importTime("import fipy")
+        >>> print [name for name in modules if name.startswith('fipy.')]
+        []
+        >>> t, modules = importTime("import fipy; fipy.Grid1D(nx=2)")
+        >>> print 'fipy.meshes' in modules
+        True
+        >>> print 'fipy.solvers' in modules, 'fipy.viewers' in modules
+        False False
+
+    whereas ``from fipy import *`` still provides everything
+
+        >>> tAll, modules = importTime("from fipy import *")
+        >>> print 'fipy.solvers' in modules, 'fipy.viewers' in modules
+        True True
+
+    :Parameters:
+      - `statement`: The Python code to time.
+      - `repeat`: The number of interpreters to launch.
+
+    """
+    import json
+
+    env = _environment()
+
+    best = None
+    for i in range(repeat):
+        process = subprocess.Popen([sys.executable, '-c', _script % statement],
+                                   stdout=subprocess.PIPE, env=env)
+        output = process.communicate()[0]
+        if process.returncode != 0:
+            raise RuntimeError("%r failed" % statement)
+        result = json.loads(output.splitlines()[-1])
+        if best is None or result['time'] < best['time']:
+            best = result
+
+    return best['time'], [str(name) for name in best['modules']]
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -1,35 +1,60 @@
 #!/usr/bin/env python
 
-import os
-import select
-import signal
+"""Peak memory of this process between two points.
+
+    >>> from fipy.tools import numerix
+    >>> from fipy.tools.performance.memoryUsage import _currentResident
+    >>> logger = MemoryLogger(sampleTime=0.01)
+    >>> logger.start()
+    >>> before = _currentResident() / 1024
+    >>> a = numerix.ones(2**22) # 32 MiB
+    >>> time.sleep(0.05)
+    >>> del a
+    >>> print logger.stop() - before > 30 * 1024
+    True
+
+"""
+
 import threading
 import time
 
+from fipy.tools.performance.memoryUsage import _currentResident, _highWater, _resetHighWater
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 __all__ = ["MemoryHighWaterThread", "MemoryLogger"]
 
 class MemoryHighWaterThread(threading.Thread):
-    def __init__(self, pid, sampleTime = 1):
+    """
+    Sample the resident memory of this process every `sampleTime`
+    seconds, for systems that cannot report its peak.
+    """
+    def __init__(self, sampleTime = 1):
         threading.Thread.__init__(self)
-        self.pid = pid
         self.sampleTime = sampleTime
         self.actionDone = threading.Event()
         self.setDaemon(True)
 
         self.maxMem = 0
 
+    def _sample(self):
+        resident = _currentResident()
+        if resident is None:
+            # no /proc, so settle for the peak of the whole process
+            resident = _highWater()
+        self.maxMem = max(self.maxMem, resident)
+
     def run(self):
         self.maxMem = 0
 
-        while not self.actionDone.isSet() or self.maxMem == 0:
-            ff = os.popen('ps -p %i -o vsz' % self.pid)
-            ff.readline() # skip a line
-            s = ff.readline()
-
-            ff.close()
+        while not self.actionDone.isSet():
+            self._sample()
+            self.actionDone.wait(self.sampleTime)
 
-            self.maxMem = max(self.maxMem, int(s))
-            time.sleep(self.sampleTime)
+        self._sample()
 
     def stop(self):
         self.actionDone.set()
@@ -38,74 +63,54 @@ class MemoryHighWaterThread(threading.Thread):
         return self.maxMem
 
 class MemoryLogger:
+    """
+    Reports the peak resident memory, in KiB, of this process between
+    `start()` and `stop()`.
+
+    Where the operating system lets the peak be reset (Linux), it is read
+    from the kernel, so no allocation is missed, however brief. Otherwise
+    resident memory is sampled every `sampleTime` seconds.
+
+    If :mod:`tracemalloc` is available and tracing, a snapshot is taken at
+    `stop()`, so that `statistics()` can attribute the memory still
+    allocated to the lines of code that allocated it (NumPy reports its
+    arrays to :mod:`tracemalloc`).
+    """
     def __init__(self, sampleTime = 1):
-        self.pid = os.getpid()
-
-        self.r, self.w = os.pipe()
-        self.forkID = os.fork()
+        self.sampleTime = sampleTime
+        self.thread = None
+        self.snapshot = None
 
-        if self.forkID == 0:
-            os.close(self.r)
+    def start(self):
+        if not _resetHighWater():
+            self.thread = MemoryHighWaterThread(sampleTime=self.sampleTime)
+            self.thread.start()
 
+    def stop(self):
+        if self.thread is not None:
+            maxMem = self.thread.stop()
             self.thread = None
-
-            def startHandler(signum, frame):
-                if self.thread is not None:
-                    self.stop()
-
-                self.thread = MemoryHighWaterThread(pid=self.pid, sampleTime=sampleTime)
-                self.thread.start()
-##                 print "start"
-
-
-            def stopHandler(signum, frame):
-                if self.thread is not None:
-                    maxMem = self.thread.stop()
-                    self.thread = None
-                else:
-                    maxMem = -9999
-
-                os.write(self.w, str(maxMem))
-
-            def hupHandler(signum, frame):
-                os._exit(1)
-
-            signal.signal(signal.SIGUSR1, startHandler)
-            signal.signal(signal.SIGUSR2, stopHandler)
-            signal.signal(signal.SIGHUP, hupHandler)
-
-            while 1:
-                time.sleep(10000000)
-
         else:
-            os.close(self.w)
+            maxMem = _highWater()
 
-    def __del__(self):
-        import signal
-        os.kill(self.forkID, signal.SIGHUP)
+        if tracemalloc is not None and tracemalloc.is_tracing():
+            self.snapshot = tracemalloc.take_snapshot()
 
-    def start(self):
-        os.kill(self.forkID, signal.SIGUSR1)
+        return int(maxMem / 1024)
 
-    def stop(self):
-        os.kill(self.forkID, signal.SIGUSR2)
-        inputs, outputs, exceptions = select.select([self.r], [], [], 2)
-        if self.r in inputs:
-            maxMem = int(os.read(self.r, 1024))
+    def statistics(self, key_type="lineno", limit=10):
+        """
+        The `limit` largest allocations still held at the last `stop()`,
+        grouped by `key_type`, or an empty list without :mod:`tracemalloc`.
+        """
+        if self.snapshot is None:
+            return []
         else:
-            maxMem = -8888
-        return maxMem
+            return self.snapshot.statistics(key_type)[:limit]
 
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
 
 if __name__ == "__main__":
-    print "MemoryHighWaterThread"
-    for attempt in range(10):
-        thread = MemoryHighWaterThread(pid=os.getpid(), sampleTime=1)
-        thread.start()
-        print thread.stop()
-
-    print "MemoryLogger"
-    logger = MemoryLogger(sampleTime=1)
-    for attempt in range(10):
-        logger.start()
-        print logger.stop()
+    _test()
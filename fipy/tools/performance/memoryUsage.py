@@ -91,3 +91,49 @@ def _peak(since=0.0):
     '''Return stack size in bytes.
     '''
     return _VmB('VmPeak:') - since
+
+def _status(key):
+    '''Return the `key` entry of /proc/self/status in bytes, or None.
+    '''
+    try:
+        f = open('/proc/self/status')
+        lines = f.readlines()
+        f.close()
+    except IOError:
+        return None  # non-Linux?
+
+    for line in lines:
+        if line.startswith(key):
+            v = line.split()
+            return float(v[1]) * _scale[v[2]]
+
+    return None
+
+def _currentResident():
+    '''Return the resident memory usage of this process in bytes, or None.
+    '''
+    return _status('VmRSS:')
+
+def _highWater():
+    '''Return the peak resident memory usage of this process in bytes.
+    '''
+    peak = _status('VmHWM:')
+    if peak is None:
+        import resource
+        import sys
+        peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        if sys.platform != 'darwin':
+            peak *= 1024  # kilobytes, except on Mac OS X
+    return peak
+
+def _resetHighWater():
+    '''Reset the peak resident memory usage to the current usage.
+    Return whether the operating system allowed it.
+    '''
+    try:
+        f = open('/proc/self/clear_refs', 'w')
+        f.write('5')
+        f.close()
+    except IOError:
+        return False
+    return True
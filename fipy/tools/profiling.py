@@ -0,0 +1,433 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "profiling.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+"""Opt-in instrumentation of the phases of building and solving equations.
+
+Nothing is recorded unless a `Profile` is active, either because the
+`FIPY_PROFILE` environment variable is set (a summary is then printed
+to `stderr` on exit) or because code is run inside ``with Profile():``.
+If `FIPY_PROFILE` is set to a file name, each phase is also logged to
+that file as it starts and finishes, so that the phase that was running
+when a process was killed, e.g., for running out of memory, can be
+found.
+
+    >>> from fipy import *
+    >>> m = Grid1D(nx=10)
+    >>> v = CellVariable(mesh=m, value=0.)
+    >>> v.constrain(1., where=m.facesLeft)
+    >>> eq = TransientTerm() == DiffusionTerm() + ImplicitSourceTerm(-1.)
+    >>> with Profile() as profile:
+    ...     for step in range(3):
+    ...         eq.solve(var=v, dt=1.)
+    ...     res = eq.sweep(var=v, dt=1.)
+
+Each phase is recorded per `Term` or `Solver` class
+
+    >>> for (phase, name), record in sorted(profile.records.items()):
+    ...     if phase in ("build", "assemble", "residual"):
+    ...         print phase, name, record["calls"]
+    assemble _BinaryTerm 4
+    build DiffusionTerm 4
+    build ImplicitSourceTerm 4
+    build TransientTerm 4
+    residual _BinaryTerm 1
+
+along with the number of matrix entries and the bytes of the linear
+system built
+
+    >>> record = profile.records[("assemble", "_BinaryTerm")]
+    >>> print record["nnz"] >= 3 * 10 - 2, record["bytes"] > 0
+    True True
+
+and the residual of the sweep
+
+    >>> print profile.records[("residual", "_BinaryTerm")]["residual"] == res
+    True
+
+Solver iterations and residuals are recorded where the solver reports
+them
+
+    >>> from fipy.solvers.scipy import LinearPCGSolver # doctest: +SCIPY
+    >>> with Profile() as profile: # doctest: +SCIPY
+    ...     eq.solve(var=v, dt=1., solver=LinearPCGSolver(tolerance=1e-10))
+    >>> record = profile.records[("solve", "LinearPCGSolver")] # doctest: +SCIPY
+    >>> print record["iterations"] > 0, record["residual"] < 1e-8 # doctest: +SCIPY
+    True True
+
+Nothing is recorded once the `Profile` is closed
+
+    >>> calls = sum([record["calls"] for record in profile.records.values()])
+    >>> eq.solve(var=v, dt=1.)
+    >>> print sum([record["calls"] for record in profile.records.values()]) == calls
+    True
+
+Calculating the geometry of a mesh and evaluating variables are recorded
+as well, by the class of the mesh or of the outermost variable evaluated
+
+    >>> with Profile() as profile:
+    ...     mesh = Tri2D(nx=10, ny=10)
+    ...     r = numerix.sqrt(mesh.x**2 + mesh.y**2)
+    ...     print r.value.shape
+    (400,)
+    >>> print ("mesh", "Tri2D") in profile.records
+    True
+    >>> print ("evaluate", r.__class__.__name__) in profile.records
+    True
+
+Memory is attributed to the phases, as `highWater`, the bytes by which
+each phase raised the peak resident memory of the process, and `peakRSS`,
+the peak after the phase. Where :mod:`tracemalloc` is tracing, `traced`
+is the memory each phase allocated and did not free.
+
+    >>> big = Variable(value=numerix.ones((2**19,))) # 4 MiB
+    >>> with Profile() as profile:
+    ...     total = (big * 2 + 1).value
+    >>> record = profile.records[("evaluate", (big * 2 + 1).__class__.__name__)]
+    >>> print record["peakRSS"] >= 0, record["highWater"] >= 0
+    True True
+    >>> print "traced" in record
+    True
+
+Phases nest, e.g., variables are evaluated while building equations, and
+the time and memory of an inner phase are included in those of the outer
+one.
+
+The records can be printed as a table or exported for other tools
+
+    >>> print profile.summary().splitlines()[0].split()
+    ['phase', 'name', 'calls', 'seconds', 'bytes', 'nnz', 'iterations', 'residual', 'highWater']
+    >>> import json
+    >>> trace = json.loads(profile.toChromeTrace())
+    >>> print len(trace["traceEvents"]), trace["traceEvents"][0]["ph"]
+    1 X
+    >>> print len(json.loads(profile.toJSON()))
+    1
+
+Long runs need not keep every call for the trace
+
+    >>> with Profile(trace=False) as profile:
+    ...     eq.solve(var=v, dt=1.)
+    >>> print len(profile.events), len(profile.records) > 0
+    0 True
+
+and can log each phase to a file as it happens
+
+    >>> import os, tempfile
+    >>> fd, log = tempfile.mkstemp()
+    >>> with Profile(log=log) as profile:
+    ...     eq.solve(var=v, dt=1.)
+    >>> lines = [json.loads(line) for line in open(log)]
+    >>> print lines[0]["event"], lines[-1]["event"], lines[-1]["phase"]
+    start stop solve
+    >>> print "rss" in lines[0]
+    True
+    >>> os.close(fd)
+    >>> os.remove(log)
+
+"""
+__docformat__ = 'restructuredtext'
+
+import atexit
+import json
+import os
+import sys
+import time
+
+from fipy.tools.performance.memoryUsage import _currentResident, _highWater
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+__all__ = ["Profile"]
+
+_profiles = []
+_phases = []
+
+class Profile(object):
+    """
+    Collects the wall time, call count, bytes and matrix entries of each
+    phase of building and solving equations, and the iterations and
+    residuals of the solvers, while it is active.
+
+    `records` maps `(phase, name)` to the totals for that phase, where
+    `name` is the class of the `Term` or `Solver` doing the work. The
+    phases are
+
+    - ``"mesh"``: calculating the geometry of a mesh,
+    - ``"evaluate"``: evaluating a `Variable`,
+    - ``"build"``: discretizing a `Term` (including evaluating its
+      coefficients and boundary conditions),
+    - ``"assemble"``: merging the matrices of an equation and storing the
+      linear system,
+    - ``"solve"``: solving the linear system,
+    - ``"residual"``: calculating the residual of a `sweep()`.
+
+    `bytes` is the storage of the linear system built, estimated as a
+    value and a column index per matrix entry plus the right-hand side; it
+    is not a measure of the temporary arrays allocated along the way. The
+    memory of the process is recorded as `highWater`, the total bytes by
+    which a phase raised its peak resident memory, `peakRSS`, the peak
+    after the phase, and, if :mod:`tracemalloc` is tracing, `traced`, the
+    net bytes the phase allocated.
+
+    :Parameters:
+      - `trace`: Whether to keep every call, for `toChromeTrace()`.
+      - `log`: The name of a file to which each phase is appended as it
+        starts and stops.
+
+    """
+
+    def __init__(self, trace=True, log=None):
+        self.records = {}
+        self.events = []
+        self.trace = trace
+        if log is None:
+            self.log = None
+        else:
+            self.log = open(log, "a")
+        self._epoch = time.time()
+
+    def __enter__(self):
+        _profiles.append(self)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        _profiles.remove(self)
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def _start(self, phase, name, start):
+        if self.log is not None:
+            self._log(event="start", phase=phase, name=name, time=start - self._epoch,
+                      rss=_currentResident(), peakRSS=_highWater())
+
+    def _record(self, phase, name, start, stop, figures, memory):
+        record = self.records.get((phase, name))
+        if record is None:
+            record = self.records[(phase, name)] = {"calls": 0, "seconds": 0.,
+                                                    "bytes": 0, "nnz": None,
+                                                    "iterations": None, "residual": None,
+                                                    "highWater": 0, "peakRSS": 0,
+                                                    "traced": None}
+        record["calls"] += 1
+        record["seconds"] += stop - start
+        record["bytes"] += figures.get("bytes", 0)
+        if "iterations" in figures:
+            record["iterations"] = (record["iterations"] or 0) + figures["iterations"]
+        for key in ("nnz", "residual"):
+            if key in figures:
+                record[key] = figures[key]
+        record["highWater"] += memory["highWater"]
+        record["peakRSS"] = max(record["peakRSS"], memory["peakRSS"])
+        if "traced" in memory:
+            record["traced"] = (record["traced"] or 0) + memory["traced"]
+
+        if self.trace:
+            args = figures.copy()
+            args.update(memory)
+            self.events.append((phase, name, start, stop, args))
+
+        if self.log is not None:
+            self._log(event="stop", phase=phase, name=name, time=stop - self._epoch,
+                      seconds=stop - start, **memory)
+
+    def _log(self, **entry):
+        self.log.write(json.dumps(entry, default=_jsonable) + "\n")
+        self.log.flush()
+
+    def summary(self):
+        """
+        Table of the records, slowest first.
+        """
+        rows = [("phase", "name", "calls", "seconds", "bytes", "nnz", "iterations", "residual", "highWater")]
+        for (phase, name), record in sorted(self.records.items(),
+                                            key=lambda item: -item[1]["seconds"]):
+            rows.append((phase, name, str(record["calls"]),
+                         "%.4g" % record["seconds"], str(record["bytes"]),
+                         _format(record["nnz"], "%d"),
+                         _format(record["iterations"], "%d"),
+                         _format(record["residual"], "%.3g"),
+                         "%d" % record["highWater"]))
+
+        widths = [max([len(row[column]) for row in rows]) for column in range(len(rows[0]))]
+
+        return "\n".join(["  ".join([cell.ljust(width) for cell, width in zip(row, widths)]).rstrip()
+                          for row in rows])
+
+    def toJSON(self, filename=None):
+        """
+        The records as a JSON list, written to `filename` if given.
+        """
+        records = []
+        for (phase, name), record in sorted(self.records.items()):
+            record = record.copy()
+            record.update(phase=phase, name=name)
+            records.append(record)
+
+        return _export(records, filename)
+
+    def toChromeTrace(self, filename=None):
+        """
+        Every recorded call in the Chrome trace event format, for viewing
+        in ``chrome://tracing`` or Perfetto, written to `filename` if given.
+        """
+        events = []
+        for phase, name, start, stop, figures in self.events:
+            events.append({"name": name, "cat": phase, "ph": "X",
+                           "ts": (start - self._epoch) * 1e6,
+                           "dur": (stop - start) * 1e6,
+                           "pid": os.getpid(), "tid": 0,
+                           "args": figures})
+
+        return _export({"traceEvents": events}, filename)
+
+def _format(value, format):
+    if value is None:
+        return "-"
+    else:
+        return format % value
+
+def _jsonable(value):
+    # numpy scalars and arrays, e.g., from a custom `residualFn`
+    return value.tolist()
+
+def _export(data, filename):
+    text = json.dumps(data, default=_jsonable)
+    if filename is not None:
+        f = open(filename, "w")
+        f.write(text)
+        f.close()
+    return text
+
+class _Phase(object):
+    def __init__(self, phase, name):
+        self.phase = phase
+        self.name = name
+        self.figures = {}
+
+    def __enter__(self):
+        _phases.append(self)
+        self.highWater = _highWater()
+        if tracemalloc is not None and tracemalloc.is_tracing():
+            self.traced = tracemalloc.get_traced_memory()[0]
+        else:
+            self.traced = None
+        self.start = time.time()
+        for profile in _profiles:
+            profile._start(self.phase, self.name, self.start)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        stop = time.time()
+        _phases.remove(self)
+        if type is None:
+            peak = _highWater()
+            memory = {"highWater": peak - self.highWater, "peakRSS": peak}
+            if self.traced is not None:
+                memory["traced"] = tracemalloc.get_traced_memory()[0] - self.traced
+            for profile in _profiles:
+                profile._record(self.phase, self.name, self.start, stop, self.figures, memory)
+
+    def report(self, **figures):
+        self.figures.update(figures)
+
+class _InactivePhase(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def report(self, **figures):
+        pass
+
+_inactivePhase = _InactivePhase()
+
+def _isActive():
+    return len(_profiles) > 0
+
+def _phase(phase, name, outermost=False):
+    """
+    Context manager timing `phase` of the work of `name`; costs nothing
+    but a function call unless a `Profile` is active. If `outermost`, the
+    phase is not timed when it is already inside one of the same `phase`,
+    e.g., a `Variable` evaluated to evaluate another.
+    """
+    if not _profiles:
+        return _inactivePhase
+    elif outermost and phase in [open.phase for open in _phases]:
+        return _inactivePhase
+    else:
+        return _Phase(phase, name)
+
+def _report(**figures):
+    """
+    Attach `figures` (e.g., `iterations` or `residual`) to the innermost
+    phase being timed, if any.
+    """
+    if _phases:
+        _phases[-1].report(**figures)
+
+def _systemBytes(matrix, RHSvector):
+    entries = matrix._numberOfEntries
+    if entries is None:
+        entries = 0
+    return int(entries * (8 + 4) + getattr(RHSvector, "nbytes", 0))
+
+def _reportSystem(phase, matrix, RHSvector):
+    if phase is not _inactivePhase:
+        phase.report(nnz=matrix._numberOfEntries, bytes=_systemBytes(matrix, RHSvector))
+
+if os.environ.get('FIPY_PROFILE', '0') not in ('', '0'):
+    if os.environ['FIPY_PROFILE'] == '1':
+        _environmentProfile = Profile(trace=False).__enter__()
+    else:
+        _environmentProfile = Profile(trace=False, log=os.environ['FIPY_PROFILE']).__enter__()
+
+    def _printSummary():
+        sys.stderr.write(_environmentProfile.summary() + "\n")
+
+    atexit.register(_printSummary)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+## -*-Pyth-*-
+ # ###################################################################
+ #  FiPy - Python-based finite volume PDE solver
+ #
+ #  FILE: "raggedArray.py"
+ #
+ #  Author: Jonathan Guyer <guyer@nist.gov>
+ #  Author: Daniel Wheeler <daniel.wheeler@nist.gov>
+ #  Author: James Warren   <jwarren@nist.gov>
+ #    mail: NIST
+ #     www: http://www.ctcms.nist.gov/fipy/
+ #
+ # ========================================================================
+ # This software was developed at the National Institute of Standards
+ # and Technology by employees of the Federal Government in the course
+ # of their official duties.  Pursuant to title 17 Section 105 of the
+ # United States Code this software is not subject to copyright
+ # protection and is in the public domain.  FiPy is an experimental
+ # system.  NIST assumes no responsibility whatsoever for its use by
+ # other parties, and makes no guarantees, expressed or implied, about
+ # its quality, reliability, or any other characteristic.  We would
+ # appreciate acknowledgement if the software is used.
+ #
+ # This software can be redistributed and/or modified freely
+ # provided that any derivative works bear some notice that they are
+ # derived from it, and any modified versions bear some notice that
+ # they have been modified.
+ # ========================================================================
+ #  See the file "license.terms" for information on usage and  redistribution
+ #  of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+ #
+ # ###################################################################
+ ##
+
+__docformat__ = 'restructuredtext'
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+
+__all__ = []
+
+class _RaggedArray(object):
+    r"""
+    Rows of different lengths, such as the faces of each cell of a mesh
+    of mixed elements, stored as the concatenation of all their entries,
+    `indices`, and the position in `indices` where each row starts,
+    `offsets`.
+
+    FiPy's connectivity is given as `(maxLength, numberOfRows)` arrays,
+    padded with masked values, so each row of a `_RaggedArray` is a
+    column of such an array
+
+        >>> padded = MA.masked_values(((0, 3, 5),
+        ...                            (1, 4, -1),
+        ...                            (2, -1, -1)), -1)
+        >>> ragged = _RaggedArray.fromPadded(padded)
+        >>> print ragged.offsets
+        [0 3 5 6]
+        >>> print ragged.indices
+        [0 1 2 3 4 5]
+        >>> print ragged.counts
+        [3 2 1]
+        >>> print ragged.rows
+        [0 0 0 1 1 2]
+        >>> print ragged.padded()
+        [[0 3 5]
+         [1 4 --]
+         [2 -- --]]
+
+    Reductions over each row act on values given for every entry
+
+        >>> print ragged.sum(((1., 2., 3., 4., 5., 6.),
+        ...                   (1., 1., 1., 1., 1., 1.)))
+        [[ 6.  9.  6.]
+         [ 3.  2.  1.]]
+        >>> print ragged.mean((1., 2., 3., 4., 5., 6.))
+        [ 2.   4.5  6. ]
+
+    """
+    def __init__(self, offsets, indices):
+        self.offsets = offsets
+        self.indices = indices
+
+    @classmethod
+    def fromPadded(cls, padded):
+        """
+        Collect the unmasked entries of each column of `padded`.
+        """
+        mask = MA.getmaskarray(padded).swapaxes(0, 1)
+        data = MA.getdata(padded).swapaxes(0, 1)
+        counts = numerix.logical_not(mask).sum(1)
+        return cls(offsets=numerix.concatenate(([0], numerix.cumsum(counts))).astype('l'),
+                   indices=data[numerix.logical_not(mask)])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self):
+        return self.offsets[1:] - self.offsets[:-1]
+
+    @property
+    def rows(self):
+        """The row of each entry
+        """
+        if not hasattr(self, '_rows'):
+            self._rows = numerix.repeat(numerix.arange(len(self)), self.counts)
+        return self._rows
+
+    @property
+    def _positions(self):
+        """The position of each entry within its row
+        """
+        return numerix.arange(len(self.indices)) - numerix.take(self.offsets, self.rows)
+
+    def padded(self):
+        """
+        Return the rows as the columns of a masked array, padded to the
+        length of the longest row.
+        """
+        counts = self.counts
+        if len(counts) > 0:
+            length = counts.max()
+        else:
+            length = 0
+        data = -numerix.ones((length, len(self)), self.indices.dtype)
+        data[self._positions, self.rows] = self.indices
+        return MA.masked_values(data, -1)
+
+    def sum(self, values):
+        """
+        Sum `values`, given for each entry along the last axis, over each row.
+        """
+        values = numerix.asarray(values)
+        rows = self.rows
+        sums = [numerix.bincount(rows, weights=v, minlength=len(self))
+                for v in values.reshape((-1, values.shape[-1]))]
+        return numerix.reshape(sums, values.shape[:-1] + (len(self),))
+
+    def mean(self, values):
+        """
+        Average `values`, given for each entry along the last axis, over each row.
+        """
+        return self.sum(values) / self.counts
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -43,6 +43,15 @@ def _suite():
             'numerix',
             'dump',
             'vector',
+            'inline',
+            'fastMarching',
+            'counterRandom',
+            'performance.importTime',
+            'performance.benchmarkCases',
+            'performance.benchmark',
+            'performance.memoryLogger',
+            'raggedArray',
+            'profiling',
         ), base = __name__)
 
     return theSuite
@@ -44,28 +44,73 @@ __all__ = ["putAdd", "prune"]
 def _putAdd(vector, ids, additionVector, mask=False):
     """This is a temporary replacement for Numeric.put as it was not doing
     what we thought it was doing.
+
+    Repeated `ids` accumulate, masked entries are skipped and a leading
+    axis of `additionVector` that is absent from `ids` is added row by row.
+
+        >>> v = numerix.zeros((4,), 'd')
+        >>> _putAdd(v, numerix.array((0, 2, 2, 3)), (1., 2., 3., 4.))
+        >>> print v
+        [ 1.  0.  5.  4.]
+        >>> _putAdd(v, numerix.array((0, 2, 2, 3)), (1., 2., 3., 4.),
+        ...         mask=numerix.array((False, True, False, True)))
+        >>> print v
+        [ 2.  0.  8.  4.]
+        >>> v = numerix.zeros((2, 3), 'd')
+        >>> _putAdd(v, numerix.array(((0, 1, 1),)), (((1., 2., 3.),), ((4., 5., 6.),)))
+        >>> print v
+        [[  1.   5.   0.]
+         [  4.  11.   0.]]
+
+    Negative `ids` count from the end of `vector`, whether a few or many
+    entries are updated
+
+        >>> v = numerix.zeros((100,), 'd')
+        >>> _putAdd(v, numerix.array((-1, -1, 0)), (1., 2., 3.))
+        >>> print v[0], v[-1]
+        3.0 3.0
+        >>> _putAdd(v, numerix.arange(-100, 0), numerix.ones((100,)))
+        >>> print v[0], v[-1]
+        4.0 4.0
     """
     additionVector = numerix.array(additionVector)
 
+    if len(vector.shape) < len(additionVector.shape):
+        for j in range(vector.shape[0]):
+            _putAddFlat(vector[j], ids, additionVector[j], mask)
+    else:
+        _putAddFlat(vector, ids, additionVector, mask)
+
+# `bincount` is much faster than `add.at` per id, but costs a pass over the
+# whole vector, so it is only used when at least 1 in this many entries change
+_bincountRatio = 16
+
+def _putAddFlat(vector, ids, additionVector, mask):
+    ids = numerix.asarray(ids).ravel()
+    values = additionVector.ravel()
+    n = min(len(ids), len(values))
+
     if numerix.sometrue(mask):
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value, masked in zip(ids.flat, additionVector[j].flat, mask.flat):
-                    if not masked:
-                        vector[j].flat[id] += value
-        else:
-            for id, value, masked in zip(ids.flat, additionVector.flat, mask.flat):
-                if not masked:
-                    vector.flat[id] += value
+        mask = numerix.asarray(mask).ravel()
+        n = min(n, len(mask))
+        unmasked = ~mask[:n]
+        ids = ids[:n][unmasked]
+        values = values[:n][unmasked]
+    else:
+        ids = ids[:n]
+        values = values[:n]
+
+    if len(ids) == 0:
+        return
 
+    if len(ids) * _bincountRatio < vector.size and vector.flags.c_contiguous:
+        # only a few entries change, so don't touch the rest
+        numerix.add.at(vector.reshape((-1,)), ids, values.astype(vector.dtype))
     else:
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value in zip(ids.flat, additionVector[j].flat):
-                    vector[j].flat[id] += value
-        else:
-            for id, value in zip(ids.flat, additionVector.flat):
-                vector.flat[id] += value
+        # negative ids count from the end, as they do for `vector.flat`
+        ids = numerix.where(ids < 0, ids + vector.size, ids)
+        increment = numerix.bincount(ids, weights=values, minlength=vector.size)
+        vector += increment.reshape(vector.shape).astype(vector.dtype)
 
 if inline.doInline:
     ## FIXME: inline version doesn't account for all of the conditions that Python
@@ -36,7 +36,7 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
+from fipy.tools import counterRandom
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["BetaNoiseVariable"]
@@ -125,8 +125,8 @@ class BetaNoiseVariable(NoiseVariable):
         self.beta = self._requires(beta)
 
     def random(self):
-        return random.beta(a = self.alpha, b = self.beta,
-                           size = [self.mesh.globalNumberOfCells])
+        return counterRandom.beta(self._seed, self._step, self.mesh._globalOverlappingCellIDs,
+                                  a=self.alpha.value, b=self.beta.value)
 
 def _test():
     import fipy.tests.doctestPlus
@@ -76,12 +76,16 @@ def _parseLSMSolver():
     elif _checkForSKFMM():
         return 'skfmm'
     else:
-        return None
+        return 'fipy'
 
 LSM_SOLVER = _parseLSMSolver()
 
 register_skipper(flag="LSM",
                  test=lambda : LSM_SOLVER is not None,
+                 why="the requested level set solver can not be found on the $PATH")
+
+register_skipper(flag="LSMLIBRARY",
+                 test=lambda : LSM_SOLVER in ('lsmlib', 'skfmm'),
                  why="neither `lsmlib` nor `skfmm` can be found on the $PATH")
 
 register_skipper(flag="LSMLIB",
@@ -105,7 +109,9 @@ class DistanceVariable(CellVariable):
 
     using the fast marching method with an initial condition defined
     by the zero level set.  The solution can either be first or second
-    order.
+    order. `lsmlib` or `skfmm` are used on 1D and 2D grids when they are
+    available; otherwise, and on any other mesh, a native fast marching
+    method that works on the cell-to-cell connectivity is used.
 
     Here we will define a few test cases. Firstly a 1D test case
 
@@ -211,12 +217,28 @@ class DistanceVariable(CellVariable):
     ...                                               -1., -1., 1., 1.,
     ...                                               1., 1., 1., 1.,
     ...                                               1, 1, 1, 1))
-    >>> var.calcDistanceFunction(order=2) #doctest: +LSM
+    >>> var.calcDistanceFunction(order=2) #doctest: +LSMLIBRARY
     >>> answer = [-1.30473785, -0.5, 0.5, 1.49923009,
     ...           -0.5, -0.35355339, 0.5, 1.45118446,
     ...            0.5, 0.5, 0.97140452, 1.76215286,
     ...            1.49923009, 1.45118446, 1.76215286, 2.33721352]
-    >>> print numerix.allclose(var, answer, rtol=1e-9) #doctest: +LSM
+    >>> print numerix.allclose(var, answer, rtol=1e-9) #doctest: +LSMLIBRARY
+    True
+
+    Meshes that `lsmlib` and `skfmm` do not support, such as 3D or
+    unstructured meshes, use the native solver
+
+    >>> from fipy.meshes import Tri2D
+    >>> mesh = Tri2D(nx=20, ny=20, dx=.1, dy=.1)
+    >>> x, y = mesh.cellCenters
+    >>> r = numerix.sqrt((x - 1.)**2 + (y - 1.)**2)
+    >>> var = DistanceVariable(mesh=mesh, value=r - .5)
+    >>> var.calcDistanceFunction() #doctest: +LSM
+    >>> print abs(var - (r - .5)).max() < 0.4 * .1 #doctest: +LSM
+    True
+    >>> extensionVar = CellVariable(mesh=mesh, value=numerix.where(var < 0, 0., 1.))
+    >>> var.extendVariable(extensionVar) #doctest: +LSM
+    >>> print numerix.allclose(extensionVar, 1.) #doctest: +LSM
     True
 
     ** A test for a bug in both LSMLIB and Scikit-fmm **
@@ -254,7 +276,7 @@ class DistanceVariable(CellVariable):
     True
 
     """
-    def __init__(self, mesh, name = '', value = 0., unit = None, hasOld = 0):
+    def __init__(self, mesh, name = '', value = 0., unit = None, hasOld = 0, narrowBandWidth = None):
         """
         Creates a `distanceVariable` object.
 
@@ -264,14 +286,31 @@ class DistanceVariable(CellVariable):
 	  - `value`: The initial value.
 	  - `unit`: the physical units of the variable
           - `hasOld`: Whether the variable maintains an old value.
+          - `narrowBandWidth`: If given, the distance function is only
+            calculated, extended and advected within this distance of the
+            zero level set.
 
         """
         CellVariable.__init__(self, mesh, name = name, value = value, unit = unit, hasOld = hasOld)
+        self.narrowBandWidth = narrowBandWidth
+        self._narrowBand = None
+        self._narrowBandEdge = None
+        self._order = 2
+        self._marcher = None
         self._markStale()
 
     def _calcValue(self):
         return self._value
 
+    def __getstate__(self):
+        dict = CellVariable.__getstate__(self)
+        dict['narrowBandWidth'] = self.narrowBandWidth
+        return dict
+
+    def __setstate__(self, dict):
+        CellVariable.__setstate__(self, dict)
+        self.narrowBandWidth = dict.get('narrowBandWidth', None)
+
     def extendVariable(self, extensionVariable, order=2):
         """
 
@@ -282,8 +321,24 @@ class DistanceVariable(CellVariable):
           - `extensionVariable`: The variable to extend from the zero
             level set.
 
+        With a `narrowBandWidth`, only the cells within that distance of
+        the zero level set are changed
+
+        >>> from fipy.meshes import Grid1D
+        >>> mesh = Grid1D(nx=8)
+        >>> var = DistanceVariable(mesh=mesh, narrowBandWidth=1., value=mesh.x - 4.)
+        >>> extension = CellVariable(mesh=mesh, value=numerix.arange(8.))
+        >>> var.extendVariable(extension)
+        >>> print extension
+        [ 0.  1.  2.  4.  4.  5.  6.  7.]
+
         """
 
+        if not self._useLSMLibrary():
+            extensionVariable[:] = self._getMarcher().extend(self._value, extensionVariable.value,
+                                                             order=order, narrow=self.narrowBandWidth)
+            return
+
         dx, shape = self.getLSMshape()
         extensionValue = numerix.reshape(extensionVariable.value, shape)
         phi = numerix.reshape(self._value, shape)
@@ -295,8 +350,11 @@ class DistanceVariable(CellVariable):
         else:
             raise Exception, "Neither `lsmlib` nor `skfmm` can be found on the $PATH"
 
-        tmp, extensionValue = extension_velocities(phi, extensionValue, ext_mask=phi < 0., dx=dx, order=order)
-        extensionVariable[:] = extensionValue.flatten()
+        distance, extended = extension_velocities(phi, extensionValue, ext_mask=phi < 0., dx=dx, order=order)
+        if self.narrowBandWidth is not None:
+            extended = numerix.where(abs(distance) > self.narrowBandWidth,
+                                     extensionValue, extended)
+        extensionVariable[:] = extended.flatten()
 
     def getLSMshape(self):
         mesh = self.mesh
@@ -314,16 +372,42 @@ class DistanceVariable(CellVariable):
 
         return dx, shape
 
+    def _useLSMLibrary(self):
+        """Whether `lsmlib` or `skfmm` can be used on this mesh, rather
+        than the native `_FastMarcher`, which works on any mesh.
+        """
+        mesh = self.mesh
+        return (LSM_SOLVER in ('lsmlib', 'skfmm')
+                and hasattr(mesh, 'nx') and not hasattr(mesh, 'nz'))
+
+    def _getMarcher(self):
+        if self._marcher is None:
+            from fipy.tools.fastMarching import _FastMarcher
+            self._marcher = _FastMarcher(self.mesh)
+        return self._marcher
+
     def calcDistanceFunction(self, order=2):
         """
         Calculates the `distanceVariable` as a distance function.
 
+        With a `narrowBandWidth`, the cells further than that from the zero
+        level set are set to plus or minus `narrowBandWidth`.
+
         :Parameters:
           - `order`: The order of accuracy for the distance funtion
             calculation, either 1 or 2.
 
         """
 
+        self._order = order
+        self._value = self._calcDistance(self._value, order=order)
+        self._markFresh()
+        self._updateNarrowBand(self._value)
+
+    def _calcDistance(self, phi, order):
+        if not self._useLSMLibrary():
+            return self._getMarcher().distance(phi, order=order, narrow=self.narrowBandWidth)
+
         dx, shape = self.getLSMshape()
 
         if LSM_SOLVER == 'lsmlib':
@@ -333,8 +417,74 @@ class DistanceVariable(CellVariable):
         else:
             raise Exception, "Neither `lsmlib` nor `skfmm` can be found on the $PATH"
 
-        self._value = distance(numerix.reshape(self._value, shape), dx=dx, order=order).flatten()
-        self._markFresh()
+        value = distance(numerix.reshape(phi, shape), dx=dx, order=order).flatten()
+        if self.narrowBandWidth is not None:
+            value = numerix.clip(value, -self.narrowBandWidth, self.narrowBandWidth)
+        return value
+
+    def _updateNarrowBand(self, phi):
+        if self.narrowBandWidth is not None:
+            inside = abs(phi) < self.narrowBandWidth
+            cellToCellIDs = MA.filled(self.mesh._cellToCellIDs, -1)
+            adjacentInside = numerix.take(inside, numerix.where(cellToCellIDs >= 0, cellToCellIDs, 0))
+            edge = inside & ((cellToCellIDs >= 0) & ~adjacentInside).any(0)
+            self._narrowBand = numerix.nonzero(inside)[0]
+            self._narrowBandEdge = numerix.nonzero(edge)[0]
+
+    @property
+    def narrowBand(self):
+        """
+        IDs of the cells within `narrowBandWidth` of the zero level set,
+        or `None` if there is no `narrowBandWidth`.
+
+        >>> from fipy.meshes import Grid1D
+        >>> var = DistanceVariable(mesh=Grid1D(nx=8), narrowBandWidth=2., hasOld=True,
+        ...                        value=(-1., -1., -1., -1., 1., 1., 1., 1.))
+        >>> var.calcDistanceFunction() #doctest: +LSM
+        >>> print var #doctest: +LSM
+        [-2.  -2.  -1.5 -0.5  0.5  1.5  2.   2. ]
+        >>> print var.narrowBand #doctest: +LSM
+        [2 3 4 5]
+
+        Once the zero level set has come within half of `narrowBandWidth`
+        of the edge of the band, `updateOld()` reinitializes the distance
+        function and rebuilds the band
+
+        >>> var.value = var.value - 1.
+        >>> var.updateOld() #doctest: +LSM
+        >>> print var.narrowBand #doctest: +LSM
+        [3 4 5 6]
+        >>> print var.old #doctest: +LSM
+        [-2.  -2.  -2.  -1.5 -0.5  0.5  1.5  2. ]
+
+        The width survives pickling
+
+        >>> from fipy.tools import dump
+        >>> (f, filename) = dump.write(var, extension='.gz')
+        >>> print dump.read(filename, f).narrowBandWidth
+        2.0
+        """
+        if self.narrowBandWidth is None:
+            return None
+        if self._narrowBand is None:
+            self._updateNarrowBand(self.value)
+        return self._narrowBand
+
+    def _narrowBandIsStale(self):
+        if self.narrowBandWidth is None:
+            return False
+        return (self._narrowBand is None
+                or (abs(numerix.take(self.value, self._narrowBandEdge)) < self.narrowBandWidth / 2.).any())
+
+    def updateOld(self):
+        """
+        Set the values of the previous solution sweep to the current
+        values, after reinitializing the distance function if the zero
+        level set has come close to the edge of the narrow band.
+        """
+        if self._narrowBandIsStale():
+            self.calcDistanceFunction(order=self._order)
+        CellVariable.updateOld(self)
 
     @property
     def cellInterfaceAreas(self):
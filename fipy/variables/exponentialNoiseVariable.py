@@ -34,7 +34,7 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
+from fipy.tools import counterRandom
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["ExponentialNoiseVariable"]
@@ -114,8 +114,8 @@ class ExponentialNoiseVariable(NoiseVariable):
         self.mean = self._requires(mean)
 
     def random(self):
-        return random.exponential(scale = self.mean,
-                                  size = [self.mesh.globalNumberOfCells])
+        return counterRandom.exponential(self._seed, self._step, self.mesh._globalOverlappingCellIDs,
+                                         scale=self.mean.value)
 
 def _test():
     import fipy.tests.doctestPlus
@@ -34,7 +34,7 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
+from fipy.tools import counterRandom
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GammaNoiseVariable"]
@@ -122,8 +122,8 @@ class GammaNoiseVariable(NoiseVariable):
         self.rate = self._requires(rate)
 
     def random(self):
-        return random.gamma(shape=self.shapeParam, scale=self.rate,
-                            size=[self.mesh.globalNumberOfCells])
+        return counterRandom.gamma(self._seed, self._step, self.mesh._globalOverlappingCellIDs,
+                                   shape=self.shapeParam.value, scale=self.rate.value)
 
 def _test():
     import fipy.tests.doctestPlus
@@ -36,7 +36,8 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random, sqrt
+from fipy.tools import counterRandom
+from fipy.tools.numerix import sqrt
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GaussianNoiseVariable"]
@@ -149,18 +150,14 @@ class GaussianNoiseVariable(NoiseVariable):
         self.variance = variance
         NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
 
-    def parallelRandom(self):
-
-        if hasattr(self.variance, 'globalValue'):
-            variance = self.variance.globalValue
+    def random(self):
+        if hasattr(self.variance, 'value'):
+            variance = self.variance.value
         else:
             variance = self.variance
 
-        if self.mesh.communicator.procID == 0:
-            return random.normal(self.mean, sqrt(variance),
-                                 size = [self.mesh.globalNumberOfCells])
-        else:
-            return None
+        return counterRandom.normal(self._seed, self._step, self.mesh._globalOverlappingCellIDs,
+                                    loc=self.mean, scale=sqrt(variance))
 
 def _test():
     import fipy.tests.doctestPlus
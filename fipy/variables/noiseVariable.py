@@ -34,6 +34,7 @@
 
 __docformat__ = 'restructuredtext'
 
+from fipy.tools.numerix import random
 from fipy.variables.cellVariable import CellVariable
 
 __all__ = ["NoiseVariable"]
@@ -48,15 +49,45 @@ class NoiseVariable(CellVariable):
 
         <Specific>NoiseVariable(...).faceGrad.divergence
 
-    The `seed()` and `get_seed()` functions of the
-    `fipy.tools.numerix.random` module can be set and query the random
-    number generated used by all `NoiseVariable` objects.
+    The noise is drawn from a counter-based generator, keyed by a seed,
+    the number of calls to `scramble()` and the global ID of each cell, so
+    that every processor generates only its own cells, with no
+    communication, and the noise does not depend on the number of
+    processors. The seed of each `NoiseVariable` is drawn from the
+    `fipy.tools.numerix.random` module when it is created, so seeding that
+    module with its `seed()` function makes the noise reproducible.
+
+    >>> from fipy import numerix
+    >>> from fipy.meshes import Grid1D
+    >>> from fipy.variables.uniformNoiseVariable import UniformNoiseVariable
+    >>> mesh = Grid1D(nx=10)
+    >>> numerix.random.seed(11)
+    >>> noise = UniformNoiseVariable(mesh=mesh)
+    >>> first = noise.copy()
+    >>> noise.scramble()
+    >>> print numerix.allclose(noise, first)
+    False
+    >>> numerix.random.seed(11)
+    >>> print numerix.allclose(UniformNoiseVariable(mesh=mesh), first)
+    True
+
+    The noise of a cell is the same on any partition of the mesh
+
+    >>> from fipy.tools import serialComm
+    >>> numerix.random.seed(11)
+    >>> print numerix.allclose(UniformNoiseVariable(mesh=Grid1D(nx=10, communicator=serialComm)).globalValue,
+    ...                        first.globalValue)
+    True
     """
     def __init__(self, mesh, name = '', hasOld = 0):
         if self.__class__ is NoiseVariable:
             raise NotImplementedError, "can't instantiate abstract base class"
 
         CellVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        # `randint` only takes a `dtype` from NumPy 1.11
+        seed = (random.random((2,)) * 2**32).astype('uint32')
+        self._seed = tuple(mesh.communicator.bcast(seed, root=0))
+        self._step = 0
         self.scramble()
 
     def copy(self):
@@ -72,26 +103,15 @@ class NoiseVariable(CellVariable):
         """
         Generate a new random distribution.
         """
+        self._step += 1
         self._markStale()
 
     def random(self):
+        """
+        Random values for the local cells of the mesh, as a function of
+        `_seed`, `_step` and `_globalOverlappingCellIDs` only.
+        """
         pass
 
-    def parallelRandom(self):
-
-        if self.mesh.communicator.procID == 0:
-            return self.random()
-        else:
-            return None
-
     def _calcValue(self):
-        from fipy.tools import parallelComm
-
-        rnd = self.parallelRandom()
-
-        if parallelComm.Nproc > 1:
-            rnd = parallelComm.bcast(rnd, root=0)
-
-            return rnd[self.mesh._globalOverlappingCellIDs]
-        else:
-            return rnd
+        return self.random()
@@ -75,11 +75,90 @@ def _OperatorVariableClass(baseClass=object):
                 if inline.doInline:
                     return self._execInline(comment=self.comment)
                 else:
-                    return self._calcValue_()
+                    value, owned = self._calcFusedValue()
+                    return value
 
         def _calcValue_(self):
             pass
 
+        def _calcFusedValue(self):
+            """Evaluate the expression tree rooted here in a single pass
+
+            Uncached element-wise operators below this one are evaluated
+            directly, rather than through their `value`, and the temporary
+            array produced by one operator is reused as the output of the
+            next, so a chain like `D * phi**2 + eps` allocates one array
+            instead of three.
+
+            Returns the value and whether it is a temporary that the caller
+            may overwrite.
+
+            If the values turn out not to be fusible (e.g., integers), the
+            operator is applied to the values already found, so that no
+            operand below is evaluated twice; otherwise a chain of `n`
+            operators would take `2**n` evaluations
+
+                >>> from fipy.meshes import Grid1D
+                >>> from fipy.variables.cellVariable import CellVariable
+                >>> class _CountedVariable(CellVariable):
+                ...     reads = 0
+                ...     def _countedValue(self):
+                ...         _CountedVariable.reads += 1
+                ...         return self._getValue()
+                ...     value = property(_countedValue)
+                >>> leaf = _CountedVariable(mesh=Grid1D(nx=3), value=numerix.array((1, 2, 3)))
+                >>> e = leaf
+                >>> for level in range(16):
+                ...     e = e + 1
+                >>> print e.value, e.value.dtype.kind
+                [17 18 19] i
+                >>> _CountedVariable.reads = 0
+                >>> print e.value
+                [17 18 19]
+                >>> print _CountedVariable.reads
+                1
+            """
+            ufunc, order = _fusibleUfunc(self.op, len(self.var))
+            if ufunc is None:
+                return self._calcValue_(), False
+
+            values = []
+            temporaries = []
+            for var in self.var:
+                if (hasattr(var, "_calcFusedValue") and var.canInline
+                    and not var._isCached() and len(var.constraints) == 0):
+                    value, owned = var._calcFusedValue()
+                    # as for `_getCstring()`, discard any value left over
+                    # from when `var` was cached
+                    var._value = None
+                    var._markFresh()
+                    if owned:
+                        temporaries.append(value)
+                else:
+                    value = var.value
+                values.append(value)
+
+            arguments = values
+            values = [values[i] for i in order]
+
+            if not _fusible(values):
+                return self.op(*arguments), False
+
+            dtype = numerix.result_type(*values)
+            shape = numerix.broadcast(*values).shape
+            out = None
+            for temporary in temporaries:
+                if temporary.dtype == dtype and temporary.shape == shape:
+                    out = temporary
+                    break
+
+            if out is None:
+                value = _applyUfunc(ufunc, values)
+            else:
+                value = _applyUfunc(ufunc, values, out=out)
+
+            return value, type(value) is numerix.ndarray
+
         def _isCached(self):
             return (Variable._isCached(self)
                     or (len(self.subscribedVariables) > 1 and not self._cacheNever))
@@ -242,6 +321,111 @@ def _OperatorVariableClass(baseClass=object):
 
     return _OperatorVariable
 
+_fusibleOperators = [
+    (lambda a,b: a+b, numerix.add, (0, 1)),
+    (lambda a,b: a-b, numerix.subtract, (0, 1)),
+    (lambda a,b: b-a, numerix.subtract, (1, 0)),
+    (lambda a,b: a*b, numerix.multiply, (0, 1)),
+    (lambda a,b: a/b, numerix.divide, (0, 1)),
+    (lambda a,b: b/a, numerix.divide, (1, 0)),
+    (lambda a,b: pow(a,b), numerix.power, (0, 1)),
+    (lambda a,b: pow(b,a), numerix.power, (1, 0)),
+    (lambda a: -a, numerix.negative, (0,)),
+    (lambda a: numerix.fabs(a), numerix.fabs, (0,))
+]
+
+def _fusibleUfunc(op, nargs):
+    """Find the ufunc, and the order of its arguments, that `op` applies
+
+    `op` is either a ufunc or one of the `lambda` functions that
+    :class:`~fipy.variables.variable.Variable` uses for its arithmetic
+    operators, which are recognized by their byte code.
+
+        >>> print _fusibleUfunc(lambda x,y: x*y, 2)
+        (<ufunc 'multiply'>, (0, 1))
+        >>> print _fusibleUfunc(lambda x,y: y-x, 2)
+        (<ufunc 'subtract'>, (1, 0))
+        >>> print _fusibleUfunc(numerix.sin, 1)
+        (<ufunc 'sin'>, (0,))
+        >>> print _fusibleUfunc(numerix.greater, 2)
+        (None, None)
+        >>> print _fusibleUfunc(lambda x: x[0], 1)
+        (None, None)
+    """
+    if isinstance(op, numerix.ufunc):
+        if op.nin == nargs and op.nout == 1 and op.__name__ not in _nonFusibleUfuncs:
+            return op, tuple(range(nargs))
+    elif hasattr(op, "func_code"):
+        code = op.func_code
+        for (reference, ufunc, order) in _fusibleOperators:
+            ref = reference.func_code
+            if (len(order) == nargs
+                and code.co_code == ref.co_code
+                and code.co_names == ref.co_names
+                and code.co_consts == ref.co_consts):
+                return ufunc, order
+
+    return None, None
+
+# ufuncs whose result type does not follow the type of their arguments
+_nonFusibleUfuncs = ["equal", "not_equal", "less", "less_equal", "greater", "greater_equal",
+                     "logical_and", "logical_or", "logical_xor", "logical_not",
+                     "isnan", "isinf", "isfinite", "signbit", "frexp", "modf"]
+
+def _fusible(values):
+    """Whether `values` are all floating point arrays or numeric scalars
+
+    Masked arrays, `PhysicalField` objects and integer arrays take the
+    usual path.
+    """
+    for value in values:
+        if not (type(value) is numerix.ndarray
+                or isinstance(value, (int, long, float, numerix.generic))):
+            return False
+        kind = numerix.asarray(value).dtype.kind
+        if numerix.shape(value) == ():
+            if kind not in 'iuf':
+                return False
+        elif kind != 'f':
+            return False
+    return True
+
+def _positive(a, *out):
+    # `numerix.positive` needs NumPy 1.13
+    return numerix.multiply(a, 1., *out)
+
+# scalar exponents that `ndarray.__pow__` evaluates with a cheaper ufunc
+_specialPowers = {
+    2.: numerix.square,
+    0.5: numerix.sqrt,
+    -1.: numerix.reciprocal,
+    1.: _positive
+}
+
+def _applyUfunc(ufunc, values, out=None):
+    """Apply `ufunc` to `values`, optionally writing the result to `out`
+
+    `ndarray.__pow__` treats some scalar exponents specially, so
+    `numerix.power` does the same, to give identical results.
+
+        >>> a = numerix.array((1., 2., 3.))
+        >>> print _applyUfunc(numerix.power, [a, 2.], out=a)
+        [ 1.  4.  9.]
+        >>> print a
+        [ 1.  4.  9.]
+    """
+    if out is None:
+        args = values
+    else:
+        args = values + [out]
+
+    if ufunc is numerix.power and numerix.shape(values[1]) == ():
+        exponent = float(values[1])
+        if exponent in _specialPowers and numerix.shape(values[0]) != ():
+            return _specialPowers[exponent](*([values[0]] + args[2:]))
+
+    return ufunc(*args)
+
 def _testBinOp(self):
     """
     Test of _getRepresentation
@@ -324,6 +508,27 @@ def _testBinOp(self):
         >>> print binOp.value
         0.5
 
+    Chains of element-wise operators are evaluated in a single pass, with
+    each intermediate result written into the temporary array of the one
+    before it.
+
+        >>> D = Variable((1., 2., 3.))
+        >>> phi = Variable((4., 5., 6.))
+        >>> expr = -(D * phi**2 + 0.5) / 2
+        >>> value, owned = expr._calcFusedValue()
+        >>> print value, owned
+        [ -8.25 -25.25 -54.25] True
+        >>> print expr
+        [ -8.25 -25.25 -54.25]
+        >>> D.value = (0., 1., 2.)
+        >>> print expr
+        [ -0.25 -12.75 -36.25]
+
+    Operands that are not plain floating point arrays take the usual path.
+
+        >>> print (Variable((1, 2, 3)) * 2 + 1)._calcFusedValue()
+        (array([3, 5, 7]), False)
+
         >>> from fipy.variables.cellVariable import CellVariable
         >>> from fipy.variables.faceVariable import FaceVariable
 
@@ -51,6 +51,7 @@ def _suite():
             'fipy.variables.exponentialNoiseVariable',
             'fipy.variables.gammaNoiseVariable',
             'fipy.variables.gaussianNoiseVariable',
+            'fipy.variables.noiseVariable',
             'fipy.variables.uniformNoiseVariable',
             'fipy.variables.cellVolumeAverageVariable',
             'fipy.variables.modularVariable',
@@ -34,7 +34,7 @@
 
 __docformat__ = 'restructuredtext'
 
-from fipy.tools.numerix import random
+from fipy.tools import counterRandom
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["UniformNoiseVariable"]
@@ -87,8 +87,8 @@ class UniformNoiseVariable(NoiseVariable):
         NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
 
     def random(self):
-        return random.uniform(self.minimum, self.maximum,
-                              size=[self.mesh.globalNumberOfCells])
+        return counterRandom.uniform(self._seed, self._step, self.mesh._globalOverlappingCellIDs,
+                                     low=self.minimum, high=self.maximum)
 
 def _test():
     import fipy.tests.doctestPlus
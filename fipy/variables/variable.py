@@ -40,6 +40,7 @@ from fipy.tools.dimensions import physicalField
 from fipy.tools import numerix
 from fipy.tools import parser
 from fipy.tools import inline
+from fipy.tools import profiling
 
 __all__ = ["Variable"]
 
@@ -509,7 +510,8 @@ class Variable(object):
         """
 
         if self.stale or not self._isCached() or self._value is None:
-            value = self._calcValue()
+            with profiling._phase("evaluate", self.__class__.__name__, outermost=True):
+                value = self._calcValue()
             if self._isCached():
                 self._setValueInternal(value=value)
             else: